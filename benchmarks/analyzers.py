@@ -0,0 +1,104 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark the per bar overhead of the analyzer profiles.
+
+The cheap strategy flipping the positions periodically runs over the
+synthetic market with every profile and every single analyzer, so the
+cost of the strategy decision does not hide the one of the analyzers, the
+overhead excludes the run without any analyzer, for example
+
+    python -m benchmarks.analyzers --varieties 1 --years 20
+"""
+
+import argparse
+import time
+
+import backtrader as bt
+
+from greenturtle.backtesting import backtesting
+from greenturtle.data import synthetic
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+
+class FlipStrategy(bt.Strategy):
+    """strategy which flips the position of every data periodically."""
+
+    params = (("period", 20),)
+
+    def next(self):
+        if len(self) % self.p.period != 0:
+            return
+
+        for data in self.datas:
+            size = self.getposition(data).size
+            self.order_target_size(data, -1 if size > 0 else 1)
+
+
+def run(market, profile):
+    """run the backtesting with the profile and return the seconds."""
+    varieties = market.get_varieties()
+    b = backtesting.BackTesting(cash=100000000,
+                                varieties=varieties,
+                                profile=profile)
+    for name in market.names:
+        b.add_data(market.get_feed(name), name)
+        b.set_default_commission_by_name(name)
+    b.add_strategy(FlipStrategy)
+
+    start = time.perf_counter()
+    result = b.run()
+    b.analysis(result)
+    return time.perf_counter() - start
+
+
+def main():
+    """main function"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--varieties", type=int, default=1)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    logger.disabled = True
+    market = synthetic.SyntheticMarket(n_varieties=args.varieties,
+                                       years=args.years,
+                                       bad_print_ratio=0)
+    bars = len(market.get_arrays(market.names[0])["close"])
+    print(f"varieties: {args.varieties}, bars: {bars}")
+
+    profiles = {"none": []}
+    profiles.update(backtesting.PROFILES)
+    profiles.update({name: [name] for name in backtesting.ANALYZERS})
+
+    # interleave the repeats so the drift of the machine affects all
+    seconds = {name: float("inf") for name in profiles}
+    for _ in range(args.repeat):
+        for name, profile in profiles.items():
+            seconds[name] = min(seconds[name], run(market, profile))
+
+    print(f"none per bar: {seconds['none'] / bars * 1e6:.1f} us")
+    for name in profiles:
+        if name != "none":
+            overhead = (seconds[name] - seconds["none"]) / bars
+            print(f"{name} per bar: {overhead * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Compare the benchmark results saved by benchmarks.suite, for example
+
+    python -m benchmarks.compare baseline.json current.json --threshold 0.1
+
+the case slower than the baseline by more than the threshold is flagged as
+the regression, and it exits with 1 if there is any regression.
+"""
+
+import argparse
+import json
+import sys
+
+
+OK = "ok"
+REGRESSION = "regression"
+IMPROVEMENT = "improvement"
+NEW = "new"
+MISSING = "missing"
+
+
+def load_seconds(path):
+    """load the seconds by case from the result file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["seconds"]
+
+
+def get_status(change, threshold):
+    """get the status by the relative change of the seconds."""
+    if change > threshold:
+        return REGRESSION
+    if change < -threshold:
+        return IMPROVEMENT
+    return OK
+
+
+def compare(baseline, current, threshold=0.1):
+    """
+    compare the seconds by case, return the rows of the case, baseline and
+    current seconds, the relative change and the status.
+    """
+    rows = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current:
+            rows.append((name, baseline[name], None, None, MISSING))
+            continue
+        if name not in baseline:
+            rows.append((name, None, current[name], None, NEW))
+            continue
+
+        change = current[name] / baseline[name] - 1
+        rows.append((name,
+                     baseline[name],
+                     current[name],
+                     change,
+                     get_status(change, threshold)))
+
+    return rows
+
+
+def format_seconds(seconds):
+    """format the seconds in ms."""
+    return "-" if seconds is None else f"{seconds * 1e3:.3f}"
+
+
+def main():
+    """main function"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline", type=str)
+    parser.add_argument("current", type=str)
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative slowdown flagged as regression")
+    args = parser.parse_args()
+
+    rows = compare(load_seconds(args.baseline),
+                   load_seconds(args.current),
+                   args.threshold)
+
+    print(f"{'case':<24}{'baseline ms':>14}{'current ms':>14}"
+          f"{'change':>10}  status")
+    for name, base, cur, change, status in rows:
+        change = "-" if change is None else f"{change * 100:+.1f}%"
+        print(f"{name:<24}{format_seconds(base):>14}"
+              f"{format_seconds(cur):>14}{change:>10}  {status}")
+
+    regressions = [row[0] for row in rows if row[4] == REGRESSION]
+    if regressions:
+        print(f"regressions beyond {args.threshold * 100:.0f}%: "
+              f"{', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
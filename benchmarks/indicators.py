@@ -0,0 +1,126 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark the kernel adapters against the backtrader built-in indicators.
+
+Every run computes the ema, atr, highest and lowest of all the varieties of
+the synthetic market in the runonce and the next mode, the cost of the
+indicators excludes the one of the run without any indicator, for example
+
+    python -m benchmarks.indicators --varieties 20 --years 10
+"""
+
+import argparse
+import time
+
+import backtrader as bt
+
+from greenturtle.data import synthetic
+from greenturtle.indicators import adapters
+from greenturtle.indicators import kernels
+
+
+NONE = "none"
+BUILTIN = "builtin"
+ADAPTER = "adapter"
+
+INDICATORS = {
+    NONE: (),
+    BUILTIN: (bt.indicators.MovAv.Exponential,
+              bt.indicators.ATR,
+              bt.indicators.Highest,
+              bt.indicators.Lowest),
+    ADAPTER: (adapters.EMA,
+              adapters.ATR,
+              adapters.Highest,
+              adapters.Lowest),
+}
+
+
+class IndicatorStrategy(bt.Strategy):
+    """strategy which only holds the indicators of all the datas."""
+
+    params = (("kind", BUILTIN), ("period", 50))
+
+    def __init__(self):
+        super().__init__()
+        self.indicators = []
+        if self.p.kind == NONE:
+            return
+
+        ema, atr, highest, lowest = INDICATORS[self.p.kind]
+        for data in self.datas:
+            self.indicators.extend([
+                ema(data, period=self.p.period),
+                atr(data, period=self.p.period),
+                highest(data.high, period=self.p.period),
+                lowest(data.low, period=self.p.period),
+            ])
+
+
+def run_cerebro(market, kind, runonce):
+    """run the indicators by cerebro and return the seconds."""
+    cerebro = bt.Cerebro()
+    for name in market.names:
+        cerebro.adddata(market.get_feed(name), name=name)
+    cerebro.addstrategy(IndicatorStrategy, kind=kind)
+
+    start = time.perf_counter()
+    cerebro.run(runonce=runonce, stdstats=False)
+    return time.perf_counter() - start
+
+
+def run_kernels(market, period=50):
+    """run the kernels over the arrays of all the varieties."""
+    arrays = [market.get_arrays(name) for name in market.names]
+
+    start = time.perf_counter()
+    for a in arrays:
+        kernels.ema(a["close"], period)
+        kernels.atr(a["high"], a["low"], a["close"], period)
+        kernels.highest(a["high"], period)
+        kernels.lowest(a["low"], period)
+    return time.perf_counter() - start
+
+
+def main():
+    """main function"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--varieties", type=int, default=20)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    market = synthetic.SyntheticMarket(n_varieties=args.varieties,
+                                       years=args.years,
+                                       bad_print_ratio=0)
+    print(f"varieties: {args.varieties}, years: {args.years}")
+
+    for runonce in (True, False):
+        mode = "runonce" if runonce else "next"
+        seconds = {kind: min(run_cerebro(market, kind, runonce)
+                             for _ in range(args.repeat))
+                   for kind in INDICATORS}
+        for kind in (BUILTIN, ADAPTER):
+            cost = seconds[kind] - seconds[NONE]
+            print(f"{mode} {kind}: {cost * 1e3:.1f} ms")
+
+    best = min(run_kernels(market) for _ in range(args.repeat))
+    print(f"kernels only: {best * 1e3:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
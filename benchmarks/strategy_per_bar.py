@@ -0,0 +1,123 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark the per bar cost of the strategy decision with many varieties.
+
+The market is generated by the synthetic generator, so it runs offline,
+for example
+
+    python -m benchmarks.strategy_per_bar --varieties 60 --years 3
+"""
+
+import argparse
+import time
+
+from greenturtle.backtesting import backtesting
+from greenturtle.data import synthetic
+from greenturtle.stragety import ema
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+
+class TimedEMA(ema.EMA):
+    """
+    EMA strategy which measures the time of every next, the position
+    classification and the group adjustment.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.seconds = {"next": 0.0, "positions": 0.0, "group": 0.0}
+        self.bars = 0
+
+    def classify_positions(self):
+        """classify the positions in the same way as next."""
+        if hasattr(self, "get_position_snapshot"):
+            return self.get_position_snapshot()
+
+        # the versions before the position snapshot
+        return (self.get_hold_symbols(),
+                self.get_long_symbols_within_hold(),
+                self.get_short_symbols_within_hold(),
+                self.get_current_portfolios())
+
+    def adjust_portfolio_by_group(self,
+                                  desired_portfolios,
+                                  current_portfolios):
+        start = time.perf_counter()
+        result = super().adjust_portfolio_by_group(desired_portfolios,
+                                                   current_portfolios)
+        self.seconds["group"] += time.perf_counter() - start
+        return result
+
+    def next(self):
+        start = time.perf_counter()
+        self.classify_positions()
+        self.seconds["positions"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        super().next()
+        self.seconds["next"] += time.perf_counter() - start
+        self.bars += 1
+
+
+def run(n_varieties, years, seed):
+    """run the backtesting and return the per bar seconds."""
+    market = synthetic.SyntheticMarket(n_varieties=n_varieties,
+                                       years=years,
+                                       seed=seed,
+                                       bad_print_ratio=0)
+    varieties = market.get_varieties()
+    group_risk_factors = {group: 0.02 for group in varieties}
+
+    b = backtesting.BackTesting(cash=100000000, varieties=varieties)
+    for name in market.names:
+        b.add_data(market.get_feed(name), name)
+        b.set_default_commission_by_name(name)
+    b.add_strategy(TimedEMA,
+                   varieties=varieties,
+                   group_risk_factors=group_risk_factors,
+                   risk_factor=0.002,
+                   allow_short=True)
+
+    strategy = b.run()[0]
+    bars = max(strategy.bars, 1)
+    return {k: v / bars for k, v in strategy.seconds.items()}, bars
+
+
+def main():
+    """main function"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--varieties", type=int, default=60)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logger.disabled = True
+    results = [run(args.varieties, args.years, args.seed)
+               for _ in range(args.repeat)]
+
+    print(f"varieties: {args.varieties}, bars: {results[0][1]}")
+    for key in results[0][0]:
+        best = min(r[0][key] for r in results)
+        print(f"{key} per bar: {best * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark suite of the hot paths with the results saved as json.
+
+Every case runs offline over the synthetic market and the embedded sqlite
+database, and the best seconds of the repeats is recorded, for example
+
+    python -m benchmarks.suite --output current.json
+    python -m benchmarks.compare baseline.json current.json
+
+the cases are
+    feed_load: load the arrays of all the varieties from the database
+    padding: align and pad the arrays of all the varieties
+    strategy_next_N: the per bar cost of next with N varieties
+    continuous_contract: generate the continuous contracts
+    delta_sync_format: format the delta contracts
+    delta_sync_write: write the delta contracts to the database
+    correlation: compute the correlation of the daily returns
+    bootstrap: block bootstrap of 20 years of the daily returns
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+
+import munch
+import numpy as np
+import pandas as pd
+
+from benchmarks import strategy_per_bar
+from greenturtle.analyzers import bootstrap
+from greenturtle.analyzers import correlation
+from greenturtle.analyzers import summary
+from greenturtle.constants import types
+from greenturtle.constants import varieties
+from greenturtle.data import alignment
+from greenturtle.data import synthetic
+from greenturtle.data.datafeed import array
+from greenturtle.data.datafeed import db
+from greenturtle.data.deltasyncer import delta_syncer
+from greenturtle.data.preprocess import continuous_contract
+from greenturtle.db import api
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+STRATEGY_VARIETIES = (10, 30, 60)
+
+
+def get_db_conf(path):
+    """get the config of the sqlite database."""
+    return munch.Munch(drivername=api.SQLITE_DRIVERNAME, database=path)
+
+
+def create_db(path, market=None):
+    """create the database with the contracts of the market if given."""
+    db_conf = get_db_conf(path)
+    api.DBManager(db_conf).create_all()
+    dbapi = api.DBAPI(db_conf)
+    if market is not None:
+        market.write_to_db(dbapi)
+
+    return dbapi
+
+
+def generate_continuous_contracts(market, dbapi):
+    """generate the continuous contracts of all the varieties."""
+    for name in market.names:
+        continuous_contract.ContinuousContract(name,
+                                               market.source,
+                                               market.country,
+                                               dbapi).generate()
+
+
+def best_of(func, repeat, setup=None):
+    """
+    get the best seconds of func over the repeats, setup is called before
+    every repeat without timing and its result is passed to func.
+    """
+    best = None
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(state)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+
+    return best
+
+
+def get_delta_frames(market, days):
+    """
+    get the delta contracts of the last days in the format of akshare by
+    exchange, the synthetic varieties are renamed to the cn varieties and
+    spread over the exchanges.
+    """
+    cn_names = [name for group in varieties.CN_VARIETIES.values()
+                for name in group]
+
+    dfs = []
+    symbols_expire = {}
+    for name, variety in zip(market.names, cn_names):
+        df = market.get_contracts(name)
+        df = df[df[types.DATE] >= df[types.DATE].unique()[-days]].copy()
+
+        df["symbol"] = variety + df[types.NAME].str[len(name):]
+        df["turnover"] = df[types.CLOSE] * df[types.VOLUME]
+        df[types.VARIETY] = variety
+        symbols_expire.update(zip(df["symbol"], df[types.EXPIRE]))
+        df[types.DATE] = df[types.DATE].dt.strftime(types.DATE_FORMAT)
+        dfs.append(df.drop(columns=[types.NAME, types.EXPIRE, types.SOURCE,
+                                    types.COUNTRY, types.EXCHANGE,
+                                    types.GROUP]))
+
+    df = pd.concat(dfs, ignore_index=True)
+    positions = df[types.VARIETY].map(cn_names.index) % \
+        len(types.CN_EXCHANGES)
+    df_map = {exchange: df[positions == i]
+              for i, exchange in enumerate(types.CN_EXCHANGES)}
+
+    return df_map, symbols_expire
+
+
+def get_return_summaries(market):
+    """get the return summaries of the daily close returns."""
+    return_summaries = {}
+    for name in market.names:
+        df = array.arrays_2_dataframe(market.get_arrays(name))
+        returns = df[types.CLOSE].pct_change().dropna() * 100
+        return_summaries[name] = summary.ReturnSummary(
+            days_return=dict(zip(returns.index.to_pydatetime(), returns)))
+
+    return return_summaries
+
+
+def run_db_cases(market, repeat, days, tmp_dir):
+    """run the cases over the embedded database."""
+    results = {}
+
+    # the template database with the contracts only
+    template = os.path.join(tmp_dir, "contracts.db")
+    create_db(template, market).engine.dispose()
+
+    def copy_template():
+        path = os.path.join(tmp_dir, "continuous.db")
+        shutil.copyfile(template, path)
+        return api.DBAPI(get_db_conf(path))
+
+    results["continuous_contract"] = best_of(
+        lambda dbapi: generate_continuous_contracts(market, dbapi),
+        repeat,
+        setup=copy_template)
+
+    db_conf = get_db_conf(os.path.join(tmp_dir, "continuous.db"))
+    results["feed_load"] = best_of(
+        lambda _: db.get_arrays_by_variety_from_db(db_conf,
+                                                   market.names,
+                                                   market.source,
+                                                   market.country,
+                                                   market.start_date,
+                                                   market.end_date),
+        repeat)
+
+    conf = munch.Munch(source=types.AKSHARE, country=types.CN)
+    df_map, symbols_expire = get_delta_frames(market, days)
+    syncer = delta_syncer.DeltaSyncer(conf, None)
+    # pylint: disable=protected-access
+    results["delta_sync_format"] = best_of(
+        lambda _: syncer._format_contracts(types.CN_EXCHANGES,
+                                           df_map,
+                                           symbols_expire),
+        repeat)
+
+    contracts = syncer._format_contracts(types.CN_EXCHANGES,
+                                         df_map,
+                                         symbols_expire)
+
+    def new_syncer():
+        path = os.path.join(tmp_dir, "delta.db")
+        if os.path.exists(path):
+            os.remove(path)
+        return delta_syncer.DeltaSyncer(conf, create_db(path))
+
+    results["delta_sync_write"] = best_of(
+        lambda s: s._write_contracts_to_database(contracts),
+        repeat,
+        setup=new_syncer)
+
+    return results
+
+
+def run_cases(args):
+    """run all the cases and return the seconds by case."""
+    market = synthetic.SyntheticMarket(n_varieties=args.varieties,
+                                       years=args.years,
+                                       seed=args.seed,
+                                       bad_print_ratio=0)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results.update(run_db_cases(market, args.repeat, args.days, tmp_dir))
+
+    dfs = [array.arrays_2_dataframe(market.get_arrays(name))
+           for name in market.names]
+    trading_dates = market.get_trading_dates()
+    results["padding"] = best_of(
+        lambda _: [alignment.align_and_padding(df, trading_dates)
+                   for df in dfs],
+        args.repeat)
+
+    return_summaries = get_return_summaries(market)
+
+    def compute_correlation(_):
+        c = correlation.Correlation()
+        for name, return_summary in return_summaries.items():
+            c.add_return_summary(name, return_summary)
+        c.compute_correlation()
+
+    results["correlation"] = best_of(compute_correlation, args.repeat)
+
+    # the daily returns in percent of 20 years
+    returns = np.random.default_rng(args.seed).normal(0.04, 1.0, 20 * 252)
+    days_return = dict(enumerate(returns))
+    results["bootstrap"] = best_of(
+        lambda _: bootstrap.Bootstrap(
+            days_return, n_resamples=args.bootstrap_resamples).run(),
+        args.repeat)
+
+    for n_varieties in STRATEGY_VARIETIES:
+        per_bar = min(strategy_per_bar.run(n_varieties,
+                                           args.strategy_years,
+                                           args.seed)[0]["next"]
+                      for _ in range(args.repeat))
+        results[f"strategy_next_{n_varieties}"] = per_bar
+
+    return results
+
+
+def main():
+    """main function"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--varieties", type=int, default=10)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--strategy-years", type=int, default=2)
+    parser.add_argument("--days", type=int, default=20,
+                        help="days of the delta contracts")
+    parser.add_argument("--bootstrap-resamples", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=str, default="benchmark.json")
+    args = parser.parse_args()
+
+    logger.disabled = True
+    results = run_cases(args)
+
+    report = {
+        "created_at": datetime.datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "args": vars(args),
+        "seconds": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+    for name, seconds in results.items():
+        print(f"{name}: {seconds * 1e3:.3f} ms")
+    print(f"save the results to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -17,13 +17,10 @@
 
 import datetime
 
-import pandas as pd
-
-from greenturtle.analyzers import correlation
+from greenturtle.backtesting import batch
+from greenturtle.backtesting import runner
 from greenturtle.constants import types
 from greenturtle.constants import varieties
-from greenturtle.data.datafeed import db
-from greenturtle.backtesting import backtesting
 from greenturtle.stragety import ema
 from greenturtle.util.logging import logging
 from greenturtle.util import config
@@ -37,64 +34,28 @@ SKIP_LISTS = ["PS"]
 if __name__ == '__main__':
 
     conf = config.load_config("/etc/greenturtle/greenturtle.yaml")
-    corr = correlation.Correlation()
-    df = pd.DataFrame()
 
     start_date = datetime.datetime(2004, 1, 1)
-    end_date = x = datetime.datetime(2024, 12, 31)
-
-    for group in varieties.CN_VARIETIES.values():
-        for name in group:
-            if name in SKIP_LISTS:
-                continue
-
-            s = backtesting.BackTesting(varieties=varieties.CN_VARIETIES)
-            s.set_default_commission_by_name(name)
-            s.add_strategy(ema.EMA,
-                           risk_factor=0.02,
-                           varieties=varieties.CN_VARIETIES,
-                           allow_short=True)
-
-            # pylint: disable=R0801
-            data = db.ContinuousContractDB(db_conf=conf.db,
-                                           variety=name,
-                                           source=types.AKSHARE,
-                                           country=types.CN,
-                                           start_date=start_date,
-                                           end_date=end_date,
-                                           padding=True)
-            s.add_data(data, name)
-
-            # do backtesting
-            s.do_backtesting()
-
-            corr.add_return_summary(name, s.summary.return_summary)
-
-            # construct the result and append it to the dataframe
-            row = {
-                "name": [name],
-                "total_return": [
-                    s.summary.return_summary.total_return],
-                "annual_return": [
-                    s.summary.return_summary.annual_return],
-                "sharpe_ratio": [
-                    s.summary.sharpe_ratio_summary.sharpe_ratio],
-                "leverage": [
-                    s.summary.leverage_ratio_summary.leverage_ratio],
-                "max_draw_down": [
-                    s.summary.max_draw_down_summary.max_draw_down],
-            }
-
-            if s.summary.trade_summary is not None:
-                row["trader_number"] = [
-                    s.summary.trade_summary.trader_number]
-                row["win_trader_number"] = [
-                    s.summary.trade_summary.win_trader_number]
-
-            new_df = pd.DataFrame(row)
-            df = pd.concat([df, new_df])
+    end_date = datetime.datetime(2024, 12, 31)
+
+    names = [name for group in varieties.CN_VARIETIES.values()
+             for name in group if name not in SKIP_LISTS]
+    jobs = [(ema.EMA, {}, [name]) for name in names]
+
+    b = batch.BatchBackTesting(
+        jobs,
+        runner.load_arrays_from_db,
+        loader_kwargs={"db_conf": conf.db,
+                       "names": names,
+                       "source": types.AKSHARE,
+                       "country": types.CN,
+                       "start_date": start_date,
+                       "end_date": end_date},
+        strategy_kwargs={"risk_factor": 0.02, "allow_short": True},
+        varieties=varieties.CN_VARIETIES)
+    df, return_summaries = b.run()
 
     logger.info("\n%s", df.to_string())
 
-    result = corr.compute_correlation()
+    result = batch.get_correlation(return_summaries).compute_correlation()
     logger.info("\n%s", result.to_string())
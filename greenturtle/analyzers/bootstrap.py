@@ -0,0 +1,209 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Bootstrap and Monte Carlo risk analysis of the daily returns.
+
+The daily returns of the return summary are resampled into thousands of
+paths with the same length, by the moving blocks to keep the short term
+autocorrelation and the volatility clustering, or by the independent days
+for the Monte Carlo. The max draw down, the CAGR and the sharpe ratio of
+every path give the distributions and their tail percentiles instead of
+the single path of the backtesting.
+
+The paths are computed in NumPy by the chunk of paths to bound the memory,
+which is about 16 * chunk_size * days bytes, and the chunks could run in
+the process pool. The chunks are seeded by the seed and the chunk number,
+so the result is the same with any number of processes. 10000 block
+resamples of 20 years take 1.4 seconds in one process, measured by the
+bootstrap case of benchmarks/suite.py.
+"""
+
+import multiprocessing
+
+import numpy as np
+
+from greenturtle.analyzers.summary import BaseSummary
+
+
+BLOCK = "block"
+MONTE_CARLO = "monte-carlo"
+METHODS = (BLOCK, MONTE_CARLO)
+
+DAYS_PER_YEAR = 252
+
+MAX_DRAW_DOWN = "max_draw_down"
+CAGR = "cagr"
+SHARPE_RATIO = "sharpe_ratio"
+METRICS = (MAX_DRAW_DOWN, CAGR, SHARPE_RATIO)
+
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+def get_returns(days_return):
+    """get the daily returns in fraction ordered by the day."""
+    return np.array([days_return[day] for day in sorted(days_return)],
+                    dtype=np.float64) / 100
+
+
+def get_block_indices(rng, n_days, n_paths, block_size):
+    """
+    get the indices of the moving block bootstrap, every path joins the
+    blocks of block_size days starting at random days.
+    """
+    block_size = min(block_size, n_days)
+    n_blocks = -(-n_days // block_size)
+    starts = rng.integers(0, n_days - block_size + 1,
+                          size=(n_paths, n_blocks, 1))
+    indices = starts + np.arange(block_size)
+    return indices.reshape(n_paths, -1)[:, :n_days]
+
+
+def get_monte_carlo_indices(rng, n_days, n_paths):
+    """get the indices of the independent days."""
+    return rng.integers(0, n_days, size=(n_paths, n_days))
+
+
+def compute_metrics(paths, risk_free_rate=0.0):
+    """
+    compute the max draw down and the CAGR in percent and the annualized
+    sharpe ratio of every path, the paths are the daily returns in fraction
+    with the shape of (n_paths, n_days).
+    """
+    n_days = paths.shape[1]
+    equity = np.cumprod(paths + 1, axis=1)
+
+    # the peak starts from the initial equity 1, the ratio of the equity to
+    # the peak is computed in place to bound the memory
+    ratio = np.maximum.accumulate(equity, axis=1)
+    np.maximum(ratio, 1, out=ratio)
+    np.divide(equity, ratio, out=ratio)
+    max_draw_down = (1 - ratio.min(axis=1)) * 100
+
+    cagr = (np.maximum(equity[:, -1], 0) **
+            (DAYS_PER_YEAR / n_days) - 1) * 100
+
+    # the risk free rate does not change the standard deviation
+    excess = paths.mean(axis=1) - risk_free_rate / DAYS_PER_YEAR
+    std = paths.std(axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe_ratio = np.where(std > 0, excess / std, np.nan) * \
+            np.sqrt(DAYS_PER_YEAR)
+
+    return {MAX_DRAW_DOWN: max_draw_down,
+            CAGR: cagr,
+            SHARPE_RATIO: sharpe_ratio}
+
+
+def resample_chunk(task):
+    """resample the paths of the chunk and compute their metrics."""
+    returns, method, block_size, n_paths, seed, risk_free_rate = task
+    rng = np.random.default_rng(seed)
+
+    if method == BLOCK:
+        indices = get_block_indices(rng, len(returns), n_paths, block_size)
+    else:
+        indices = get_monte_carlo_indices(rng, len(returns), n_paths)
+
+    return compute_metrics(returns[indices], risk_free_rate)
+
+
+class BootstrapSummary(BaseSummary):
+    """summary for the distributions of the bootstrap."""
+
+    def __init__(self, distributions, percentiles=PERCENTILES):
+        super().__init__()
+
+        self.distributions = distributions
+        self.percentiles = {
+            metric: dict(zip(percentiles,
+                             np.nanpercentile(values, percentiles)))
+            for metric, values in distributions.items()}
+
+    def get_percentile(self, metric, percentile):
+        """get the percentile of the metric distribution."""
+        return self.percentiles[metric][percentile]
+
+    def to_string(self):
+        """string of the percentiles."""
+
+        message = "********** bootstrap summary **********\n"
+        for metric, percentiles in self.percentiles.items():
+            values = ", ".join(f"p{p}: {v:.2f}"
+                               for p, v in percentiles.items())
+            message += f"{metric}: {values}\n"
+
+        return message
+
+
+# pylint: disable=too-many-instance-attributes
+class Bootstrap:
+    """bootstrap the daily returns into the distributions of the metrics."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self,
+                 days_return,
+                 method=BLOCK,
+                 n_resamples=10000,
+                 block_size=20,
+                 chunk_size=1000,
+                 processes=1,
+                 seed=0,
+                 risk_free_rate=0.0):
+        if method not in METHODS:
+            raise ValueError(f"bootstrap method {method} not supported")
+        if not days_return or len(days_return) < 2:
+            raise ValueError("bootstrap needs at least 2 daily returns")
+
+        self.returns = get_returns(days_return)
+        self.method = method
+        self.n_resamples = n_resamples
+        self.block_size = block_size
+        self.chunk_size = chunk_size
+        self.processes = processes
+        self.seed = seed
+        self.risk_free_rate = risk_free_rate
+
+    def get_tasks(self):
+        """get the tasks of the chunks, seeded by the chunk number."""
+        tasks = []
+        seeds = np.random.SeedSequence(self.seed)
+        n_chunks = -(-self.n_resamples // self.chunk_size)
+        for i, seed in enumerate(seeds.spawn(n_chunks)):
+            n_paths = min(self.chunk_size, self.n_resamples - i *
+                          self.chunk_size)
+            tasks.append((self.returns,
+                          self.method,
+                          self.block_size,
+                          n_paths,
+                          seed,
+                          self.risk_free_rate))
+
+        return tasks
+
+    def run(self):
+        """run the resamples and return the bootstrap summary."""
+        tasks = self.get_tasks()
+        if self.processes == 1:
+            chunks = [resample_chunk(task) for task in tasks]
+        else:
+            with multiprocessing.Pool(processes=self.processes) as pool:
+                chunks = pool.map(resample_chunk, tasks)
+
+        distributions = {
+            metric: np.concatenate([chunk[metric] for chunk in chunks])
+            for metric in METRICS}
+
+        return BootstrapSummary(distributions)
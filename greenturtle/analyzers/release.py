@@ -0,0 +1,37 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+analyzer to release the finished orders.
+
+The broker keeps every order in its order book and the strategy keeps every
+notified order for history, which is never read in backtesting but grows
+with the bars and the varieties, release them on every bar.
+"""
+
+from backtrader import Analyzer
+
+
+class ReleaseOrders(Analyzer):
+    """release the finished orders of the broker and the strategy."""
+
+    def next(self):
+        """drop the orders which are not alive any more."""
+        # pylint: disable=no-member
+        strategy = self.strategy
+        broker = strategy.broker
+        broker.orders = [order for order in broker.orders if order.alive()]
+        # pylint: disable=protected-access
+        strategy._orders.clear()
@@ -18,6 +18,19 @@
 import abc
 
 
+# the flat metrics of the summary
+METRICS = (
+    "total_return",
+    "annual_return",
+    "sharpe_ratio",
+    "max_draw_down",
+    "leverage_ratio",
+    "net",
+    "trade_number",
+    "won_trade_number",
+)
+
+
 class BaseSummary:
     """base summary class."""
     def __init__(self):
@@ -269,3 +282,30 @@ class Summary(BaseSummary):
             message = "\n" + message
 
         return message
+
+    def get_metrics(self):
+        """get the flat metrics of the summary, missing one is None."""
+        metrics = dict.fromkeys(METRICS)
+
+        if self.return_summary is not None:
+            metrics["total_return"] = self.return_summary.total_return
+            metrics["annual_return"] = self.return_summary.annual_return
+
+        if self.sharpe_ratio_summary is not None:
+            metrics["sharpe_ratio"] = self.sharpe_ratio_summary.sharpe_ratio
+
+        if self.max_draw_down_summary is not None:
+            metrics["max_draw_down"] = \
+                self.max_draw_down_summary.max_draw_down
+
+        if self.leverage_ratio_summary is not None:
+            metrics["leverage_ratio"] = \
+                self.leverage_ratio_summary.leverage_ratio
+
+        if self.trade_summary is not None:
+            metrics["net"] = self.trade_summary.net
+            metrics["trade_number"] = self.trade_summary.trader_number
+            metrics["won_trade_number"] = \
+                self.trade_summary.win_trader_number
+
+        return metrics
@@ -13,7 +13,31 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-"""Benchmark performance according to historical data."""
+"""
+Benchmark performance according to historical data.
+
+The analyzers are added by the profile, the analysis is skipped if its
+analyzer is absent. The per bar overhead of the profiles on one variety
+over the run without any analyzer, measured by benchmarks/analyzers.py,
+
+    full: 64 us, all the analyzers
+    lean: 29 us, Returns, DrawDown and SharpeRatio_A
+    returns-only: 21 us, Returns, YearsTimeReturn and DaysTimeReturn
+
+where the run without any analyzer costs 65 us per bar.
+
+In the memory bounded mode, the lines of the indicators and the strategy
+only keep the bars within the minimum period by the exactbars of backtrader,
+and the finished orders are released on every bar. The bars are loaded and
+computed one by one, the result is the same as the one with runonce
+disabled. The following are unavailable in the mode
+
+    AnnualReturn: it reads back the whole history of the data and the
+        broker observer when stopped, it is removed from the profile
+    observers: the standard broker, buysell and trades observers are not
+        added since they are only used by plot
+    plot: there is no history to plot, plot is disabled
+"""
 
 import math
 
@@ -22,63 +46,125 @@ from backtrader import analyzers
 from backtrader import comminfo
 
 from greenturtle.analyzers import position_pnl
+from greenturtle.analyzers import release
 from greenturtle.analyzers import summary
 from greenturtle.constants import types
 from greenturtle import exception
 from greenturtle.util.logging import logging
+from greenturtle.util import profiler
+from greenturtle.util import util
 
 
 logger = logging.get_logger()
 
+FULL = "full"
+LEAN = "lean"
+RETURNS_ONLY = "returns-only"
+
+# the analyzers by the name, with the class and the kwargs
+ANALYZERS = {
+    "AnnualReturn": (analyzers.AnnualReturn, {}),
+    "YearsTimeReturn": (analyzers.TimeReturn,
+                        {"timeframe": bt.TimeFrame.Years}),
+    "DaysTimeReturn": (analyzers.TimeReturn,
+                       {"timeframe": bt.TimeFrame.Days}),
+    "Returns": (analyzers.Returns, {"tann": 252}),
+    "DrawDown": (analyzers.DrawDown, {}),
+    "SharpeRatio_A": (analyzers.SharpeRatio_A, {}),
+    "TradeAnalyzer": (analyzers.TradeAnalyzer, {}),
+    "GrossLeverage": (analyzers.GrossLeverage, {}),
+    "PositionPNL": (position_pnl.PositionPNL, {}),
+}
+
+# the analyzer profiles, lean for the headline metrics of the sweep and
+# returns-only for the return summary of the correlation
+PROFILES = {
+    FULL: tuple(ANALYZERS),
+    LEAN: ("Returns", "DrawDown", "SharpeRatio_A"),
+    RETURNS_ONLY: ("Returns", "YearsTimeReturn", "DaysTimeReturn"),
+}
+
+# the analysis steps filling the summary by the analyzer they read
+ANALYSIS_STEPS = (
+    ("Returns", "analysis_return"),
+    ("PositionPNL", "analysis_positions_pnl"),
+    ("DrawDown", "analysis_max_draw_down"),
+    ("SharpeRatio_A", "analysis_sharpe_ratio"),
+    ("GrossLeverage", "analysis_leverage_ratio"),
+    ("TradeAnalyzer", "analysis_trade"),
+)
+
+# the analyzers which need the whole history, unavailable in memory bounded
+MEMORY_BOUNDED_UNAVAILABLE = ("AnnualReturn",)
+
+
+def get_analyzer_names(profile):
+    """get the analyzer names by the profile name or the list of names."""
+    if isinstance(profile, str):
+        if profile not in PROFILES:
+            raise exception.AnalyzerProfileNotSupportedError(
+                f"analyzer profile {profile} not supported")
+        return PROFILES[profile]
+
+    unknown = [name for name in profile if name not in ANALYZERS]
+    if unknown:
+        raise exception.AnalyzerProfileNotSupportedError(
+            f"analyzers {unknown} not supported")
+
+    return tuple(profile)
+
 
 # pylint: disable=too-many-instance-attributes
 class BackTesting:
 
     """Basic analysis class for backtrader."""
 
-    def __init__(self, cash=1000000, slippage=0, plot=False, varieties=None):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self,
+                 cash=1000000,
+                 slippage=0,
+                 plot=False,
+                 varieties=None,
+                 profile=FULL,
+                 memory_bounded=False,
+                 profiler_dir=None,
+                 trace_memory=False):
+
+        if memory_bounded and plot:
+            logger.warning("plot is unavailable in memory bounded mode")
+            plot = False
 
         self.plot = plot
         self.varieties = varieties
+        self.memory_bounded = memory_bounded
+        # the run and the analysis are profiled into the directory if set
+        self.profiler_dir = profiler_dir
+        self.trace_memory = trace_memory
+        # the peak memory of the process so far, not of the run alone
+        self.process_peak_memory = None
         self.summary = summary.Summary()
         self.cerebro = bt.Cerebro()
         self.set_broker(slippage, cash)
 
         # add analyzer
-        self.cerebro.addanalyzer(
-            analyzers.AnnualReturn,
-            _name="AnnualReturn")
-        self.cerebro.addanalyzer(
-            analyzers.TimeReturn,
-            timeframe=bt.TimeFrame.Years,
-            _name="YearsTimeReturn")
-        self.cerebro.addanalyzer(
-            analyzers.TimeReturn,
-            timeframe=bt.TimeFrame.Days,
-            _name="DaysTimeReturn")
-        self.cerebro.addanalyzer(
-            analyzers.Returns,
-            _name="Returns",
-            tann=252)
-        self.cerebro.addanalyzer(
-            analyzers.DrawDown,
-            _name="DrawDown")
-        self.cerebro.addanalyzer(
-            analyzers.SharpeRatio_A,
-            _name="SharpeRatio_A")
-        self.cerebro.addanalyzer(
-            analyzers.TradeAnalyzer,
-            _name="TradeAnalyzer")
-        self.cerebro.addanalyzer(
-            analyzers.GrossLeverage,
-            _name="GrossLeverage")
-        self.cerebro.addanalyzer(
-            position_pnl.PositionPNL,
-            _name="PositionPNL")
+        self.analyzer_names = get_analyzer_names(profile)
+        if memory_bounded:
+            self.analyzer_names = tuple(
+                name for name in self.analyzer_names
+                if name not in MEMORY_BOUNDED_UNAVAILABLE)
+        for name in self.analyzer_names:
+            analyzer, kwargs = ANALYZERS[name]
+            self.cerebro.addanalyzer(analyzer, _name=name, **kwargs)
+        if memory_bounded:
+            self.cerebro.addanalyzer(release.ReleaseOrders)
 
         # Add a FixedSize sizer according to the stake
         self.cerebro.addsizer(bt.sizers.FixedSize, stake=1)
 
+    def has_analyzer(self, name):
+        """whether the analyzer is added."""
+        return name in self.analyzer_names
+
     def set_broker(self, slippage, cash):
         """set the broker for cerebro"""
         broker = bt.brokers.BackBroker()
@@ -101,32 +187,36 @@ class BackTesting:
         """add data to cerebro."""
         self.cerebro.adddata(data, name=name)
 
+    def profiling(self):
+        """profile the backtesting if the profiler directory is set."""
+        return profiler.profiling(self.profiler_dir,
+                                  "backtesting",
+                                  trace_memory=self.trace_memory)
+
     def do_backtesting(self):
         """perform backtesting including run and analysis."""
 
-        result = self.run()
-
-        # analysis the return.
-        self.analysis_return(result)
+        with self.profiling():
+            result = self.run()
 
-        # analysis position pln
-        self.analysis_positions_pnl(result)
-
-        # analysis the max draw down.
-        self.analysis_max_draw_down(result)
-
-        # analysis the sharpe ratio
-        self.analysis_sharpe_ratio(result)
-
-        # analysis the leverage
-        self.analysis_leverage_ratio(result)
-
-        # analysis the trade analyzer
-        self.analysis_trade(result)
+            # analysis the result
+            self.analysis(result)
 
         # print the result and plot figure
         self.show()
 
+    def analysis(self, result):
+        """
+        analysis the result of the run and fill the summary, the analysis
+        is skipped if the analyzer is not added by the profile.
+        """
+        for name, step in ANALYSIS_STEPS:
+            if not self.has_analyzer(name):
+                continue
+
+            with profiler.phase(f"backtesting.{step}"):
+                getattr(self, step)(result)
+
     def run(self):
         """run the cerebro to perform backtesting."""
 
@@ -134,13 +224,22 @@ class BackTesting:
         value = self.cerebro.broker.getvalue()
         logger.info("starting portfolio value: %.2f", value)
 
-        # Run over everything
-        result = self.cerebro.run()
+        # Run over everything, only keep the minimum bars of the lines and
+        # skip the observers for plot in memory bounded mode
+        with profiler.phase("backtesting.run"):
+            if self.memory_bounded:
+                result = self.cerebro.run(exactbars=1, stdstats=False)
+            else:
+                result = self.cerebro.run()
 
         # Print out the final result
         value = self.cerebro.broker.getvalue()
         logger.info("final Portfolio Value: %.2f", value)
 
+        self.process_peak_memory = util.get_peak_memory()
+        logger.info("peak memory of the process: %.1f MB",
+                    self.process_peak_memory)
+
         return result
 
     def set_commission(self, commission=4, margin=None, mult=1.0, name=None):
@@ -194,15 +293,20 @@ class BackTesting:
         total_return = (math.exp(analysis["rtot"]) - 1) * 100
         annual_return = analysis["rnorm"] * 100
 
-        analysis = result[0].analyzers.YearsTimeReturn.get_analysis()
-        years_return = {}
-        for year in analysis:
-            years_return[year] = analysis[year] * 100
-
-        analysis = result[0].analyzers.DaysTimeReturn.get_analysis()
-        days_return = {}
-        for day in analysis:
-            days_return[day] = analysis[day] * 100
+        # the years and days return are None without the analyzers
+        years_return = None
+        if self.has_analyzer("YearsTimeReturn"):
+            analysis = result[0].analyzers.YearsTimeReturn.get_analysis()
+            years_return = {}
+            for year in analysis:
+                years_return[year] = analysis[year] * 100
+
+        days_return = None
+        if self.has_analyzer("DaysTimeReturn"):
+            analysis = result[0].analyzers.DaysTimeReturn.get_analysis()
+            days_return = {}
+            for day in analysis:
+                days_return[day] = analysis[day] * 100
 
         return_summary = summary.ReturnSummary(
             total_return=total_return,
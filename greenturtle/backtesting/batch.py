@@ -0,0 +1,265 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+batch backtesting of the independent jobs in parallel.
+
+Every job is a strategy with the params over a subset of the varieties, for
+example one job per variety for the overview of the strategy, the jobs run
+in the process pool and the arrays of all the varieties are loaded once per
+worker by the loader, the same as the parameter sweep.
+
+A job exceeding the timeout, raising an exception or killing its worker
+only fails itself, it is reported by the error column of the result and the
+other jobs go on.
+"""
+
+import collections
+import json
+import signal
+import threading
+import time
+
+import pandas as pd
+
+from greenturtle.analyzers import correlation
+from greenturtle.analyzers import summary
+from greenturtle.backtesting import backtesting
+from greenturtle.backtesting import sweep
+from greenturtle import exception
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+NAME = "name"
+STRATEGY = "strategy"
+VARIETIES = "varieties"
+PARAMS = "params"
+ERROR = "error"
+SECONDS = "seconds"
+COLUMNS = (NAME, STRATEGY, VARIETIES, PARAMS, ERROR, SECONDS) + \
+    summary.METRICS
+
+Job = collections.namedtuple(
+    "Job", ["strategy", "params", "varieties", "name"], defaults=[None])
+
+
+def get_job_name(job):
+    """get the name of the job, the varieties joined by default."""
+    if job.name is not None:
+        return job.name
+    return "+".join(job.varieties)
+
+
+# pylint: disable=unused-argument
+def _raise_timeout(signum, frame):
+    """raise the timeout error in the signal handler."""
+    raise exception.BatchJobTimeoutError
+
+
+def set_timer(timeout):
+    """
+    set the timer to raise the timeout error after the seconds, the timer
+    only works in the main thread which runs the jobs of the pool worker.
+    Return the previous handler of SIGALRM, or None if the timer is not set.
+    """
+    if timeout is None:
+        return None
+    if threading.current_thread() is not threading.main_thread():
+        logger.warning("timeout is ignored out of the main thread")
+        return None
+
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    # the handler not installed from python is restored as the default
+    return signal.SIG_DFL if previous is None else previous
+
+
+def clear_timer(previous):
+    """clear the timer and restore the previous handler of SIGALRM."""
+    signal.setitimer(signal.ITIMER_REAL, 0)
+    signal.signal(signal.SIGALRM, previous)
+
+
+def get_row(job):
+    """get the result row of the job without the metrics."""
+    row = {
+        NAME: get_job_name(job),
+        STRATEGY: job.strategy.__name__,
+        VARIETIES: ",".join(job.varieties),
+        PARAMS: json.dumps(job.params, sort_keys=True, default=str),
+        ERROR: None,
+        SECONDS: None,
+    }
+    row.update(dict.fromkeys(summary.METRICS))
+    return row
+
+
+def get_failed_result(task, error):
+    """get the result of the job whose worker died."""
+    index, job, _ = task
+    row = get_row(job)
+    row[ERROR] = error
+    return index, row, None
+
+
+def run_job(task):
+    """
+    run the backtesting of the job with the arrays of the worker, return
+    the result row and the summary which is None if failed.
+    """
+    index, job, options = task
+    name = get_job_name(job)
+    row = get_row(job)
+
+    backtest_summary = None
+    start = time.perf_counter()
+    try:
+        # the timer is cleared before handling the result or the error,
+        # so the alarm never fires out of the backtesting
+        previous = None
+        try:
+            previous = set_timer(options["timeout"])
+            b = sweep.run_params(job.params,
+                                 dict(options, strategy=job.strategy),
+                                 names=job.varieties)
+        finally:
+            if previous is not None:
+                clear_timer(previous)
+        row.update(b.summary.get_metrics())
+        backtest_summary = b.summary
+    except exception.BatchJobTimeoutError:
+        logger.error("batch job %s timeout after %ss",
+                     name, options["timeout"])
+        row[ERROR] = f"timeout after {options['timeout']}s"
+    # pylint: disable=broad-except
+    except Exception as e:
+        logger.exception("batch job %s failed", name)
+        row[ERROR] = f"{type(e).__name__}: {e}"
+
+    row[SECONDS] = time.perf_counter() - start
+    return index, row, backtest_summary
+
+
+def get_correlation(return_summaries):
+    """get the correlation of the jobs by the return summaries."""
+    corr = correlation.Correlation()
+    for name, return_summary in return_summaries.items():
+        corr.add_return_summary(name, return_summary)
+
+    return corr
+
+
+class BatchBackTesting:
+    """batch backtesting of the jobs in the process pool."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    # pylint: disable=too-many-locals
+    def __init__(self,
+                 jobs,
+                 loader,
+                 loader_kwargs=None,
+                 strategy_kwargs=None,
+                 varieties=None,
+                 cash=1000000,
+                 fromdate=None,
+                 todate=None,
+                 processes=None,
+                 timeout=None,
+                 profile=backtesting.FULL,
+                 result_store=None,
+                 get_data_version=None,
+                 profiler_dir=None,
+                 trace_memory=False):
+        self.jobs = [Job(*job) for job in jobs]
+        self.loader = loader
+        self.loader_kwargs = loader_kwargs or {}
+        self.processes = processes
+        self.result_store = result_store
+        self.get_data_version = get_data_version
+        self.options = {
+            "strategy_kwargs": strategy_kwargs or {},
+            "varieties": varieties,
+            "cash": cash,
+            "fromdate": fromdate,
+            "todate": todate,
+            "timeout": timeout,
+            "profile": profile,
+            "profiler_dir": profiler_dir,
+            "trace_memory": trace_memory,
+        }
+
+        names = [get_job_name(job) for job in self.jobs]
+        duplicated = sorted({n for n in names if names.count(n) > 1})
+        if duplicated:
+            raise ValueError(f"duplicated job names {duplicated}")
+
+    def get_tasks(self):
+        """get the tasks of the jobs."""
+        return [(i, job, self.options) for i, job in enumerate(self.jobs)]
+
+    def save(self, job, backtest_summary):
+        """
+        save the summary of the job into the result store, stamped by the
+        data version of the job varieties if get_data_version is set.
+        """
+        options = self.options
+        params = dict(options["strategy_kwargs"])
+        params.update(job.params)
+        data_version = None
+        if self.get_data_version is not None:
+            data_version = self.get_data_version(job.varieties)
+        self.result_store.save(backtest_summary,
+                               job.strategy,
+                               params,
+                               varieties=job.varieties,
+                               data_version=data_version,
+                               start_date=options["fromdate"],
+                               end_date=options["todate"])
+
+    def run(self):
+        """
+        run the jobs and return the result dataframe with one row per job
+        in the order of the jobs, and the return summaries of the succeeded
+        jobs by the job name, the succeeded jobs are also saved into the
+        result store if set.
+        """
+        tasks = self.get_tasks()
+        logger.info("batch %d jobs", len(tasks))
+
+        rows = [None] * len(tasks)
+        summaries = {}
+        finished = sweep.map_in_pool(run_job,
+                                     tasks,
+                                     self.loader,
+                                     self.loader_kwargs,
+                                     processes=self.processes,
+                                     on_broken=get_failed_result)
+        for i, (index, row, backtest_summary) in \
+                enumerate(finished, start=1):
+            rows[index] = row
+            if backtest_summary is not None:
+                summaries[index] = backtest_summary
+                if self.result_store is not None:
+                    self.save(self.jobs[index], backtest_summary)
+            logger.info("batch %d/%d finished: %s", i, len(tasks), row[NAME])
+
+        # keep the summaries in the order of the jobs
+        return_summaries = {rows[i][NAME]: summaries[i].return_summary
+                            for i in sorted(summaries)}
+        results = pd.DataFrame(rows, columns=COLUMNS)
+
+        return results, return_summaries
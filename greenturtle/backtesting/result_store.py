@@ -0,0 +1,265 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+persistent store of the backtest results.
+
+Every run is recorded with the run id, the strategy, the params, the data
+version, the date range and the flat metrics of the summary, along with the
+daily and yearly returns and the pnl per position. The store is the local
+sqlite file or the database of the config, and the runs are loaded by one
+query into the dataframe to compare them without running again.
+
+The returns of every run and period are packed into one row of the int64
+dates and float64 values, so loading the returns of hundreds of runs is
+hundreds of rows instead of a row per day per run.
+"""
+
+import datetime
+import json
+import os
+import uuid
+
+import munch
+import numpy as np
+import pandas as pd
+import sqlalchemy
+
+from greenturtle.analyzers import summary
+from greenturtle.db import api
+from greenturtle.db import models
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+DAY = "day"
+YEAR = "year"
+PARAM_PREFIX = "param_"
+
+
+def get_strategy_name(strategy):
+    """get the full name of the strategy class, or keep the string."""
+    if isinstance(strategy, str):
+        return strategy
+    return f"{strategy.__module__}.{strategy.__qualname__}"
+
+
+def _to_datetime(value):
+    """convert the date to datetime."""
+    if isinstance(value, datetime.datetime):
+        return value
+    return datetime.datetime.combine(value, datetime.time())
+
+
+def pack_returns(returns):
+    """pack the returns by the date into the bytes of dates and values."""
+    dates = np.array([_to_datetime(d) for d in returns],
+                     dtype="datetime64[ns]")
+    values = np.array(list(returns.values()), dtype=np.float64)
+    return dates.view(np.int64).tobytes(), values.tobytes()
+
+
+def unpack_returns(dates, values):
+    """unpack the bytes of dates and values into the series."""
+    index = np.frombuffer(dates, dtype=np.int64).view("datetime64[ns]")
+    return pd.Series(np.frombuffer(values, dtype=np.float64),
+                     index=pd.DatetimeIndex(index, name="date"))
+
+
+def get_return_rows(run_id, return_summary):
+    """
+    get the rows of the daily and yearly returns, the returns of the period
+    are packed into one row so the runs are loaded without the row per day.
+    """
+    rows = []
+    if return_summary is None:
+        return rows
+
+    # the year is keyed by the last day of the year
+    for period, returns in ((DAY, return_summary.days_return),
+                            (YEAR, return_summary.years_return)):
+        if not returns:
+            continue
+        dates, values = pack_returns(returns)
+        rows.append({"run_id": run_id,
+                     "period": period,
+                     "dates": dates,
+                     "values": values})
+
+    return rows
+
+
+def get_position_pnl_rows(run_id, positions_pnl_summary):
+    """get the rows of the pnl per position."""
+    if positions_pnl_summary is None or \
+            positions_pnl_summary.positions_pnl is None:
+        return []
+
+    rows = []
+    for name, pnl in positions_pnl_summary.positions_pnl.items():
+        rows.append({"run_id": run_id,
+                     "name": name,
+                     "net": pnl["net"],
+                     "gross": pnl["gross"],
+                     "profit": pnl["profit"],
+                     "lost": pnl["lost"],
+                     "trade_number": pnl["trade_number"]})
+
+    return rows
+
+
+def get_date_range(return_summary):
+    """get the first and last date of the daily returns."""
+    if return_summary is None or not return_summary.days_return:
+        return None, None
+
+    days = list(return_summary.days_return)
+    return _to_datetime(min(days)), _to_datetime(max(days))
+
+
+class ResultStore:
+    """store of the backtest results in the database."""
+
+    def __init__(self, db_conf):
+        api.DBManager(db_conf).create_backtest_tables()
+        self.dbapi = api.DBAPI(db_conf)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def save(self,
+             backtest_summary,
+             strategy,
+             params,
+             varieties=None,
+             data_version=None,
+             start_date=None,
+             end_date=None,
+             run_id=None):
+        """
+        save the summary of the run and return the run id, the date range is
+        the one of the daily returns by default.
+        """
+        run_id = run_id or uuid.uuid4().hex
+        return_summary = backtest_summary.return_summary
+
+        first, last = get_date_range(return_summary)
+        run = {
+            "run_id": run_id,
+            "strategy": get_strategy_name(strategy),
+            "params": json.dumps(params, sort_keys=True, default=str),
+            "varieties": ",".join(varieties) if varieties else None,
+            "data_version": data_version,
+            "start_date": _to_datetime(start_date) if start_date else first,
+            "end_date": _to_datetime(end_date) if end_date else last,
+        }
+        run.update(backtest_summary.get_metrics())
+
+        self.dbapi.backtest_run_create(
+            run,
+            get_return_rows(run_id, return_summary),
+            get_position_pnl_rows(run_id,
+                                  backtest_summary.positions_pnl_summary))
+        logger.debug("save the backtest run %s", run_id)
+
+        return run_id
+
+    def delete(self, run_id):
+        """delete the run."""
+        self.dbapi.backtest_run_delete(run_id)
+
+    def _read(self, query):
+        """read the query into the dataframe."""
+        with self.dbapi.engine.connect() as connection:
+            return pd.read_sql(query, connection)
+
+    def load_runs(self, run_ids=None, strategy=None, expand_params=True):
+        """
+        load the runs into the dataframe indexed by the run id, the params
+        are expanded into the param_ prefixed columns by default.
+        """
+        model = models.BacktestRun
+        columns = [model.run_id, model.strategy, model.params,
+                   model.varieties, model.data_version, model.start_date,
+                   model.end_date, model.created_at]
+        columns += [getattr(model, metric) for metric in summary.METRICS]
+
+        query = sqlalchemy.select(*columns).order_by(model.id)
+        if run_ids is not None:
+            query = query.where(model.run_id.in_(list(run_ids)))
+        if strategy is not None:
+            query = query.where(
+                model.strategy == get_strategy_name(strategy))
+
+        df = self._read(query).set_index("run_id")
+        if not expand_params or df.empty:
+            return df
+
+        params = pd.DataFrame([json.loads(p) for p in df["params"]],
+                              index=df.index)
+        return pd.concat([df, params.add_prefix(PARAM_PREFIX)], axis=1)
+
+    def load_returns(self, run_ids=None, period=DAY):
+        """
+        load the returns in percent of the period into the dataframe with
+        the date as index and the run id as column.
+        """
+        model = models.BacktestReturn
+        query = sqlalchemy.select(model.run_id, model.dates, model.values)
+        query = query.where(model.period == period).order_by(model.id)
+        if run_ids is not None:
+            query = query.where(model.run_id.in_(list(run_ids)))
+
+        with self.dbapi.engine.connect() as connection:
+            series = {run_id: unpack_returns(dates, values)
+                      for run_id, dates, values in connection.execute(query)}
+
+        if not series:
+            return pd.DataFrame(index=pd.DatetimeIndex([], name="date"))
+
+        return pd.concat(series, axis=1).rename_axis(columns="run_id")
+
+    def load_positions_pnl(self, run_ids=None):
+        """load the pnl per position into the dataframe."""
+        model = models.BacktestPositionPNL
+        query = sqlalchemy.select(model.run_id, model.name, model.net,
+                                  model.gross, model.profit, model.lost,
+                                  model.trade_number).order_by(model.id)
+        if run_ids is not None:
+            query = query.where(model.run_id.in_(list(run_ids)))
+
+        return self._read(query)
+
+
+def get_result_store(conf):
+    """
+    get the result store by the config, the result store config is either
+    the path of the local sqlite file or the database, return None if not
+    configured.
+    """
+    result_store_conf = getattr(conf, "result_store", None)
+    if result_store_conf is None:
+        return None
+
+    if getattr(result_store_conf, "path", None):
+        directory = os.path.dirname(result_store_conf.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return ResultStore(munch.Munch(drivername=api.SQLITE_DRIVERNAME,
+                                       database=result_store_conf.path))
+
+    if getattr(result_store_conf, "db", False):
+        return ResultStore(conf.db)
+
+    return None
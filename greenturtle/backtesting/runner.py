@@ -0,0 +1,137 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+run the backtesting from the prepared arrays.
+
+The data is prepared once, by the loaders from the database, the shared
+memory panel or the history store, then every run only builds the array
+feeds over the arrays, which is shared by the parameter sweep and the walk
+forward analysis.
+"""
+
+from multiprocessing import util as mp_util
+
+from greenturtle.backtesting import backtesting
+from greenturtle.data.datafeed import array
+from greenturtle.data.datafeed import db
+from greenturtle.data import history_store
+from greenturtle.data import sharedmem
+from greenturtle.indicators import registry
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+# the attached shared panels by the name of the values block, they are kept
+# alive while the arrays are used and closed when the process exits
+_ATTACHED_PANELS = {}
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def load_arrays_from_db(db_conf,
+                        names,
+                        source,
+                        country,
+                        start_date,
+                        end_date,
+                        padding=True,
+                        cache_dir=None):
+    """
+    load the arrays of the varieties from the database, the indicators
+    computed over the arrays are also persisted next to the feed cache if
+    cache_dir is set.
+    """
+    if cache_dir is not None:
+        registry.get_registry().set_cache_dir(cache_dir)
+
+    return db.get_arrays_by_variety_from_db(
+        db_conf, names, source, country, start_date, end_date,
+        padding=padding, cache_dir=cache_dir)
+
+
+def close_attached_panels():
+    """close the shared panels attached by this process."""
+    while _ATTACHED_PANELS:
+        name, panel = _ATTACHED_PANELS.popitem()
+        try:
+            panel.close()
+        except BufferError:
+            logger.warning("shared panel %s is still in use", name)
+
+
+def load_arrays_from_shared_panel(manifest):
+    """
+    attach the shared panel and load the arrays without copying, the panel
+    is attached once per process and closed when the process exits.
+    """
+    shm_name = manifest["values"]
+    panel = _ATTACHED_PANELS.get(shm_name)
+    if panel is None:
+        if not _ATTACHED_PANELS:
+            # the finalizer also runs at the exit of the pool workers
+            mp_util.Finalize(None, close_attached_panels, exitpriority=0)
+        panel = sharedmem.SharedPanel.attach(manifest)
+        _ATTACHED_PANELS[shm_name] = panel
+
+    return {name: panel.get_arrays(name) for name in panel.varieties}
+
+
+def load_arrays_from_history_store(root, names=None):
+    """load the arrays of the varieties from the history store."""
+    store = history_store.HistoryStore(root)
+    if names is None:
+        names = store.get_varieties()
+
+    return {name: store.get_arrays(name) for name in names}
+
+
+# pylint: disable=too-many-locals
+def run_backtesting(arrays_by_variety,
+                    strategy,
+                    strategy_kwargs,
+                    varieties,
+                    cash=1000000,
+                    fromdate=None,
+                    todate=None,
+                    profile=backtesting.FULL,
+                    memory_bounded=False,
+                    profiler_dir=None,
+                    trace_memory=False):
+    """
+    run the backtesting of the strategy over the arrays and return the
+    backtesting with the summary analysed by the analyzer profile, the run
+    and the analysis are profiled into profiler_dir if set.
+    """
+    b = backtesting.BackTesting(cash=cash,
+                                varieties=varieties,
+                                profile=profile,
+                                memory_bounded=memory_bounded,
+                                profiler_dir=profiler_dir,
+                                trace_memory=trace_memory)
+    for name, arrays in arrays_by_variety.items():
+        feed = array.get_feed_from_arrays(name,
+                                          arrays,
+                                          fromdate=fromdate,
+                                          todate=todate)
+        b.add_data(feed, name)
+        b.set_default_commission_by_name(name)
+
+    b.add_strategy(strategy, varieties=varieties, **strategy_kwargs)
+    with b.profiling():
+        result = b.run()
+        b.analysis(result)
+
+    return b
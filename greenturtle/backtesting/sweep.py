@@ -0,0 +1,382 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+parallel parameter sweep of the strategy.
+
+The parameter samples are generated from a grid, or randomly, or by latin
+hypercube sampling from the space. Every sample runs a BackTesting in the
+process pool, the data is loaded once per worker by the loader in the pool
+initializer, for example runner.load_arrays_from_db, or attaching the
+shared memory panel by runner.load_arrays_from_shared_panel.
+
+A worker dying in the pool, by the oom killer or a segfault for example,
+only fails the sample it runs, the pool is recreated for the others.
+
+The finished samples are appended to the checkpoint csv file, so the
+interrupted sweep resumes from the checkpoint and skips the finished ones.
+"""
+
+import collections
+from concurrent import futures
+from concurrent.futures import process
+import itertools
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from greenturtle.analyzers import summary
+from greenturtle.backtesting import backtesting
+from greenturtle.backtesting import runner
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+GRID = "grid"
+RANDOM = "random"
+LHS = "lhs"
+SAMPLERS = (GRID, RANDOM, LHS)
+
+KEY = "key"
+ERROR = "error"
+
+# the arrays loaded by the worker initializer
+_WORKER_ARRAYS = {}
+
+
+def get_grid_samples(grid):
+    """get the cartesian product of the grid, a dict from name to values."""
+    names = list(grid.keys())
+    return [dict(zip(names, values))
+            for values in itertools.product(*grid.values())]
+
+
+def _scale(dimension, quantiles):
+    """
+    scale the quantiles in [0, 1) to the dimension, the dimension is a list
+    of choices, or a (low, high) tuple which is integer if both are int.
+    """
+    if isinstance(dimension, list):
+        indexes = np.floor(quantiles * len(dimension)).astype(int)
+        return [dimension[i] for i in indexes]
+
+    low, high = dimension
+    if isinstance(low, int) and isinstance(high, int):
+        values = np.floor(low + quantiles * (high - low + 1)).astype(int)
+        return [int(v) for v in values]
+
+    return [float(v) for v in low + quantiles * (high - low)]
+
+
+def _get_samples_by_quantiles(space, quantiles):
+    """get the samples from the quantiles with shape (sample, dimension)."""
+    columns = [_scale(dimension, quantiles[:, j])
+               for j, dimension in enumerate(space.values())]
+    return [dict(zip(space.keys(), values)) for values in zip(*columns)]
+
+
+def get_random_samples(space, n, seed=0):
+    """get the random samples from the space."""
+    rng = np.random.default_rng(seed)
+    quantiles = rng.random((n, len(space)))
+    return _get_samples_by_quantiles(space, quantiles)
+
+
+def get_lhs_samples(space, n, seed=0):
+    """
+    get the latin hypercube samples from the space, every dimension is
+    divided into n strata and every stratum is sampled exactly once.
+    """
+    rng = np.random.default_rng(seed)
+    quantiles = np.empty((n, len(space)))
+    for j in range(len(space)):
+        strata = rng.permutation(n)
+        quantiles[:, j] = (strata + rng.random(n)) / n
+
+    return _get_samples_by_quantiles(space, quantiles)
+
+
+def get_samples(sampler, space, n=None, seed=0):
+    """get the samples by the sampler."""
+    if sampler == GRID:
+        return get_grid_samples(space)
+    if sampler == RANDOM:
+        return get_random_samples(space, n, seed=seed)
+    if sampler == LHS:
+        return get_lhs_samples(space, n, seed=seed)
+
+    raise ValueError(f"unknown sampler {sampler}")
+
+
+def get_sample_key(params):
+    """get the unique key of the sample."""
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def init_worker(loader, loader_kwargs):
+    """load the arrays once per worker."""
+    _WORKER_ARRAYS.clear()
+    _WORKER_ARRAYS.update(loader(**loader_kwargs))
+
+
+def get_worker_arrays():
+    """get the arrays loaded by the worker initializer."""
+    return _WORKER_ARRAYS
+
+
+def _map_until_broken(func, tasks, initargs, workers):
+    """
+    map the func over the tasks in the pool with at most one task per
+    worker in flight, the tasks are popped from the deque once submitted.
+    Once a worker dies the pool is broken, return the tasks in flight.
+    """
+    in_flight = {}
+    with futures.ProcessPoolExecutor(max_workers=workers,
+                                     initializer=init_worker,
+                                     initargs=initargs) as executor:
+        while tasks or in_flight:
+            try:
+                while tasks and len(in_flight) < workers:
+                    future = executor.submit(func, tasks[0])
+                    in_flight[future] = tasks.popleft()
+            except process.BrokenProcessPool:
+                return list(in_flight.values())
+
+            done, _ = futures.wait(in_flight,
+                                   return_when=futures.FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                try:
+                    result = future.result()
+                except process.BrokenProcessPool:
+                    broken = True
+                    continue
+                in_flight.pop(future)
+                yield result
+
+            if broken:
+                return list(in_flight.values())
+
+    return []
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def map_in_pool(func,
+                tasks,
+                loader,
+                loader_kwargs,
+                processes=None,
+                on_broken=None):
+    """
+    map the func over the tasks in the pool whose workers load the arrays
+    by the loader, or inline with one process, the results are unordered.
+
+    Once a worker dies, the tasks in flight are run again one by one in a
+    new pool, the task breaking the pool again is failed by on_broken which
+    gets the task and the error and returns its result, the others go on
+    in a new pool.
+    """
+    initargs = (loader, loader_kwargs)
+    if processes == 1:
+        init_worker(*initargs)
+        yield from map(func, tasks)
+        return
+
+    workers = processes or os.cpu_count()
+    pending = collections.deque(tasks)
+    while pending:
+        suspects = yield from _map_until_broken(func,
+                                                pending,
+                                                initargs,
+                                                workers)
+        if len(suspects) > 1:
+            # isolate the task which breaks the pool
+            logger.warning("pool broken, run %d tasks one by one",
+                           len(suspects))
+            isolated = []
+            for task in suspects:
+                isolated += yield from _map_until_broken(
+                    func, collections.deque([task]), initargs, 1)
+            suspects = isolated
+
+        for task in suspects:
+            error = "worker died, the process pool is broken"
+            logger.error("%s when running task %s", error, task[0])
+            if on_broken is None:
+                raise process.BrokenProcessPool(error)
+            yield on_broken(task, error)
+
+
+def run_params(params, options, names=None):
+    """
+    run the backtesting of the params with the arrays of the worker, only
+    over the varieties of the names if given.
+    """
+    strategy_kwargs = dict(options["strategy_kwargs"])
+    strategy_kwargs.update(params)
+
+    arrays = get_worker_arrays()
+    if names is not None:
+        arrays = {name: arrays[name] for name in names}
+
+    return runner.run_backtesting(arrays,
+                                  options["strategy"],
+                                  strategy_kwargs,
+                                  options["varieties"],
+                                  cash=options["cash"],
+                                  fromdate=options["fromdate"],
+                                  todate=options["todate"],
+                                  profile=options["profile"],
+                                  profiler_dir=options.get("profiler_dir"),
+                                  trace_memory=options.get("trace_memory",
+                                                           False))
+
+
+def get_failed_row(task, error):
+    """get the metrics row of the failed sample."""
+    key, params, _ = task
+    row = {KEY: key, ERROR: error}
+    row.update(params)
+    row.update(dict.fromkeys(summary.METRICS))
+    return row
+
+
+def run_sample(task):
+    """run the backtesting of the sample and return the metrics row."""
+    key, params, options = task
+    row = {KEY: key, ERROR: None}
+    row.update(params)
+    try:
+        b = run_params(params, options)
+        row.update(b.summary.get_metrics())
+    # pylint: disable=broad-except
+    except Exception as e:
+        logger.exception("sweep sample %s failed", key)
+        row = get_failed_row(task, str(e))
+
+    return row
+
+
+def load_checkpoint(path):
+    """load the finished rows from the checkpoint."""
+    if path is None or not os.path.exists(path):
+        return pd.DataFrame()
+
+    return pd.read_csv(path)
+
+
+def save_checkpoint(path, row):
+    """append the finished row to the checkpoint."""
+    pd.DataFrame([row]).to_csv(path,
+                               mode="a",
+                               header=not os.path.exists(path),
+                               index=False)
+
+
+# pylint: disable=too-many-instance-attributes
+class Sweep:
+    """parallel parameter sweep of the strategy."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self,
+                 strategy,
+                 samples,
+                 loader,
+                 loader_kwargs=None,
+                 strategy_kwargs=None,
+                 varieties=None,
+                 cash=1000000,
+                 fromdate=None,
+                 todate=None,
+                 processes=None,
+                 checkpoint=None,
+                 profile=backtesting.FULL,
+                 profiler_dir=None,
+                 trace_memory=False):
+        self.strategy = strategy
+        self.samples = samples
+        self.loader = loader
+        self.loader_kwargs = loader_kwargs or {}
+        self.strategy_kwargs = strategy_kwargs or {}
+        self.varieties = varieties
+        self.cash = cash
+        self.fromdate = fromdate
+        self.todate = todate
+        self.processes = processes
+        self.checkpoint = checkpoint
+        self.profile = profile
+        self.profiler_dir = profiler_dir
+        self.trace_memory = trace_memory
+
+    def get_tasks(self, finished_keys):
+        """get the tasks of the samples which are not finished."""
+        options = {
+            "strategy": self.strategy,
+            "strategy_kwargs": self.strategy_kwargs,
+            "varieties": self.varieties,
+            "cash": self.cash,
+            "fromdate": self.fromdate,
+            "todate": self.todate,
+            "profile": self.profile,
+            "profiler_dir": self.profiler_dir,
+            "trace_memory": self.trace_memory,
+        }
+
+        tasks, keys = [], set(finished_keys)
+        for params in self.samples:
+            key = get_sample_key(params)
+            if key in keys:
+                continue
+            keys.add(key)
+            tasks.append((key, params, options))
+
+        return tasks
+
+    def _map(self, tasks):
+        """run the tasks in the pool, or inline with one process."""
+        return map_in_pool(run_sample,
+                           tasks,
+                           self.loader,
+                           self.loader_kwargs,
+                           processes=self.processes,
+                           on_broken=get_failed_row)
+
+    def run(self):
+        """
+        run the sweep and return the results of all the samples including
+        the ones in the checkpoint, the failed samples are not saved into
+        the checkpoint so they are run again when resumed.
+        """
+        finished = load_checkpoint(self.checkpoint)
+        finished_keys = finished[KEY].tolist() if KEY in finished else []
+        tasks = self.get_tasks(finished_keys)
+        logger.info("sweep %d samples, %d finished in checkpoint",
+                    len(tasks), len(finished_keys))
+
+        rows = []
+        for i, row in enumerate(self._map(tasks), start=1):
+            rows.append(row)
+            if row[ERROR] is None and self.checkpoint is not None:
+                save_checkpoint(self.checkpoint, row)
+            logger.info("sweep %d/%d finished: %s", i, len(tasks), row[KEY])
+
+        frames = [f for f in (finished, pd.DataFrame(rows)) if not f.empty]
+        if not frames:
+            return pd.DataFrame()
+
+        return pd.concat(frames, ignore_index=True)
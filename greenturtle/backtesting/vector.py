@@ -0,0 +1,656 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+vector backtesting for the trend strategies.
+
+The backtrader strategies evaluate the indicators and the signals bar by bar
+in next, which dominates the time of the research sweeps. The vector mode
+computes the indicators over the full price panel by the numpy kernels and
+the buy and sell rules of all the bars at once, then a light loop over the
+bars follows the state machine of BaseStrategy, sizes the positions by the
+atr and the total value, and settles the orders in the same way as the
+backtrader broker, including
+
+    the orders are created at the close and executed at the next open
+    the submitted orders are checked against the cash before executed
+    the fixed commission per contract, the multiplier and the auto margin
+    the futures are marked to market every bar, value is cash plus margin
+
+The varieties are aligned on the union of their dates. Like the feed which
+is not advanced by backtrader on its missing bar, the indicators of every
+variety are computed over its own bars and the missing bar holds the last
+bar, and the orders of the variety wait for its next bar to execute.
+
+The group risk adjustment follows BaseStrategy by the array sizing engine,
+the inference mode and the price validation of BaseStrategy are not
+supported in the vector mode.
+"""
+
+import collections
+
+import backtrader as bt
+from backtrader import comminfo
+import numpy as np
+
+from greenturtle.constants import types
+from greenturtle.data.datafeed import array
+from greenturtle import exception
+from greenturtle.indicators import kernels
+from greenturtle.indicators import registry
+from greenturtle.stragety import channel
+from greenturtle.stragety import ema
+from greenturtle.stragety import mim
+from greenturtle.stragety import sizing
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+ATR = "atr"
+PANEL_FIELDS = (types.OPEN, types.HIGH, types.LOW, types.CLOSE)
+
+Rules = collections.namedtuple(
+    "Rules",
+    ["buy_to_open", "sell_to_close", "sell_to_open", "buy_to_close"])
+
+
+# pylint: disable=too-many-instance-attributes
+class Panel:
+    """price panel of the varieties with shape (date, variety)."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, dates, names, values, present=None):
+        self.dates = dates
+        self.names = list(names)
+        self.open = values[types.OPEN]
+        self.high = values[types.HIGH]
+        self.low = values[types.LOW]
+        self.close = values[types.CLOSE]
+        self.valid = values[types.VALID]
+        if present is None:
+            present = np.ones(self.close.shape, dtype=bool)
+        self.present = present
+        # the position of the latest bar of the variety on every date
+        self.positions = np.cumsum(present, axis=0) - 1
+
+    @classmethod
+    def from_arrays(cls, arrays_by_variety):
+        """
+        create the panel from the arrays of every variety, the missing bar
+        holds the last bar of the variety.
+        """
+        normalized = {k: array.normalize_arrays(v)
+                      for k, v in arrays_by_variety.items()}
+        dates = np.unique(np.concatenate(
+            [v[types.DATETIME] for v in normalized.values()]))
+        shape = (len(dates), len(normalized))
+
+        values = {field: np.full(shape, np.nan) for field in PANEL_FIELDS}
+        values[types.VALID] = np.zeros(shape)
+        present = np.zeros(shape, dtype=bool)
+        for j, arrays in enumerate(normalized.values()):
+            # the position of the latest bar of the variety on every date
+            positions = np.searchsorted(arrays[types.DATETIME],
+                                        dates,
+                                        side="right") - 1
+            started = positions >= 0
+            for field in PANEL_FIELDS + (types.VALID,):
+                values[field][started, j] = arrays[field][positions[started]]
+
+            present[np.searchsorted(dates, arrays[types.DATETIME]), j] = True
+
+        return cls(dates, normalized.keys(), values, present=present)
+
+    def apply(self, func, inputs):
+        """
+        apply the func over the inputs of the own bars of every variety, the
+        missing bar holds the result of the last bar.
+        """
+        if self.present.all():
+            return func(inputs)
+
+        result = np.full(self.present.shape, np.nan)
+        for j in range(self.present.shape[1]):
+            rows = self.present[:, j]
+            values = func([v[rows, j] for v in inputs])
+            positions = self.positions[:, j]
+            started = positions >= 0
+            result[started, j] = values[positions[started]]
+
+        return result
+
+    def compute(self, kernel, inputs, **params):
+        """compute the kernel over the own bars by the registry."""
+        return self.apply(
+            lambda columns: registry.compute(kernel, columns, **params),
+            inputs)
+
+
+class VectorSignal:
+    """
+    base class of the vector signals, the parameters are the same as
+    BaseStrategy.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self,
+                 allow_short=False,
+                 risk_factor=0.002,
+                 atr_period=100,
+                 varieties=None,
+                 group_risk_factors=None):
+        self.allow_short = allow_short
+        self.risk_factor = risk_factor
+        self.atr_period = atr_period
+        self.varieties = varieties
+        self.group_risk_factors = group_risk_factors
+
+    def compute_indicators(self, panel):
+        """compute the indicators over the panel, return a dict."""
+        raise NotImplementedError
+
+    def compute_rules(self, panel, indicators):
+        """compute the buy and sell rules of all the bars."""
+        raise NotImplementedError
+
+    def compute(self, panel):
+        """
+        compute the atr, the rules and the first bar to trade, which is the
+        first bar all the indicators are ready, like the minimum period of
+        the backtrader strategy.
+        """
+        indicators = self.compute_indicators(panel)
+        indicators[ATR] = panel.compute(
+            kernels.atr,
+            [panel.high, panel.low, panel.close],
+            period=self.atr_period)
+
+        start = 0
+        for values in indicators.values():
+            ready = ~np.isnan(values)
+            if not ready.any(axis=0).all():
+                return indicators[ATR], None, len(panel.dates)
+            start = max(start, int(np.argmax(ready, axis=0).max()))
+
+        rules = self.compute_rules(panel, indicators)
+        return indicators[ATR], rules, start
+
+
+class EMASignal(VectorSignal):
+    """vector signal of the EMA strategy."""
+
+    def __init__(self, *args, fast_period=10, slow_period=100, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+
+    def compute_indicators(self, panel):
+        return {"fast": panel.compute(kernels.ema,
+                                      [panel.close],
+                                      period=self.fast_period),
+                "slow": panel.compute(kernels.ema,
+                                      [panel.close],
+                                      period=self.slow_period)}
+
+    def compute_rules(self, panel, indicators):
+        fast, slow = indicators["fast"], indicators["slow"]
+        return Rules(buy_to_open=fast > slow,
+                     sell_to_close=fast < slow,
+                     sell_to_open=fast < slow,
+                     buy_to_close=fast > slow)
+
+
+class EMAEnhancedSignal(EMASignal):
+    """vector signal of the EMAEnhanced strategy."""
+
+    def __init__(self,
+                 *args,
+                 fast_period=10,
+                 slow_period=100,
+                 channel_period=25,
+                 **kwargs):
+        super().__init__(*args,
+                         fast_period=fast_period,
+                         slow_period=slow_period,
+                         **kwargs)
+        self.channel_period = channel_period
+
+    def compute_indicators(self, panel):
+        indicators = super().compute_indicators(panel)
+        indicators["highest"] = panel.compute(
+            kernels.highest, [panel.close], period=self.channel_period)
+        indicators["lowest"] = panel.compute(
+            kernels.lowest, [panel.close], period=self.channel_period)
+        return indicators
+
+    def compute_rules(self, panel, indicators):
+        fast, slow = indicators["fast"], indicators["slow"]
+        highest, lowest = indicators["highest"], indicators["lowest"]
+        atr = indicators[ATR]
+        close = panel.close
+
+        long_stop = highest >= close + 3 * atr
+        short_stop = close >= lowest + 3 * atr
+        return Rules(buy_to_open=(fast > slow) & (close >= highest),
+                     sell_to_close=(fast < slow) | long_stop,
+                     sell_to_open=(fast < slow) & (close <= lowest),
+                     buy_to_close=(fast > slow) | short_stop)
+
+
+class DonchianChannelSignal(VectorSignal):
+    """vector signal of the DonchianChannel strategy."""
+
+    def __init__(self, *args, short_period=25, long_period=50, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.short_period = short_period
+        self.long_period = long_period
+
+    def compute_indicators(self, panel):
+        return {
+            "long_highest": panel.compute(kernels.highest,
+                                          [panel.high],
+                                          period=self.long_period),
+            "long_lowest": panel.compute(kernels.lowest,
+                                         [panel.low],
+                                         period=self.long_period),
+            "short_highest": panel.compute(kernels.highest,
+                                           [panel.high],
+                                           period=self.short_period),
+            "short_lowest": panel.compute(kernels.lowest,
+                                          [panel.low],
+                                          period=self.short_period),
+        }
+
+    def compute_rules(self, panel, indicators):
+        # the channel of the previous bar of the variety
+        prev = {k: panel.apply(lambda columns: kernels.shift(columns[0]), [v])
+                for k, v in indicators.items()}
+        close = panel.close
+        return Rules(buy_to_open=close >= prev["long_highest"],
+                     sell_to_close=close <= prev["short_lowest"],
+                     sell_to_open=close <= prev["long_lowest"],
+                     buy_to_close=close >= prev["short_highest"])
+
+
+class MIMSignal(VectorSignal):
+    """vector signal of the MIMStrategy, long only."""
+
+    def __init__(self, *args, period=100, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.period = period
+
+    def compute_indicators(self, panel):
+        return {"mov": panel.compute(kernels.ema,
+                                     [panel.close],
+                                     period=self.period)}
+
+    def compute_rules(self, panel, indicators):
+        mov = indicators["mov"]
+        never = np.zeros(mov.shape, dtype=bool)
+        return Rules(buy_to_open=panel.close > mov,
+                     sell_to_close=panel.close < mov,
+                     sell_to_open=never,
+                     buy_to_close=never)
+
+
+SIGNALS = {
+    ema.EMA: EMASignal,
+    ema.EMAEnhanced: EMAEnhancedSignal,
+    channel.DonchianChannel: DonchianChannelSignal,
+    mim.MIMStrategy: MIMSignal,
+}
+
+
+def get_signal_class(strategy):
+    """get the vector signal class of the backtrader strategy."""
+    if isinstance(strategy, type) and issubclass(strategy, VectorSignal):
+        return strategy
+
+    if strategy not in SIGNALS:
+        raise exception.StrategyNotSupportedError
+
+    return SIGNALS[strategy]
+
+
+def _pseudo_execute(info, position, size, price):
+    """
+    the cash change of the order executed with the created price, which is
+    used to check the submitted orders.
+    """
+    _, _, opened, closed = position.update(size, price)
+    cash = 0.0
+    if closed:
+        cash += info.getoperationcost(closed, price)
+        cash -= info.getcommission(closed, price)
+    if opened:
+        cash -= info.getoperationcost(opened, price)
+        cash -= info.getcommission(opened, price)
+
+    return cash
+
+
+# pylint: disable=too-many-instance-attributes
+class VectorBroker:
+    """
+    broker settles the orders of the varieties in the same way as the
+    backtrader BackBroker for futures without slippage.
+    """
+
+    def __init__(self, cash, comminfos):
+        self.cash = cash
+        self.comminfos = comminfos
+        self.mults = np.array([c.p.mult for c in comminfos], dtype=float)
+        self.margins = np.array([c.get_margin(1.0) for c in comminfos],
+                                dtype=float)
+
+        self.positions = [bt.Position() for _ in comminfos]
+        self.sizes = np.zeros(len(comminfos))
+        self.adjbases = np.zeros(len(comminfos))
+
+        self.submitted = []
+        # the accepted orders wait for the next bar of the variety
+        self.pending = []
+        # the indexes in the order of the first submitted
+        self.touched = []
+        self.orders = 0
+        self.rejected = 0
+        self.commission = 0.0
+
+    def submit(self, index, size, price):
+        """submit the market order created with the price."""
+        if index not in self.touched:
+            self.touched.append(index)
+        self.submitted.append((index, size, price))
+
+    def get_position_order(self):
+        """
+        get the indexes of the held positions in the order of the first
+        submitted, which is the order of the positions in backtrader broker.
+        """
+        return np.array([i for i in self.touched if self.sizes[i] != 0],
+                        dtype=int)
+
+    def check_submitted(self):
+        """accept the submitted orders which the cash could afford."""
+        cash = self.cash
+        positions = {}
+        accepted = []
+        for index, size, price in self.submitted:
+            position = positions.setdefault(index,
+                                            self.positions[index].clone())
+            cash += _pseudo_execute(self.comminfos[index],
+                                    position,
+                                    size,
+                                    price)
+            if cash >= 0.0:
+                accepted.append((index, size))
+            else:
+                self.rejected += 1
+
+        self.submitted = []
+        return accepted
+
+    def execute(self, index, size, price):
+        """execute the order with the price."""
+        info = self.comminfos[index]
+        position = self.positions[index]
+        adjbase = self.adjbases[index]
+
+        cash = self.cash
+        psize, _, opened, closed = position.pseudoupdate(size, price)
+        comm = 0.0
+        if closed:
+            cash += info.getoperationcost(closed, position.price)
+            comm += info.getcommission(closed, price)
+            cash -= info.getcommission(closed, price)
+            cash += info.cashadjust(-closed, adjbase, price)
+            self.cash = cash
+
+        if opened:
+            cash -= info.getoperationcost(opened, price)
+            cash -= info.getcommission(opened, price)
+            if cash < 0.0:
+                opened = 0
+            else:
+                comm += info.getcommission(opened, price)
+                if abs(psize) > abs(opened):
+                    cash += info.cashadjust(psize - opened, adjbase, price)
+                self.adjbases[index] = price
+                self.cash = cash
+
+        if closed + opened:
+            position.update(closed + opened, price)
+            self.sizes[index] = position.size
+            self.commission += comm
+            self.orders += 1
+
+    def next(self, opens, closes, present):
+        """
+        execute the orders of the varieties with the bar at the open and
+        mark to market at the close.
+        """
+        self.pending.extend(self.check_submitted())
+        pending = []
+        for index, size in self.pending:
+            if present[index]:
+                self.execute(index, size, opens[index])
+            else:
+                pending.append((index, size))
+        self.pending = pending
+
+        hold = self.sizes != 0
+        self.cash += float(np.sum(self.sizes[hold] *
+                                  (closes[hold] - self.adjbases[hold]) *
+                                  self.mults[hold]))
+        self.adjbases[hold] = closes[hold]
+
+    def get_value(self, closes):
+        """the total value, cash plus the margin of the positions."""
+        hold = self.sizes != 0
+        return self.cash + float(np.sum(np.abs(self.sizes[hold]) *
+                                        (closes[hold] * self.margins[hold])))
+
+
+class VectorResult:
+    """result of the vector backtesting."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, dates, names, values, cash, positions, broker):
+        self.dates = dates
+        self.names = names
+        self.values = values
+        self.cash = cash
+        self.positions = positions
+        self.orders = broker.orders
+        self.rejected = broker.rejected
+        self.commission = broker.commission
+
+    @property
+    def final_value(self):
+        """the final value."""
+        return float(self.values[-1])
+
+    @property
+    def total_return(self):
+        """the total return in percent."""
+        return (self.values[-1] / self.values[0] - 1) * 100
+
+    @property
+    def max_draw_down(self):
+        """the max draw down in percent."""
+        peak = np.maximum.accumulate(self.values)
+        return float(np.max((peak - self.values) / peak) * 100)
+
+
+class VectorBackTesting:
+    """vector backtesting with the similar interface as BackTesting."""
+
+    def __init__(self, cash=1000000, varieties=None, commission=4):
+        self.cash = cash
+        self.varieties = varieties
+        self.commission = commission
+        self.arrays_by_variety = {}
+        self.signal = None
+        self.groups = list(varieties or {})
+        self.membership = None
+
+    def add_data(self, arrays, name):
+        """add the arrays of the variety."""
+        self.arrays_by_variety[name] = arrays
+
+    def add_strategy(self, strategy, *args, **kwargs):
+        """add the backtrader strategy or the vector signal class."""
+        signal_class = get_signal_class(strategy)
+        self.signal = signal_class(*args, **kwargs)
+
+    def _get_variety(self, name):
+        """get the multiplier and auto margin of the variety."""
+        for group in self.varieties.values():
+            if name in group:
+                return group[name]
+
+        raise exception.VarietyNotFound
+
+    def get_comminfo(self, name):
+        """get the commission info like set_default_commission_by_name."""
+        variety = self._get_variety(name)
+        # pylint: disable=unexpected-keyword-arg
+        return comminfo.CommInfoBase(
+            commission=self.commission,
+            mult=variety[types.MULTIPLIER],
+            commtype=comminfo.CommInfoBase.COMM_FIXED,
+            stocklike=False,
+            automargin=variety[types.AUTO_MARGIN])
+
+    def get_membership(self, names):
+        """get the group membership matrix of the names."""
+        group_names = {}
+        for group_name, group_value in (self.varieties or {}).items():
+            for variety in group_value:
+                group_names.setdefault(variety, group_name)
+
+        return sizing.get_membership(names, self.groups, group_names)
+
+    def run(self):
+        """run the vector backtesting."""
+        panel = Panel.from_arrays(self.arrays_by_variety)
+        atr, rules, start = self.signal.compute(panel)
+        self.membership = self.get_membership(panel.names)
+        broker = VectorBroker(self.cash,
+                              [self.get_comminfo(n) for n in panel.names])
+
+        length = len(panel.dates)
+        values = np.zeros(length)
+        cash = np.zeros(length)
+        positions = np.zeros((length, len(panel.names)))
+        bankruptcy = False
+        for i in range(length):
+            broker.next(panel.open[i], panel.close[i], panel.present[i])
+            values[i] = broker.get_value(panel.close[i])
+            cash[i] = broker.cash
+            positions[i] = broker.sizes
+
+            if i < start or bankruptcy:
+                continue
+
+            if values[i] <= 0 and cash[i] <= 0:
+                logger.error("bankruptcy, stop vector backtest!!!")
+                bankruptcy = True
+                continue
+
+            self._next(broker, panel, i, atr[i], rules, values[i])
+
+        logger.info("final portfolio value of vector backtest: %.2f",
+                    values[-1])
+        return VectorResult(panel.dates, panel.names, values, cash,
+                            positions, broker)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    # pylint: disable=too-many-locals
+    def _next(self, broker, panel, i, atr, rules, value):
+        """the state machine and the orders of BaseStrategy on the bar i."""
+        signal = self.signal
+        sizes = broker.sizes
+        valid = panel.valid[i] > 0
+        hold_long, hold_short = sizes > 0, sizes < 0
+        hold = hold_long | hold_short
+
+        # 1. compute the desired long and short symbols
+        desired_long = valid & (
+            (hold_long & ~rules.sell_to_close[i]) |
+            (~hold & rules.buy_to_open[i]))
+        desired_short = np.zeros(len(sizes), dtype=bool)
+        if signal.allow_short:
+            desired_short = valid & (
+                (hold_short & ~rules.buy_to_close[i]) |
+                (~hold & rules.sell_to_open[i]))
+
+        if (desired_long & desired_short).any():
+            raise exception.SymbolUnexpectedIntersectionError
+
+        # 2. determine whether need trade or not
+        if (np.array_equal(hold_long, desired_long) and
+                np.array_equal(hold_short, desired_short)):
+            return
+
+        # 3. compute the desired portfolios by atr
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sizes_by_atr = signal.risk_factor * value / (atr * broker.mults)
+        sizes_by_atr = np.trunc(np.where(np.isfinite(sizes_by_atr),
+                                         sizes_by_atr,
+                                         0))
+        desired = np.where(desired_long, sizes_by_atr, 0)
+        desired = np.where(desired_short, -sizes_by_atr, desired)
+        in_desired = desired_long | desired_short
+
+        # 4. adjust the desired portfolios by the group risk
+        order = broker.get_position_order()
+        if signal.group_risk_factors is not None:
+            desired = self.adjust_by_group(broker, desired, in_desired, atr,
+                                           value, order)
+
+        # 5. execute with the same order as BaseStrategy.execute, close the
+        # unwanted, reduce, increase the current symbols in the position
+        # order and then open the new symbols
+        current = order[valid[order]]
+        reduce = np.abs(sizes[current]) > np.abs(desired[current])
+        steps = (
+            current[~in_desired[current]],
+            current[in_desired[current] & reduce],
+            current[in_desired[current] & ~reduce],
+            np.flatnonzero(~(hold & valid) & in_desired & (desired != 0)),
+        )
+        for step in steps:
+            for index in step[desired[step] != sizes[step]]:
+                broker.submit(index,
+                              int(desired[index] - sizes[index]),
+                              panel.close[i, index])
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def adjust_by_group(self, broker, desired, in_desired, atr, value, order):
+        """adjust the desired sizes like adjust_portfolio_by_group."""
+        limits = sizing.get_group_limits(self.groups,
+                                         self.signal.group_risk_factors,
+                                         self.membership,
+                                         in_desired)
+        return sizing.adjust_sizes_by_group(desired,
+                                            broker.sizes,
+                                            atr,
+                                            broker.mults,
+                                            value,
+                                            self.membership,
+                                            limits,
+                                            current_order=order)
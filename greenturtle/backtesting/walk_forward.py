@@ -0,0 +1,324 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+walk forward analysis of the strategy.
+
+The history is split into the train and test windows, the train window is
+rolling with the fixed length or expanding from the start date, and the test
+window follows the train window. The parameters are optimized by the metric
+on every train window, then the best parameters are evaluated on the
+following test window, finally the out of sample daily returns of all the
+test windows are stitched into one equity curve.
+
+All the train runs of all the windows are dispatched into the process pool,
+then all the test runs, the data is loaded once per worker by the loader,
+and every run only slices the prepared arrays by the dates. A run failing
+or killing its worker only fails itself, the same as the parameter sweep.
+
+Both the train and test runs start the warm up bars of the strategy with
+the parameters before the window so the indicators are ready, the strategy
+only trades from the window start, and the metrics of the returns are
+computed over the daily returns within the window, so the train and test
+metrics are comparable.
+"""
+
+import collections
+import datetime
+import math
+
+import numpy as np
+import pandas as pd
+
+from greenturtle.backtesting import backtesting
+from greenturtle.backtesting import sweep
+from greenturtle.util import calendar
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+ROLLING = "rolling"
+EXPANDING = "expanding"
+
+Window = collections.namedtuple(
+    "Window", ["train_start", "train_end", "test_start", "test_end"])
+
+
+def _add_months(date, months):
+    """add the months to the datetime."""
+    return (pd.Timestamp(date) + pd.DateOffset(months=months)).to_pydatetime()
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def get_windows(start_date,
+                end_date,
+                train_months,
+                test_months,
+                mode=ROLLING):
+    """split the history into the train and test windows."""
+    if mode not in (ROLLING, EXPANDING):
+        raise ValueError(f"unknown walk forward mode {mode}")
+
+    one_day = datetime.timedelta(days=1)
+    windows = []
+    test_start = _add_months(start_date, train_months)
+    while test_start <= end_date:
+        train_start = start_date
+        if mode == ROLLING:
+            train_start = _add_months(test_start, -train_months)
+
+        test_end = min(_add_months(test_start, test_months) - one_day,
+                       end_date)
+        windows.append(Window(train_start,
+                              test_start - one_day,
+                              test_start,
+                              test_end))
+        test_start = _add_months(test_start, test_months)
+
+    return windows
+
+
+def get_window_returns(b, window_start):
+    """get the daily returns of the backtesting within the window."""
+    return_summary = b.summary.return_summary
+    days_return = {}
+    if return_summary is not None and return_summary.days_return:
+        days_return = return_summary.days_return
+
+    returns = pd.Series({pd.Timestamp(k): v / 100
+                         for k, v in days_return.items()}, dtype=float)
+    return returns[returns.index >= pd.Timestamp(window_start)]
+
+
+def run_train(task):
+    """
+    run the train window with the sample and return the metrics row, the
+    metrics of the returns are over the daily returns within the window if
+    the DaysTimeReturn analyzer is in the profile.
+    """
+    key, params, options = task
+    try:
+        b = sweep.run_params(params, options)
+    # pylint: disable=broad-except
+    except Exception as e:
+        logger.exception("walk forward train %s failed", key)
+        return sweep.get_failed_row(task, str(e))
+
+    row = {sweep.KEY: key, sweep.ERROR: None}
+    row.update(params)
+    row.update(b.summary.get_metrics())
+    row.update(get_metrics(get_window_returns(b, options["window_start"])))
+    return row
+
+
+def get_failed_test(task, error):
+    """get the result of the failed test window."""
+    index, _, _ = task
+    return index, None, error
+
+
+def run_test(task):
+    """
+    run the test window with the best parameters and return the daily
+    returns within the test window, or the error if failed.
+    """
+    index, params, options = task
+    try:
+        b = sweep.run_params(params, options)
+    # pylint: disable=broad-except
+    except Exception as e:
+        logger.exception("walk forward test %s failed", index)
+        return get_failed_test(task, str(e))
+
+    return index, get_window_returns(b, options["window_start"]), None
+
+
+def get_metrics(returns, periods=252):
+    """get the metrics of the stitched daily returns."""
+    if len(returns) == 0:
+        return {}
+
+    equity = (1 + returns).cumprod()
+    peak = equity.cummax()
+    std = returns.std()
+    years = len(returns) / periods
+    return {
+        "total_return": (equity.iloc[-1] - 1) * 100,
+        "annual_return": (equity.iloc[-1] ** (1 / years) - 1) * 100,
+        "max_draw_down": ((peak - equity) / peak).max() * 100,
+        "sharpe_ratio": (returns.mean() / std * math.sqrt(periods)
+                         if std > 0 else None),
+    }
+
+
+# pylint: disable=too-few-public-methods
+class WalkForwardResult:
+    """result of the walk forward analysis."""
+
+    def __init__(self, windows, returns):
+        self.windows = windows
+        self.returns = returns
+        self.equity = (1 + returns).cumprod()
+        self.metrics = get_metrics(returns)
+
+
+# pylint: disable=too-many-instance-attributes
+class WalkForward:
+    """walk forward analysis built on BackTesting."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self,
+                 strategy,
+                 samples,
+                 loader,
+                 windows,
+                 loader_kwargs=None,
+                 strategy_kwargs=None,
+                 varieties=None,
+                 cash=1000000,
+                 objective="sharpe_ratio",
+                 maximize=True,
+                 processes=None,
+                 profile=backtesting.FULL):
+        self.strategy = strategy
+        self.samples = samples
+        self.loader = loader
+        self.windows = windows
+        self.loader_kwargs = loader_kwargs or {}
+        self.strategy_kwargs = strategy_kwargs or {}
+        self.varieties = varieties
+        self.cash = cash
+        self.objective = objective
+        self.maximize = maximize
+        self.processes = processes
+        self.profile = profile
+
+    def get_warmup_start(self, window_start, params):
+        """
+        get the start date of the run, which covers the warm up bars of the
+        strategy with the params before the window start.
+        """
+        bars = self.strategy.get_warmup_bars(
+            **dict(self.strategy_kwargs, **params))
+        start_date = calendar.get_cn_start_date_by_bars(
+            pd.Timestamp(window_start).date(), bars)
+        return datetime.datetime.combine(start_date, datetime.time())
+
+    def _get_options(self, window_start, window_end, profile, params):
+        """
+        get the options of the run with the params, which starts the warm
+        up bars before the window and trades from the window start.
+        """
+        strategy_kwargs = dict(self.strategy_kwargs,
+                               trade_start_date=window_start)
+        return {
+            "strategy": self.strategy,
+            "strategy_kwargs": strategy_kwargs,
+            "varieties": self.varieties,
+            "cash": self.cash,
+            "fromdate": self.get_warmup_start(window_start, params),
+            "todate": window_end,
+            "profile": profile,
+            "window_start": window_start,
+        }
+
+    def get_train_tasks(self):
+        """get the train tasks of all the samples of all the windows."""
+        tasks = []
+        for i, window in enumerate(self.windows):
+            for params in self.samples:
+                key = f"{i}:{sweep.get_sample_key(params)}"
+                options = self._get_options(window.train_start,
+                                            window.train_end,
+                                            self.profile,
+                                            params)
+                tasks.append((key, params, options))
+
+        return tasks
+
+    def get_test_tasks(self, best):
+        """get the test tasks of the windows with the best parameters."""
+        tasks = []
+        for i, params in best.items():
+            window = self.windows[i]
+            # only the daily returns are used in the test window
+            options = self._get_options(window.test_start,
+                                        window.test_end,
+                                        backtesting.RETURNS_ONLY,
+                                        params)
+            tasks.append((i, params, options))
+
+        return tasks
+
+    def select_best(self, rows):
+        """select the best parameters of every window by the objective."""
+        best = {}
+        sign = 1 if self.maximize else -1
+        for i in range(len(self.windows)):
+            candidates = [row for row in rows
+                          if row[sweep.KEY].split(":", 1)[0] == str(i) and
+                          row[sweep.ERROR] is None and
+                          row[self.objective] is not None and
+                          not np.isnan(row[self.objective])]
+            if not candidates:
+                logger.warning("no valid train result of window %d", i)
+                continue
+
+            row = max(candidates, key=lambda r: sign * r[self.objective])
+            best[i] = ({name: row[name] for name in self.samples[0]},
+                       row[self.objective])
+
+        return best
+
+    def _map(self, func, tasks, on_broken):
+        """run the tasks in the pool, or inline with one process."""
+        return sweep.map_in_pool(func,
+                                 tasks,
+                                 self.loader,
+                                 self.loader_kwargs,
+                                 processes=self.processes,
+                                 on_broken=on_broken)
+
+    def run(self):
+        """run the walk forward analysis."""
+        rows = list(self._map(run_train,
+                              self.get_train_tasks(),
+                              sweep.get_failed_row))
+        best = self.select_best(rows)
+
+        test_tasks = self.get_test_tasks(
+            {i: params for i, (params, _) in best.items()})
+        tests = {index: (test_returns, error)
+                 for index, test_returns, error in self._map(
+                     run_test, test_tasks, get_failed_test)}
+
+        records, returns = [], []
+        for i, window in enumerate(self.windows):
+            record = window._asdict()
+            params, train_value = best.get(i, (None, None))
+            record["params"] = params
+            record["train_" + self.objective] = train_value
+
+            test_returns, record["test_error"] = tests.get(i, (None, None))
+            if test_returns is not None and len(test_returns) > 0:
+                record["test_return"] = \
+                    ((1 + test_returns).prod() - 1) * 100
+                returns.append(test_returns)
+            records.append(record)
+
+        returns = (pd.concat(returns).sort_index() if returns
+                   else pd.Series(dtype=float))
+        return WalkForwardResult(pd.DataFrame(records), returns)
@@ -0,0 +1,160 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+batch backtesting of the strategies on every variety in the whitelist,
+for example
+
+    greenturtle-batch --strategy ema --strategy channel \\
+        --param risk_factor=0.02 --skip PS --timeout 600 \\
+        --output batch.csv --correlation correlation.csv
+
+the jobs are named strategy:variety if more than one strategy is given,
+otherwise by the variety. The succeeded jobs are saved into the result
+store if result_store is set in the config, and every job is profiled
+into the directory by --profiler-dir, or by the profiler in the config.
+"""
+
+import argparse
+import datetime
+import functools
+
+from greenturtle.backtesting import backtesting
+from greenturtle.backtesting import batch
+from greenturtle.backtesting import result_store
+from greenturtle.backtesting import runner
+from greenturtle.cmd import sweep
+from greenturtle.data.datafeed import db
+from greenturtle.util import config
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+
+parser = argparse.ArgumentParser(
+    prog='GreenTurtle for trading',
+    description='batch backtesting of the strategies per variety')
+
+parser.add_argument(
+    "--conf",
+    type=str,
+    default="/etc/greenturtle/greenturtle.yaml",
+    help="config file for greenturtle"
+)
+parser.add_argument("--strategy", action="append",
+                    choices=sorted(sweep.STRATEGIES), default=None)
+parser.add_argument("--param", action="append", default=[],
+                    help="name=value of the strategy params")
+parser.add_argument("--skip", action="append", default=[],
+                    help="variety to skip")
+parser.add_argument("--start-date", type=datetime.date.fromisoformat,
+                    default=datetime.date(2006, 1, 1))
+parser.add_argument("--end-date", type=datetime.date.fromisoformat,
+                    default=datetime.date(2024, 12, 31))
+parser.add_argument("--processes", type=int, default=None)
+parser.add_argument("--timeout", type=float, default=None,
+                    help="seconds of every job")
+parser.add_argument("--output", type=str, default="batch.csv")
+parser.add_argument("--correlation", type=str, default=None,
+                    help="csv file of the return correlation of the jobs")
+parser.add_argument("--cache-dir", type=str, default=None)
+parser.add_argument("--profile", type=str, default=backtesting.FULL,
+                    help="analyzer profile, or the comma separated "
+                         "analyzer names")
+parser.add_argument("--profiler-dir", type=str, default=None,
+                    help="directory of the profiles of every job, "
+                         "override the profiler in the config")
+parser.add_argument("--trace-memory", action="store_true",
+                    help="trace the memory of the phases when profiling")
+
+
+def parse_params(params):
+    """parse the name=value params."""
+    result = {}
+    for param in params:
+        name, value = param.split("=", 1)
+        result[name] = sweep.parse_value(value)
+
+    return result
+
+
+def get_jobs(strategies, params, names):
+    """get one job per strategy and variety."""
+    jobs = []
+    for strategy in strategies:
+        for name in names:
+            job_name = name
+            if len(strategies) > 1:
+                job_name = f"{strategy}:{name}"
+            jobs.append(batch.Job(sweep.STRATEGIES[strategy],
+                                  params,
+                                  [name],
+                                  job_name))
+
+    return jobs
+
+
+def get_data_version(loader_kwargs):
+    """get the data version of the varieties by the loader kwargs."""
+    return functools.partial(db.get_data_version,
+                             loader_kwargs["db_conf"],
+                             source=loader_kwargs["source"],
+                             country=loader_kwargs["country"],
+                             start_date=loader_kwargs["start_date"],
+                             end_date=loader_kwargs["end_date"])
+
+
+def main():
+    """main function"""
+    args = parser.parse_args()
+    conf = config.load_config(args.conf)
+
+    varieties_map, group_risk_factors = \
+        sweep.get_varieties_and_group_risk_factors(conf)
+    strategy_kwargs = sweep.get_strategy_kwargs(conf, group_risk_factors)
+    names = [name for name in sweep.get_whitelist_names(conf, varieties_map)
+             if name not in args.skip]
+    loader_kwargs = sweep.get_loader_kwargs(conf, args, names)
+
+    jobs = get_jobs(args.strategy or ["ema"],
+                    parse_params(args.param),
+                    names)
+    b = batch.BatchBackTesting(jobs,
+                               runner.load_arrays_from_db,
+                               loader_kwargs=loader_kwargs,
+                               strategy_kwargs=strategy_kwargs,
+                               varieties=varieties_map,
+                               processes=args.processes,
+                               timeout=args.timeout,
+                               profile=sweep.parse_profile(args.profile),
+                               result_store=result_store.get_result_store(
+                                   conf),
+                               get_data_version=get_data_version(
+                                   loader_kwargs),
+                               **sweep.get_profiler_kwargs(conf, args))
+    results, return_summaries = b.run()
+    results.to_csv(args.output, index=False)
+    logger.info("save %d batch results to %s", len(results), args.output)
+    logger.info("\n%s", results.to_string())
+
+    if args.correlation is not None and return_summaries:
+        corr = batch.get_correlation(return_summaries).compute_correlation()
+        corr.to_csv(args.correlation)
+        logger.info("save the correlation to %s", args.correlation)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ import argparse
 # stupid tqsdk must be import first, otherwise it will flush the logs
 # pylint: disable=unused-import
 import tqsdk  # noqa F401
+import munch
 
 from greenturtle.util import config
 from greenturtle.server import server
@@ -36,6 +37,11 @@ parser.add_argument(
     default="/etc/greenturtle/greenturtle.yaml",
     help="config file for greenturtle"
 )
+parser.add_argument("--profiler-dir", type=str, default=None,
+                    help="directory of the profiles of every trading run, "
+                         "override the profiler in the config")
+parser.add_argument("--trace-memory", action="store_true",
+                    help="trace the memory of the phases when profiling")
 
 
 def main():
@@ -43,6 +49,9 @@ def main():
     # load config
     args = parser.parse_args()
     conf = config.load_config(args.conf)
+    if args.profiler_dir is not None:
+        conf.profiler = munch.Munch(output_dir=args.profiler_dir,
+                                    trace_memory=args.trace_memory)
 
     # serving
     s = server.Server(conf)
@@ -0,0 +1,221 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+parameter sweep of the strategy, for example
+
+    greenturtle-sweep --strategy ema_enhanced \\
+        --param fast_period=10,20 --param slow_period=100,150 \\
+        --checkpoint sweep.csv --output result.csv
+
+with the random or latin hypercube sampler, the param is low:high
+
+    greenturtle-sweep --sampler lhs --samples 50 \\
+        --param channel_period=20:60 --param risk_factor=0.001:0.003
+
+only the analyzers of the profile are run, lean for the headline metrics,
+or the comma separated analyzer names
+
+    greenturtle-sweep --profile lean --param fast_period=10,20
+    greenturtle-sweep --profile Returns,DrawDown --param fast_period=10,20
+
+every sample is profiled into the directory by --profiler-dir, or by the
+profiler in the config
+
+    greenturtle-sweep --profiler-dir profile --param fast_period=10,20
+"""
+
+import argparse
+import datetime
+
+from greenturtle.backtesting import backtesting
+from greenturtle.backtesting import runner
+from greenturtle.backtesting import sweep
+from greenturtle.constants import types
+from greenturtle.constants import varieties
+from greenturtle.stragety import channel
+from greenturtle.stragety import ema
+from greenturtle.stragety import mim
+from greenturtle.util import config
+from greenturtle.util.logging import logging
+from greenturtle.util import profiler
+
+
+logger = logging.get_logger()
+
+STRATEGIES = {
+    "ema": ema.EMA,
+    "ema_enhanced": ema.EMAEnhanced,
+    "channel": channel.DonchianChannel,
+    "mim": mim.MIMStrategy,
+}
+
+
+# pylint: disable=R0801
+parser = argparse.ArgumentParser(
+    prog='GreenTurtle for trading',
+    description='parameter sweep of the strategy')
+
+parser.add_argument(
+    "--conf",
+    type=str,
+    default="/etc/greenturtle/greenturtle.yaml",
+    help="config file for greenturtle"
+)
+parser.add_argument("--strategy", choices=sorted(STRATEGIES),
+                    default="ema_enhanced")
+parser.add_argument("--param", action="append", default=[],
+                    help="name=v1,v2 for grid or name=low:high to sample")
+parser.add_argument("--sampler", choices=sweep.SAMPLERS, default=sweep.GRID)
+parser.add_argument("--samples", type=int, default=20)
+parser.add_argument("--seed", type=int, default=0)
+parser.add_argument("--start-date", type=datetime.date.fromisoformat,
+                    default=datetime.date(2006, 1, 1))
+parser.add_argument("--end-date", type=datetime.date.fromisoformat,
+                    default=datetime.date(2024, 12, 31))
+parser.add_argument("--processes", type=int, default=None)
+parser.add_argument("--checkpoint", type=str, default=None)
+parser.add_argument("--output", type=str, default="sweep.csv")
+parser.add_argument("--cache-dir", type=str, default=None)
+parser.add_argument("--profile", type=str, default=backtesting.FULL,
+                    help="analyzer profile, or the comma separated "
+                         "analyzer names")
+parser.add_argument("--profiler-dir", type=str, default=None,
+                    help="directory of the profiles of every backtesting, "
+                         "override the profiler in the config")
+parser.add_argument("--trace-memory", action="store_true",
+                    help="trace the memory of the phases when profiling")
+
+
+def parse_value(value):
+    """parse the value to int, float or keep the string."""
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            continue
+
+    return value
+
+
+def parse_profile(profile):
+    """parse the analyzer profile name or the comma separated names."""
+    if profile in backtesting.PROFILES:
+        return profile
+
+    return profile.split(",")
+
+
+def parse_space(params, sampler):
+    """parse the params to the grid or the sample space."""
+    space = {}
+    for param in params:
+        name, value = param.split("=", 1)
+        if sampler != sweep.GRID and ":" in value:
+            low, high = value.split(":", 1)
+            space[name] = (parse_value(low), parse_value(high))
+        else:
+            space[name] = [parse_value(v) for v in value.split(",")]
+
+    return space
+
+
+def get_varieties_and_group_risk_factors(conf):
+    """get the varieties and the group risk factors by the country."""
+    if conf.country == types.US:
+        return varieties.US_VARIETIES, varieties.DEFAULT_US_GROUP_RISK_FACTORS
+
+    return varieties.CN_VARIETIES, varieties.DEFAULT_CN_GROUP_RISK_FACTORS
+
+
+def get_strategy_kwargs(conf, group_risk_factors):
+    """get the strategy kwargs from the config."""
+    strategy_conf = conf.strategy or {}
+    return {
+        "risk_factor": strategy_conf.get("risk_factor",
+                                         varieties.DEFAULT_RISK_FACTOR),
+        "group_risk_factors": strategy_conf.get("group_risk_factors",
+                                                group_risk_factors),
+        "allow_short": strategy_conf.get("allow_short", True),
+    }
+
+
+def get_whitelist_names(conf, varieties_map):
+    """get the names of the varieties in the whitelist."""
+    whitelist = conf.whitelist or []
+    return [name for group in varieties_map.values() for name in group
+            if name in whitelist]
+
+
+def get_profiler_kwargs(conf, args):
+    """get the profiler kwargs of the backtesting by the args and config."""
+    options = profiler.get_options(conf)
+    if args.profiler_dir is not None:
+        options = {"output_dir": args.profiler_dir,
+                   "trace_memory": args.trace_memory}
+
+    return {"profiler_dir": options["output_dir"],
+            "trace_memory": options.get("trace_memory", False)}
+
+
+def get_loader_kwargs(conf, args, names):
+    """get the kwargs of runner.load_arrays_from_db."""
+    start_date = datetime.datetime.combine(args.start_date, datetime.time())
+    end_date = datetime.datetime.combine(args.end_date, datetime.time())
+    return {
+        "db_conf": conf.db,
+        "names": names,
+        "source": conf.source,
+        "country": conf.country,
+        "start_date": start_date,
+        "end_date": end_date,
+        "cache_dir": args.cache_dir,
+    }
+
+
+def main():
+    """main function"""
+    args = parser.parse_args()
+    conf = config.load_config(args.conf)
+
+    varieties_map, group_risk_factors = \
+        get_varieties_and_group_risk_factors(conf)
+    strategy_kwargs = get_strategy_kwargs(conf, group_risk_factors)
+    names = get_whitelist_names(conf, varieties_map)
+    loader_kwargs = get_loader_kwargs(conf, args, names)
+
+    space = parse_space(args.param, args.sampler)
+    samples = sweep.get_samples(args.sampler,
+                                space,
+                                n=args.samples,
+                                seed=args.seed)
+
+    s = sweep.Sweep(STRATEGIES[args.strategy],
+                    samples,
+                    runner.load_arrays_from_db,
+                    loader_kwargs=loader_kwargs,
+                    strategy_kwargs=strategy_kwargs,
+                    varieties=varieties_map,
+                    processes=args.processes,
+                    checkpoint=args.checkpoint,
+                    profile=parse_profile(args.profile),
+                    **get_profiler_kwargs(conf, args))
+    results = s.run()
+    results.to_csv(args.output, index=False)
+    logger.info("save %d sweep results to %s", len(results), args.output)
+
+
+if __name__ == "__main__":
+    main()
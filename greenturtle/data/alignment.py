@@ -0,0 +1,100 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+align and padding the data with the trading dates.
+
+The data is a dataframe indexed by datetime, it could come from the
+database, csv file or cache, so any datafeed could align the data with the
+trading dates before feeding.
+"""
+
+import numpy as np
+import pandas as pd
+
+from greenturtle.constants import types
+from greenturtle import exception
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+
+def validate_trading_dates(dates, trading_dates):
+    """validate all the dates are in the trading dates."""
+    trading_date_set = set(trading_dates)
+    for date in dates:
+        if date not in trading_date_set:
+            logger.error("%s not in trading dates", date)
+            raise exception.ValidateTradingDayError
+
+
+def get_padding_sources(index, trading_index):
+    """
+    get the source row position in index for every trading date.
+
+    The missing trading date copies the nearest previous row, or the
+    nearest next row if there is no previous one. Return the source
+    positions and the mask of the padding dates.
+    """
+    positions = index.get_indexer(trading_index)
+    padding = positions < 0
+
+    # forward fill the source position from old to new
+    filled = np.where(padding, -1, np.arange(len(trading_index)))
+    filled = np.maximum.accumulate(filled)
+    sources = np.where(filled >= 0,
+                       positions[np.maximum(filled, 0)],
+                       -1)
+
+    # backward fill the leading padding with the first row
+    first = np.argmax(~padding)
+    sources[sources < 0] = positions[first]
+
+    return sources, padding
+
+
+def align_and_padding(df, trading_dates, name=None):
+    """
+    1. align with the trading dates
+    2. padding if the date is missing in trading dates, the padding row
+       copies the nearest row with valid = 0 and adjust_factor = 1, which
+       means it's faking data, should not be used for trading.
+    """
+    if len(df) == 0:
+        return df
+
+    df = df.sort_index()
+    trading_index = pd.DatetimeIndex(trading_dates)
+    validate_trading_dates(df.index.normalize(), trading_index)
+
+    sources, padding = get_padding_sources(df.index.normalize(),
+                                           trading_index)
+
+    aligned = df.iloc[sources].copy()
+    aligned.index = df.index[sources].where(~padding, trading_index)
+    aligned.index.name = df.index.name
+
+    valid = aligned[types.VALID].to_numpy() \
+        if types.VALID in aligned.columns \
+        else np.ones(len(aligned), dtype=np.int64)
+    aligned[types.VALID] = np.where(padding, 0, valid)
+    if types.ADJUST_FACTOR in aligned.columns:
+        aligned.loc[padding, types.ADJUST_FACTOR] = 1
+
+    for date, source in zip(trading_index[padding], sources[padding]):
+        logger.warning("padding %s %s from %s", name, date, df.index[source])
+
+    return aligned
@@ -0,0 +1,174 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+on-disk cache for the prepared feed data.
+
+The prepared arrays (adjusted, aligned and validated) are stored as npz
+files, the file name is addressed by the content which defines the data,
+including variety, source, country, date range, padding flag and the data
+version stamp of the continuous contract table. Once the table changes, the
+data version changes and the cache is missed, then the stale files of the
+same variety are removed when the new one is written.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+# bump the version if the format of the prepared arrays changes
+CACHE_FORMAT_VERSION = 1
+VERSION_KEY = "__data_version__"
+SUFFIX = ".npz"
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def get_cache_key(variety,
+                  source,
+                  country,
+                  start_date,
+                  end_date,
+                  padding,
+                  data_version):
+    """get the content addressed cache key."""
+    content = {
+        "format": CACHE_FORMAT_VERSION,
+        "variety": variety,
+        "source": source,
+        "country": country,
+        "start_date": start_date,
+        "end_date": end_date,
+        "padding": bool(padding),
+        "data_version": data_version,
+    }
+    payload = json.dumps(content, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    return f"{get_cache_prefix(variety, source, country)}{digest}"
+
+
+def get_cache_prefix(variety, source, country):
+    """get the cache file prefix for the variety."""
+    return f"{variety}-{source}-{country}-"
+
+
+class FeedCache:
+    """local cache of the prepared feed arrays."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get_path(self, key):
+        """get the cache file path by key."""
+        return os.path.join(self.cache_dir, key + SUFFIX)
+
+    def get(self, key):
+        """get the arrays by key, return None if missed."""
+        path = self.get_path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as f:
+                arrays = {k: f[k] for k in f.files if k != VERSION_KEY}
+        # pylint: disable=broad-except
+        except Exception:
+            logger.warning("broken feed cache %s, ignore it", path)
+            return None
+
+        # mark the file as recently used for the prune
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return arrays
+
+    def put(self, key, arrays, data_version=None, prefix=None):
+        """
+        put the arrays to the cache, the file is written to a temporary
+        file then renamed to avoid partial file read by other processes.
+        """
+        path = self.get_path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=SUFFIX)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                values = dict(arrays)
+                values[VERSION_KEY] = np.array(str(data_version))
+                np.savez(f, **values)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        if prefix is not None:
+            self.remove_stale(prefix, data_version)
+
+    def remove_stale(self, prefix, data_version):
+        """remove the cache files with the prefix but other data version."""
+        for file_name in os.listdir(self.cache_dir):
+            if not (file_name.startswith(prefix) and
+                    file_name.endswith(SUFFIX)):
+                continue
+
+            path = os.path.join(self.cache_dir, file_name)
+            try:
+                with np.load(path, allow_pickle=False) as f:
+                    version = str(f[VERSION_KEY])
+            # pylint: disable=broad-except
+            except Exception:
+                version = None
+
+            if version != str(data_version):
+                logger.info("remove stale feed cache %s", path)
+                os.remove(path)
+
+    def prune(self, max_bytes):
+        """
+        remove the least recently used cache files until the total size of
+        the files is within max_bytes.
+        """
+        files = []
+        for file_name in os.listdir(self.cache_dir):
+            # skip the temporary files being written by the other processes
+            if (not file_name.endswith(SUFFIX) or
+                    file_name.startswith(tempfile.gettempprefix())):
+                continue
+            path = os.path.join(self.cache_dir, file_name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= max_bytes:
+                break
+            logger.info("remove least recently used cache %s", path)
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
@@ -0,0 +1,246 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+datafeed from columnar arrays.
+
+The arrays is a dict from column name to numpy array with the same length,
+the columns are
+- datetime: numpy datetime64 array, sorted from old to new
+- open, high, low, close, volume: numpy float array
+- open_interest: numpy float array, optional
+- valid: numpy int array, optional, 1 by default
+
+Instead of loading the bar one by one with _load, the whole arrays are
+copied into the line buffers during preload, so that the cerebro preload and
+runonce paths are used without any per bar python overhead.
+"""
+
+import backtrader as bt
+from backtrader import feed
+import numpy as np
+import pandas as pd
+
+from greenturtle.constants import types
+
+
+# backtrader date number of 1970-01-01
+EPOCH_NUM = 719163.0
+
+ARRAY_COLUMNS = (
+    types.DATETIME,
+    types.OPEN,
+    types.HIGH,
+    types.LOW,
+    types.CLOSE,
+    types.VOLUME,
+    types.OPEN_INTEREST,
+    types.VALID,
+)
+
+# line name in backtrader to column name in arrays
+LINE_COLUMNS = (
+    ("datetime", types.DATETIME),
+    ("open", types.OPEN),
+    ("high", types.HIGH),
+    ("low", types.LOW),
+    ("close", types.CLOSE),
+    ("volume", types.VOLUME),
+    ("openinterest", types.OPEN_INTEREST),
+    (types.VALID, types.VALID),
+)
+
+
+def datetime64_2_num(dates):
+    """convert numpy datetime64 array to backtrader date number array."""
+    dates = np.asarray(dates, dtype="datetime64[us]")
+    delta = dates - np.datetime64("1970-01-01", "us")
+    return delta / np.timedelta64(1, "D") + EPOCH_NUM
+
+
+def normalize_arrays(arrays):
+    """
+    normalize the arrays to float arrays with all the columns, the missing
+    open interest is nan and the missing valid is 1.
+    """
+    length = len(arrays[types.DATETIME])
+
+    normalized = {
+        types.DATETIME: np.asarray(arrays[types.DATETIME],
+                                   dtype="datetime64[us]"),
+    }
+    for column in ARRAY_COLUMNS[1:]:
+        if column in arrays and arrays[column] is not None:
+            values = np.asarray(arrays[column], dtype=np.float64)
+        elif column == types.VALID:
+            values = np.ones(length, dtype=np.float64)
+        else:
+            values = np.full(length, np.nan, dtype=np.float64)
+
+        if len(values) != length:
+            raise ValueError(f"{column} length mismatch with datetime")
+
+        normalized[column] = values
+
+    return normalized
+
+
+def dataframe_2_arrays(df):
+    """convert dataframe with datetime index to arrays."""
+    arrays = {types.DATETIME: df.index.values.astype("datetime64[us]")}
+    for column in ARRAY_COLUMNS[1:]:
+        if column in df.columns:
+            arrays[column] = df[column].to_numpy(dtype=np.float64)
+    return arrays
+
+
+def arrays_2_dataframe(arrays):
+    """convert arrays to dataframe with datetime index."""
+    columns = {k: v for k, v in arrays.items() if k != types.DATETIME}
+    index = pd.DatetimeIndex(arrays[types.DATETIME], name=types.DATETIME)
+    return pd.DataFrame(columns, index=index)
+
+
+class ArrayData(feed.DataBase):
+    """datafeed from columnar arrays."""
+
+    lines = types.CONTINUOUS_LINES
+
+    params = (
+        ("arrays", None),
+        ("plot", False),
+    )
+
+    _source = None
+    _arrays = None
+    _length = 0
+    _cursor = 0
+
+    def get_name(self):
+        """return data name"""
+        # pylint: disable=no-member
+        return self._name
+
+    def load_arrays(self):
+        """
+        return the columnar arrays, subclass could override it to load the
+        arrays from the database, file or cache.
+        """
+        # pylint: disable=no-member
+        return self.p.arrays
+
+    def _prepare_arrays(self):
+        """
+        convert the arrays to line values and filter them by fromdate and
+        todate, which are only available after start.
+        """
+        arrays = normalize_arrays(self._source)
+        nums = datetime64_2_num(arrays[types.DATETIME])
+
+        mask = (nums >= self.fromdate) & (nums <= self.todate)
+        columns = {types.DATETIME: nums[mask]}
+        for column in ARRAY_COLUMNS[1:]:
+            columns[column] = arrays[column][mask]
+
+        self._arrays = columns
+        self._length = len(columns[types.DATETIME])
+        self._cursor = 0
+        # the source is no longer needed after converted
+        self._source = None
+
+    def start(self):
+        """start the datafeed"""
+        super().start()
+        self._source = self.load_arrays()
+        self._arrays = None
+        self._length = 0
+        self._cursor = 0
+
+    def preload(self):
+        """copy the whole arrays into the line buffers in bulk."""
+        # filters may add or remove bars, fall back to load bar by bar.
+        # pylint: disable=no-member
+        if self._filters:
+            super().preload()
+            return
+
+        if self._arrays is None:
+            self._prepare_arrays()
+
+        for line_name, column in LINE_COLUMNS:
+            line = getattr(self.lines, line_name)
+            values = np.ascontiguousarray(self._arrays[column],
+                                          dtype=np.float64)
+            line.array.frombytes(values.tobytes())
+
+        self._cursor = self._length
+        # the arrays are copied into the line buffers, release them
+        self._arrays = {}
+        self._last()
+        self.home()
+
+    def qbuffer(self, savemem=0, replaying=False):
+        """
+        keep the whole lines even if exactbars is set, the bounded buffer of
+        backtrader loses the bar when the feed is rewound for missing the
+        datetime of the others, while the lines of the feed are only a few
+        float arrays.
+        """
+
+    def _load(self):
+        """load data every once, used when preload is disabled."""
+        if self._arrays is None:
+            self._prepare_arrays()
+
+        if self._cursor >= self._length:
+            # all the bars are loaded, release the arrays
+            self._arrays = {}
+            return False
+
+        i = self._cursor
+        for line_name, column in LINE_COLUMNS:
+            getattr(self.lines, line_name)[0] = self._arrays[column][i]
+
+        self._cursor += 1
+        return True
+
+
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def get_feed_from_arrays(name,
+                         arrays,
+                         timeframe=bt.TimeFrame.Days,
+                         fromdate=None,
+                         todate=None):
+    """get the datafeed from columnar arrays."""
+
+    # pylint: disable=unexpected-keyword-arg
+    data = ArrayData(
+        name=name,
+        arrays=arrays,
+        timeframe=timeframe,
+        fromdate=fromdate,
+        todate=todate,
+        plot=False,
+    )
+
+    return data
+
+
+def get_feed_from_dataframe(name, df, fromdate=None, todate=None):
+    """get the datafeed from dataframe with datetime index."""
+    return get_feed_from_arrays(name,
+                                dataframe_2_arrays(df),
+                                fromdate=fromdate,
+                                todate=todate)
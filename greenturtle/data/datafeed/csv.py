@@ -17,10 +17,22 @@
 """datafeed from csv file"""
 
 
+import datetime
+
 import backtrader as bt
 from backtrader.feeds import GenericCSVData
+import numpy as np
+import pandas as pd
 
 from greenturtle.constants import types
+from greenturtle.data.datafeed import array
+
+try:
+    # pylint: disable=unused-import
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
 
 
 CSV_CLASS_PARAM = (
@@ -48,6 +60,85 @@ class FutureCSV(GenericCSVData):
     params = CSV_CLASS_PARAM
 
 
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def read_csv_arrays(filename,
+                    fromdate=None,
+                    todate=None,
+                    dtformat=types.DATE_FORMAT,
+                    params=CSV_CLASS_PARAM,
+                    datetime_index=0):
+    """
+    read the csv file into arrays with the vectorized parser, the rows are
+    filtered by fromdate and todate before the conversion.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        names = f.readline().rstrip("\r\n").split(",")
+
+    indexes = dict(params)
+    columns = {names[datetime_index]: types.DATETIME}
+    for column in array.ARRAY_COLUMNS[1:]:
+        if indexes.get(column, -1) >= 0:
+            columns[names[indexes[column]]] = column
+
+    # the c engine is not exactly the same as float() by default
+    options = {"float_precision": "round_trip"} if CSV_ENGINE == "c" else {}
+    df = pd.read_csv(filename,
+                     usecols=list(columns.keys()),
+                     dtype={names[datetime_index]: str},
+                     engine=CSV_ENGINE,
+                     **options)
+    df = df.rename(columns=columns)
+
+    # the date format is sortable as string, filter before parsing
+    dates = df[types.DATETIME].str.strip()
+    if dtformat == types.DATE_FORMAT:
+        mask = pd.Series(True, index=df.index)
+        if fromdate is not None:
+            mask &= dates >= fromdate.strftime(dtformat)
+        if todate is not None:
+            mask &= dates <= todate.strftime(dtformat)
+        df, dates = df[mask], dates[mask]
+
+    df.index = pd.to_datetime(dates, format=dtformat)
+    return array.dataframe_2_arrays(df.drop(columns=[types.DATETIME]))
+
+
+class FastFutureCSV(array.ArrayData):
+    """
+    Future CSV data feed with the same column layout as FutureCSV, the
+    whole file is parsed by pandas and the lines are preloaded in bulk.
+    """
+
+    params = (
+        ("dataname", None),
+        ("dtformat", types.DATE_FORMAT),
+        ("datetime", 0),
+    ) + CSV_CLASS_PARAM
+
+    def load_arrays(self):
+        """read the arrays from the csv file"""
+        # pylint: disable=no-member
+        params = [(k, getattr(self.p, k)) for k, _ in CSV_CLASS_PARAM]
+        arrays = read_csv_arrays(self.p.dataname,
+                                 fromdate=self.p.fromdate,
+                                 todate=self.p.todate,
+                                 dtformat=self.p.dtformat,
+                                 params=params,
+                                 datetime_index=self.p.datetime)
+
+        # same as GenericCSVData, the daily bar is at the end of session
+        if self.p.timeframe >= bt.TimeFrame.Days:
+            dates = arrays[types.DATETIME]
+            sessionend = datetime.datetime.combine(datetime.date.min,
+                                                   self.p.sessionend)
+            sessionend -= datetime.datetime.min
+            arrays[types.DATETIME] = np.maximum(
+                dates,
+                dates.astype("datetime64[D]") + np.timedelta64(sessionend))
+
+        return arrays
+
+
 def get_feed_from_csv_file(
         name,
         filename,
@@ -62,12 +153,12 @@ def get_feed_from_csv_file(
     """
 
     # pylint: disable=R0801
-    data = FutureCSV(
+    data = FastFutureCSV(
         name=name,
         dataname=filename,
         dtformat=types.DATE_FORMAT,
         timeframe=timeframe,
-        datatime=0,
+        datetime=0,
         plot=False,
         fromdate=fromdate,
         todate=todate,
@@ -18,17 +18,14 @@
 from __future__ import (absolute_import, division, print_function,
                         unicode_literals)
 
-import copy
-from datetime import datetime
-
-from backtrader import feed
-from backtrader import date2num
-
 from greenturtle.constants import types
 from greenturtle.constants import varieties
+from greenturtle.data import alignment
+from greenturtle.data import cache
+from greenturtle.data.datafeed import array
+from greenturtle.data import transform
 from greenturtle.data import validation
 from greenturtle.db import api
-from greenturtle import exception
 from greenturtle.util import calendar
 from greenturtle.util.logging import logging
 
@@ -36,8 +33,13 @@ from greenturtle.util.logging import logging
 logger = logging.get_logger()
 
 
-class ContinuousContractDB(feed.DataBase):
-    """datafeed from continuous contract table in database"""
+class ContinuousContractDB(array.ArrayData):
+    """
+    datafeed from continuous contract table in database
+
+    The continuous contracts are adjusted, aligned and validated during
+    start, then converted to columnar arrays and preloaded in bulk.
+    """
 
     lines = types.CONTINUOUS_LINES
 
@@ -49,19 +51,17 @@ class ContinuousContractDB(feed.DataBase):
         (types.START_DATE, None),
         (types.END_DATE, None),
         ("padding", False),
+        ("cache_dir", None),
         ("plot", False),
     )
 
     @staticmethod
-    def _get_sort_dates(continuous_contracts, date_format=False):
+    def _get_sort_dates(continuous_contracts):
         """get sort date from the continuous contracts."""
 
         date_set = set()
         for continuous_contract in continuous_contracts:
             date = continuous_contract.date
-            if date_format:
-                date = date.date()
-
             if date not in date_set:
                 date_set.add(date)
 
@@ -70,16 +70,9 @@ class ContinuousContractDB(feed.DataBase):
         return dates
 
     @staticmethod
-    def _get_continuous_contracts_dict(continuous_contracts,
-                                       date_format=False):
+    def _get_continuous_contracts_dict(continuous_contracts):
         """get continuous contracts dict."""
-        d = {}
-        for c in continuous_contracts:
-            if date_format:
-                d[c.date.date()] = c
-            else:
-                d[c.date] = c
-        return d
+        return {c.date: c for c in continuous_contracts}
 
     def adjust_price(self, continuous_contracts):
         """adjust price according to the adjust factor."""
@@ -98,80 +91,20 @@ class ContinuousContractDB(feed.DataBase):
             continuous_contract.settle *= adjust_factor
             adjust_factor = adjust_factor * continuous_contract.adjust_factor
 
-    @staticmethod
-    def _validate_trading_dates(dates, trading_dates):
-        """validate trading dates"""
-        for date in dates:
-            if date not in trading_dates:
-                logger.error("%s not in trading dates", date)
-                raise exception.ValidateTradingDayError
-
-    def align_and_padding(self, continuous_contracts):
+    def align_and_padding(self, df):
         """
         1. align with the start date and end date
         2. padding if the date is missing in trading dates
         """
 
-        dates = self._get_sort_dates(continuous_contracts, date_format=True)
-        continuous_contracts_dict = self._get_continuous_contracts_dict(
-            continuous_contracts, date_format=True)
-
         # pylint: disable=no-member
         trading_dates = calendar.get_cn_trading_days(
             self.p.start_date.date(),
             self.p.end_date.date())
 
-        self._validate_trading_dates(dates, trading_dates)
-
-        # padding from old to new
-        prev = None
-        for trading_date in trading_dates:
-            if trading_date not in continuous_contracts_dict:
-                if prev is not None:
-                    # deep copy the previous and set the attributes
-                    # valid = 0 means it's faking data, should not be used
-                    # for trading
-                    padding = copy.deepcopy(prev)
-                    padding.date = datetime.combine(trading_date,
-                                                    datetime.min.time())
-                    padding.adjust_factor = 1
-                    padding.valid = 0
-
-                    # add padding to continuous_contracts and
-                    # continuous_contracts_dict
-                    continuous_contracts_dict[trading_date] = padding
-                    continuous_contracts.append(padding)
-                    logger.warning("padding %s %s from %s",
-                                   self.p.variety,
-                                   padding.date,
-                                   prev.date)
-                    # set prev
-                    prev = padding
-            else:
-                prev = continuous_contracts_dict[trading_date]
-
-        # padding from new to old
-        trading_dates.sort(reverse=True)
-        prev = None
-        for trading_date in trading_dates:
-            if trading_date not in continuous_contracts_dict:
-                if prev is not None:
-                    # deep copy the previous and set the attributes
-                    # valid = 0 means it's faking data, should not be used
-                    # for trading
-                    padding = copy.deepcopy(prev)
-                    padding.date = datetime.combine(trading_date,
-                                                    datetime.min.time())
-                    padding.valid = 0
-                    # add padding to continuous_contracts and
-                    # continuous_contracts_dict
-                    padding.adjust_factor = 1
-                    continuous_contracts_dict[trading_date] = padding
-                    continuous_contracts.append(padding)
-                    # set prev
-                    prev = padding
-            else:
-                prev = continuous_contracts_dict[trading_date]
+        return alignment.align_and_padding(df,
+                                           trading_dates,
+                                           name=self.p.variety)
 
     @staticmethod
     def validate(continuous_contracts):
@@ -190,12 +123,53 @@ class ContinuousContractDB(feed.DataBase):
 
             pre = cur
 
-    def start(self):
-        """start the datafeed"""
-        super().start()
+    def load_arrays(self):
+        """
+        load the continuous contracts as arrays, the prepared arrays are
+        read from the feed cache if cache_dir is set and the data version
+        is not changed.
+        """
 
-        # pylint: disable=no-member, line-too-long
+        # pylint: disable=no-member
         dbapi = api.DBAPI(self.p.db_conf)
+        if self.p.cache_dir is None:
+            return self.load_arrays_from_db(dbapi)
+
+        # the version stamps the whole variety instead of the date range, so
+        # the caches of the other ranges are still valid and kept by the
+        # prune until any row of the variety changes.
+        # pylint: disable=no-member, line-too-long
+        get_version = dbapi.continuous_contract_get_version_by_variety_source_country  # noqa: E501
+        data_version = get_version(self.p.variety,
+                                   self.p.source,
+                                   self.p.country)
+        key = cache.get_cache_key(self.p.variety,
+                                  self.p.source,
+                                  self.p.country,
+                                  self.p.start_date,
+                                  self.p.end_date,
+                                  self.p.padding,
+                                  data_version)
+
+        feed_cache = cache.FeedCache(self.p.cache_dir)
+        arrays = feed_cache.get(key)
+        if arrays is not None:
+            logger.info("%s load data from feed cache", self.p.variety)
+            return arrays
+
+        arrays = self.load_arrays_from_db(dbapi)
+        feed_cache.put(key,
+                       arrays,
+                       data_version=data_version,
+                       prefix=cache.get_cache_prefix(self.p.variety,
+                                                     self.p.source,
+                                                     self.p.country))
+        return arrays
+
+    def load_arrays_from_db(self, dbapi):
+        """load the continuous contracts from database as arrays."""
+
+        # pylint: disable=no-member, line-too-long
         getter = dbapi.continuous_contract_get_by_variety_source_country_start_end_date  # noqa: E501
 
         # pylint: disable=no-member
@@ -211,38 +185,94 @@ class ContinuousContractDB(feed.DataBase):
                     self.p.variety,
                     len(continuous_contracts))
 
-        # do align and padding
-        if self.p.padding:
-            self.align_and_padding(continuous_contracts)
-            logger.info("after align and padding, %s data length %d",
-                        self.p.variety,
-                        len(continuous_contracts))
-
         # sort the continuous contracts
         continuous_contracts.sort(key=lambda x: x.date)
 
-        # validation before feed
+        # validation before feed, the padding rows only repeat the
+        # validated rows so that it's no need to validate them again.
         self.validate(continuous_contracts)
 
-        # pylint: disable=attribute-defined-outside-init
-        self.iter = iter(continuous_contracts)
-
-    def _load(self):
-        """load data every once"""
-        try:
-            continuous_contract = next(self.iter)
-        except StopIteration:
-            return False
+        df = array.arrays_2_dataframe(
+            transform.continuous_contracts_2_arrays(continuous_contracts))
+        # release the orm objects before padding
+        del continuous_contracts
 
-        # pylint: disable=no-member
-        self.l.datetime[0] = date2num(continuous_contract.date)
-        self.l.open[0] = continuous_contract.open
-        self.l.high[0] = continuous_contract.high
-        self.l.low[0] = continuous_contract.low
-        self.l.close[0] = continuous_contract.close
-        self.l.volume[0] = continuous_contract.volume
-        self.l.valid[0] = 1
-        if hasattr(continuous_contract, "valid"):
-            self.l.valid[0] = continuous_contract.valid
-
-        return True
+        # do align and padding
+        if self.p.padding:
+            df = self.align_and_padding(df)
+            logger.info("after align and padding, %s data length %d",
+                        self.p.variety,
+                        len(df))
+
+        return array.dataframe_2_arrays(df)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def get_arrays_from_db(db_conf,
+                       variety,
+                       source,
+                       country,
+                       start_date,
+                       end_date,
+                       padding=False,
+                       cache_dir=None):
+    """get the prepared arrays of the variety from the database."""
+
+    # pylint: disable=unexpected-keyword-arg
+    data = ContinuousContractDB(db_conf=db_conf,
+                                variety=variety,
+                                source=source,
+                                country=country,
+                                start_date=start_date,
+                                end_date=end_date,
+                                padding=padding,
+                                cache_dir=cache_dir)
+
+    return data.load_arrays()
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def get_arrays_by_variety_from_db(db_conf,
+                                  names,
+                                  source,
+                                  country,
+                                  start_date,
+                                  end_date,
+                                  padding=False,
+                                  cache_dir=None):
+    """get the prepared arrays of all the varieties from the database."""
+    return {name: get_arrays_from_db(db_conf,
+                                     name,
+                                     source,
+                                     country,
+                                     start_date,
+                                     end_date,
+                                     padding=padding,
+                                     cache_dir=cache_dir)
+            for name in names}
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def get_data_version(db_conf,
+                     names,
+                     source,
+                     country,
+                     start_date=None,
+                     end_date=None):
+    """
+    get the data version stamp of the varieties in the date range, the same
+    stamp as the feed cache per variety joined by the name.
+    """
+    dbapi = api.DBAPI(db_conf)
+    # pylint: disable=line-too-long
+    get_version = dbapi.continuous_contract_get_version_by_variety_source_country  # noqa: E501
+    versions = []
+    for name in names:
+        version = get_version(name,
+                              source,
+                              country,
+                              start_date=start_date,
+                              end_date=end_date)
+        versions.append(f"{name}@{version}")
+
+    return ",".join(versions)
@@ -0,0 +1,60 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""datafeed from the memory mapped history store"""
+
+import backtrader as bt
+
+from greenturtle.data.datafeed import array
+from greenturtle.data import history_store
+
+
+class HistoryStoreData(array.ArrayData):
+    """datafeed which reads the arrays from the memory mapped store."""
+
+    params = (
+        ("root", None),
+        ("variety", None),
+    )
+
+    def load_arrays(self):
+        """read the arrays from the memory map between fromdate and todate"""
+        # pylint: disable=no-member
+        store = history_store.HistoryStore(self.p.root)
+        return store.get_arrays(self.p.variety,
+                                start_date=self.p.fromdate,
+                                end_date=self.p.todate)
+
+
+# pylint: disable=too-many-positional-arguments,too-many-arguments
+def get_feed_from_history_store(root,
+                                variety,
+                                timeframe=bt.TimeFrame.Days,
+                                fromdate=None,
+                                todate=None):
+    """get the datafeed of the variety from the history store."""
+
+    # pylint: disable=unexpected-keyword-arg, R0801
+    data = HistoryStoreData(
+        name=variety,
+        root=root,
+        variety=variety,
+        timeframe=timeframe,
+        fromdate=fromdate,
+        todate=todate,
+        plot=False,
+    )
+
+    return data
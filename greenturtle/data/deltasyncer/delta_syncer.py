@@ -27,6 +27,7 @@ from greenturtle.data import transform
 from greenturtle import exception
 from greenturtle.util import calendar
 from greenturtle.util.logging import logging
+from greenturtle.util import profiler
 from greenturtle.util import util
 
 
@@ -105,14 +106,17 @@ class DeltaSyncer:
             logger.info("skip sync delta contract since already synced")
             return
 
-        symbols_expire = self._get_symbols_expire(types.CN_EXCHANGES)
+        with profiler.phase("delta_syncer.symbols_expire"):
+            symbols_expire = self._get_symbols_expire(types.CN_EXCHANGES)
 
-        df_map = self._get_contract_df_map(types.CN_EXCHANGES)
+        with profiler.phase("delta_syncer.download"):
+            df_map = self._get_contract_df_map(types.CN_EXCHANGES)
 
         # format the contract data
-        contracts = self._format_contracts(types.CN_EXCHANGES,
-                                           df_map,
-                                           symbols_expire)
+        with profiler.phase("delta_syncer.format"):
+            contracts = self._format_contracts(types.CN_EXCHANGES,
+                                               df_map,
+                                               symbols_expire)
         if contracts is None:
             logger.warning("skip synchronize delta contracts due to"
                            "empty contract in some exchange")
@@ -121,8 +125,10 @@ class DeltaSyncer:
             logger.info("skip synchronize delta contract with empty contract")
             return
 
-        self._validate_contracts(contracts)
-        self._write_contracts_to_database(contracts)
+        with profiler.phase("delta_syncer.validate"):
+            self._validate_contracts(contracts)
+        with profiler.phase("delta_syncer.write"):
+            self._write_contracts_to_database(contracts)
 
     @staticmethod
     def _get_symbols_expire(exchanges):
@@ -315,4 +321,5 @@ class DeltaSyncer:
             for variety in group:
                 c = continuous_contract.DeltaContinuousContract(
                     variety, self.conf.source, self.conf.country, self.dbapi)
-                c.generate()
+                with profiler.phase("delta_syncer.continuous_contracts"):
+                    c.generate()
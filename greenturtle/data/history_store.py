@@ -0,0 +1,200 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+memory mapped binary history store of the continuous contracts.
+
+Every variety is stored as fixed width numpy structured records in a binary
+file, sorted by datetime, and a small json index records the file, length
+and date range of every variety, the layout is
+
+    root/
+        index.json
+        RB.bin
+        AU.bin
+        ...
+
+The binary file is opened by np.memmap, so opening many varieties only
+costs page faults rather than parsing, and the repeated runs benefit from
+the OS page cache.
+"""
+
+import datetime
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from greenturtle.constants import types
+from greenturtle.data.datafeed import array
+from greenturtle.data.datafeed import db
+from greenturtle import exception
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+STORE_FORMAT_VERSION = 1
+INDEX_FILE = "index.json"
+SUFFIX = ".bin"
+
+RECORD_DTYPE = np.dtype(
+    [(types.DATETIME, "<M8[us]")] +
+    [(column, "<f8") for column in array.ARRAY_COLUMNS[1:]])
+
+
+def _atomic_write(path, write):
+    """write to the temporary file then rename it to the path."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def arrays_2_records(arrays):
+    """convert the arrays to the structured records."""
+    arrays = array.normalize_arrays(arrays)
+    records = np.empty(len(arrays[types.DATETIME]), dtype=RECORD_DTYPE)
+    for column in array.ARRAY_COLUMNS:
+        records[column] = arrays[column]
+
+    return np.sort(records, order=types.DATETIME, kind="stable")
+
+
+class HistoryStore:
+    """memory mapped binary history store."""
+
+    def __init__(self, root):
+        self.root = root
+        self.index_path = os.path.join(self.root, INDEX_FILE)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        """load the index, return the empty index if not existed."""
+        if not os.path.exists(self.index_path):
+            return {"version": STORE_FORMAT_VERSION, "varieties": {}}
+
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+
+        if index.get("version") != STORE_FORMAT_VERSION:
+            raise ValueError(f"unsupported history store version "
+                             f"{index.get('version')}")
+
+        return index
+
+    def _save_index(self):
+        """save the index atomically."""
+        payload = json.dumps(self.index, indent=2, sort_keys=True)
+        _atomic_write(self.index_path,
+                      lambda f: f.write(payload.encode("utf-8")))
+
+    def get_varieties(self):
+        """get all the varieties in the store."""
+        return sorted(self.index["varieties"].keys())
+
+    def get_date_range(self, variety):
+        """get the start and end date of the variety."""
+        meta = self._get_meta(variety)
+        if meta["length"] == 0:
+            return None, None
+
+        return (datetime.datetime.fromisoformat(meta["start"]),
+                datetime.datetime.fromisoformat(meta["end"]))
+
+    def _get_meta(self, variety):
+        """get the meta data of the variety in the index."""
+        if variety not in self.index["varieties"]:
+            raise exception.VarietyNotFound
+
+        return self.index["varieties"][variety]
+
+    def write(self, variety, arrays):
+        """write the arrays of the variety to the store."""
+        os.makedirs(self.root, exist_ok=True)
+        records = arrays_2_records(arrays)
+
+        file_name = variety + SUFFIX
+        _atomic_write(os.path.join(self.root, file_name),
+                      lambda f: f.write(records.tobytes()))
+
+        dates = records[types.DATETIME]
+        self.index["varieties"][variety] = {
+            "file": file_name,
+            "length": len(records),
+            "start": str(dates[0]) if len(records) > 0 else None,
+            "end": str(dates[-1]) if len(records) > 0 else None,
+        }
+        self._save_index()
+
+        logger.info("write %d records of %s to history store",
+                    len(records), variety)
+
+    def read(self, variety):
+        """read the records of the variety by memory map."""
+        meta = self._get_meta(variety)
+        if meta["length"] == 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+
+        path = os.path.join(self.root, meta["file"])
+        return np.memmap(path,
+                         dtype=RECORD_DTYPE,
+                         mode="r",
+                         shape=(meta["length"],))
+
+    def get_arrays(self, variety, start_date=None, end_date=None):
+        """
+        get the arrays of the variety between start date and end date, the
+        arrays are views of the memory map.
+        """
+        records = self.read(variety)
+        dates = records[types.DATETIME]
+
+        begin, end = 0, len(records)
+        if start_date is not None:
+            begin = np.searchsorted(dates,
+                                    np.datetime64(start_date, "us"),
+                                    side="left")
+        if end_date is not None:
+            end = np.searchsorted(dates,
+                                  np.datetime64(end_date, "us"),
+                                  side="right")
+
+        records = records[begin:end]
+        return {column: records[column] for column in array.ARRAY_COLUMNS}
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def export_from_db(db_conf,
+                   root,
+                   names,
+                   source,
+                   country,
+                   start_date,
+                   end_date,
+                   padding=False):
+    """export the continuous contracts from the database to the store."""
+    store = HistoryStore(root)
+    for name in names:
+        arrays = db.get_arrays_from_db(db_conf, name, source, country,
+                                       start_date, end_date, padding=padding)
+        store.write(name, arrays)
+
+    return store
@@ -335,6 +335,7 @@ class ContinuousContract:
                 cur.high,
                 cur.low,
                 2 * varieties.DEFAULT_CN_DAILY_LIMIT)
+            pre = cur
 
     def _validate_volume_and_open_interest(self, dates, continuous_contracts):
         """
@@ -0,0 +1,240 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+shared memory market data panel for multi-process backtesting.
+
+All the varieties are prepared once in the main process and stored in the
+shared memory as a float64 panel with shape (date, variety, field), the
+dates are the union of all the varieties and stored in another shared
+memory block. The worker processes attach the panel by name from the
+manifest without copying, then feed backtrader from the views.
+
+The missing date of a variety is filled with nan, which is dropped when the
+arrays of the variety are read, so every variety keeps its own dates.
+
+The panel is owned by the process which creates it, the owner should unlink
+the shared memory once all the workers finish, cleanup could remove the
+leftover shared memory by the manifest if the owner crashed.
+"""
+
+import json
+from multiprocessing import shared_memory
+import uuid
+
+import numpy as np
+
+from greenturtle.constants import types
+from greenturtle.data.datafeed import array
+from greenturtle.data.datafeed import db
+from greenturtle import exception
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+FIELDS = array.ARRAY_COLUMNS[1:]
+DATE_DTYPE = "datetime64[us]"
+VALUE_DTYPE = "float64"
+
+
+def _create_shared_memory(name, nbytes):
+    """create the shared memory, the size should be greater than 0."""
+    return shared_memory.SharedMemory(name=name,
+                                      create=True,
+                                      size=max(nbytes, 1))
+
+
+# pylint: disable=too-many-instance-attributes
+class SharedPanel:
+    """market data panel in shared memory."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, dates_shm, values_shm, length, varieties,
+                 owner=False):
+        self._dates_shm = dates_shm
+        self._values_shm = values_shm
+        self.varieties = list(varieties)
+        self.fields = list(FIELDS)
+        self.owner = owner
+
+        self._variety_index = {v: i for i, v in enumerate(self.varieties)}
+        self._valid_index = self.fields.index(types.VALID)
+
+        self.dates = np.ndarray((length,),
+                                dtype=DATE_DTYPE,
+                                buffer=dates_shm.buf)
+        self.values = np.ndarray(
+            (length, len(self.varieties), len(self.fields)),
+            dtype=VALUE_DTYPE,
+            buffer=values_shm.buf)
+
+    # pylint: disable=too-many-locals
+    @classmethod
+    def create(cls, arrays_by_variety, name=None):
+        """create the panel from the arrays of every variety."""
+        normalized = {k: array.normalize_arrays(v)
+                      for k, v in arrays_by_variety.items()}
+        varieties = list(normalized.keys())
+
+        if normalized:
+            dates = np.unique(np.concatenate(
+                [v[types.DATETIME] for v in normalized.values()]))
+        else:
+            dates = np.array([], dtype=DATE_DTYPE)
+
+        name = name or f"gt-{uuid.uuid4().hex[:12]}"
+        shape = (len(dates), len(varieties), len(FIELDS))
+        itemsize = np.dtype(VALUE_DTYPE).itemsize
+
+        dates_shm = _create_shared_memory(f"{name}-d", dates.nbytes)
+        try:
+            values_shm = _create_shared_memory(
+                f"{name}-v", int(np.prod(shape)) * itemsize)
+        except Exception:
+            dates_shm.close()
+            dates_shm.unlink()
+            raise
+
+        panel = cls(dates_shm, values_shm, len(dates), varieties, owner=True)
+        panel.dates[:] = dates
+        panel.values.fill(np.nan)
+
+        for i, arrays in enumerate(normalized.values()):
+            positions = np.searchsorted(dates, arrays[types.DATETIME])
+            for j, field in enumerate(FIELDS):
+                panel.values[positions, i, j] = arrays[field]
+
+        logger.info("create shared panel %s with %d dates and %d varieties",
+                    name, shape[0], shape[1])
+        return panel
+
+    @classmethod
+    def attach(cls, manifest):
+        """attach the panel by the manifest without copying."""
+        dates_shm = shared_memory.SharedMemory(name=manifest["dates"])
+        values_shm = shared_memory.SharedMemory(name=manifest["values"])
+        return cls(dates_shm,
+                   values_shm,
+                   manifest["length"],
+                   manifest["varieties"])
+
+    @property
+    def manifest(self):
+        """the manifest to attach or cleanup the panel."""
+        return {
+            "dates": self._dates_shm.name,
+            "values": self._values_shm.name,
+            "length": len(self.dates),
+            "varieties": self.varieties,
+            "fields": self.fields,
+        }
+
+    def save_manifest(self, path):
+        """save the manifest to the json file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f)
+
+    def get_arrays(self, variety):
+        """
+        get the arrays of the variety, the arrays are views of the shared
+        memory if the variety has data on all the dates, otherwise copies.
+        """
+        if variety not in self._variety_index:
+            raise exception.VarietyNotFound
+
+        i = self._variety_index[variety]
+        values = self.values[:, i, :]
+        present = ~np.isnan(values[:, self._valid_index])
+
+        if present.all():
+            arrays = {types.DATETIME: self.dates}
+            for j, field in enumerate(self.fields):
+                arrays[field] = values[:, j]
+        else:
+            arrays = {types.DATETIME: self.dates[present]}
+            for j, field in enumerate(self.fields):
+                arrays[field] = values[present, j]
+
+        return arrays
+
+    def get_feed(self, variety, fromdate=None, todate=None):
+        """get the backtrader datafeed of the variety."""
+        return array.get_feed_from_arrays(variety,
+                                          self.get_arrays(variety),
+                                          fromdate=fromdate,
+                                          todate=todate)
+
+    def close(self):
+        """
+        close the shared memory in this process, all the views returned by
+        get_arrays should be released before.
+        """
+        self.dates = None
+        self.values = None
+        self._dates_shm.close()
+        self._values_shm.close()
+
+    def unlink(self):
+        """destroy the shared memory, only called by the owner."""
+        self._dates_shm.unlink()
+        self._values_shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+
+def load_manifest(path):
+    """load the manifest from the json file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cleanup(manifest):
+    """remove the leftover shared memory by the manifest."""
+    for key in ("dates", "values"):
+        try:
+            shm = shared_memory.SharedMemory(name=manifest[key])
+        except FileNotFoundError:
+            continue
+
+        shm.close()
+        shm.unlink()
+        logger.info("remove leftover shared memory %s", manifest[key])
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def load_shared_panel_from_db(db_conf,
+                              names,
+                              source,
+                              country,
+                              start_date,
+                              end_date,
+                              padding=False,
+                              cache_dir=None):
+    """
+    prepare the continuous contracts of all the varieties once from the
+    database and create the shared panel.
+    """
+    arrays_by_variety = db.get_arrays_by_variety_from_db(
+        db_conf, names, source, country, start_date, end_date,
+        padding=padding, cache_dir=cache_dir)
+
+    return SharedPanel.create(arrays_by_variety)
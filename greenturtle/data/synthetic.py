@@ -0,0 +1,361 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+deterministic synthetic futures market for load and benchmark testing.
+
+Every variety follows a geometric random walk of the spot price, several
+contracts are listed before they expire and overlap with each other, the
+contract price is the spot price with the carry to the expiry. The open
+interest of a contract rises after listing, peaks before expiry and then
+falls, so the main contract rolls like the real market. Some trading days
+are missing for a variety and some bad prints are injected.
+
+The data is the same for the same seed, it could be written into the
+contract table, csv or parquet files, or fed to backtrader from memory.
+"""
+
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+from greenturtle.constants import types
+from greenturtle.data.datafeed import array
+from greenturtle.data.preprocess import continuous_contract
+from greenturtle.db import models
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+EXCHANGE = "SYNTHETIC"
+GROUPS = ("agriculture", "metal", "energy", "indices")
+
+# the open interest peaks OI_PEAK_DAYS before expiry
+OI_PEAK_DAYS = 90
+OI_WIDTH_DAYS = 60
+
+# the bad print multiplies the close price without fixing high and low
+BAD_PRINT_FACTORS = (0.5, 2.0)
+
+
+# pylint: disable=too-many-instance-attributes
+class SyntheticMarket:
+    """deterministic synthetic futures market."""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self,
+                 n_varieties=10,
+                 years=5,
+                 start_date=datetime.datetime(2015, 1, 5),
+                 seed=0,
+                 contracts_per_year=4,
+                 listing_months=12,
+                 missing_ratio=0.005,
+                 bad_print_ratio=0.0005,
+                 source=types.CSI,
+                 country=types.US):
+        self.n_varieties = n_varieties
+        self.years = years
+        self.start_date = start_date
+        self.end_date = start_date + datetime.timedelta(days=365 * years)
+        self.seed = seed
+        self.contracts_per_year = contracts_per_year
+        self.listing_months = listing_months
+        self.missing_ratio = missing_ratio
+        self.bad_print_ratio = bad_print_ratio
+        self.source = source
+        self.country = country
+
+        self.names = [f"S{i:02d}" for i in range(n_varieties)]
+        self._contracts = {}
+
+    def get_varieties(self):
+        """get the varieties in the format of constants.varieties."""
+        result = {group: {} for group in GROUPS}
+        for i, name in enumerate(self.names):
+            result[GROUPS[i % len(GROUPS)]][name] = {
+                types.MULTIPLIER: 10,
+                types.AUTO_MARGIN: 1,
+                types.DESCRIPTION: f"synthetic variety {name}",
+            }
+
+        return result
+
+    def get_group(self, name):
+        """get the group of the variety."""
+        return GROUPS[self.names.index(name) % len(GROUPS)]
+
+    def get_trading_dates(self):
+        """get all the business days as the trading dates."""
+        return pd.bdate_range(self.start_date, self.end_date)
+
+    def _get_expires(self):
+        """get the expire dates of all the contracts."""
+        step = 12 // self.contracts_per_year
+        first_year = self.start_date.year
+        last = self.end_date + datetime.timedelta(
+            days=31 * (self.listing_months + 1))
+
+        expires = []
+        for year in range(first_year, last.year + 1):
+            for month in range(step, 13, step):
+                # expire on the 15th or the next business day
+                expire = pd.Timestamp(year, month, 15)
+                expire = pd.offsets.BDay().rollforward(expire)
+                if self.start_date < expire <= last:
+                    expires.append(expire.to_pydatetime())
+
+        return expires
+
+    # pylint: disable=too-many-locals
+    def _generate(self, name):
+        """generate all the contracts of the variety as dataframe."""
+        index = self.names.index(name)
+        rng = np.random.default_rng([self.seed, index])
+
+        dates = self.get_trading_dates()
+        keep = rng.random(len(dates)) >= self.missing_ratio
+        keep[0] = True
+        dates = dates[keep]
+        n = len(dates)
+
+        # spot price with geometric random walk
+        vol = rng.uniform(0.008, 0.02)
+        carry = rng.normal(0.02, 0.05)
+        spot = rng.uniform(50, 5000) * np.exp(
+            np.cumsum(rng.normal(0, vol, n)))
+
+        frames = []
+        for expire in self._get_expires():
+            listing = expire - datetime.timedelta(
+                days=30 * self.listing_months)
+            live = np.nonzero((dates >= listing) & (dates < expire))[0]
+            if len(live) == 0:
+                continue
+
+            dte = (expire - dates[live]).days.to_numpy()
+            close = spot[live] * np.exp(carry * dte / 365) * np.exp(
+                rng.normal(0, vol / 4, len(live)))
+            open_ = close * np.exp(rng.normal(0, vol / 2, len(live)))
+            high = np.maximum(open_, close) * np.exp(
+                np.abs(rng.normal(0, vol / 2, len(live))))
+            low = np.minimum(open_, close) * np.exp(
+                -np.abs(rng.normal(0, vol / 2, len(live))))
+
+            open_interest = 100 + 100000 * np.exp(
+                -((dte - OI_PEAK_DAYS) / OI_WIDTH_DAYS) ** 2)
+            open_interest *= rng.uniform(0.9, 1.1, len(live))
+            volume = open_interest * rng.uniform(0.2, 0.6, len(live))
+
+            # inject the bad prints
+            bad = rng.random(len(live)) < self.bad_print_ratio
+            close[bad] *= rng.choice(BAD_PRINT_FACTORS, int(bad.sum()))
+
+            settle = close.copy()
+            pre_settle = np.concatenate(([open_[0]], settle[:-1]))
+
+            frames.append(pd.DataFrame({
+                types.DATE: dates[live],
+                types.NAME: f"{name}{expire:%y%m}",
+                types.OPEN: open_,
+                types.HIGH: high,
+                types.LOW: low,
+                types.CLOSE: close,
+                types.VOLUME: volume.astype(np.int64),
+                types.OPEN_INTEREST: open_interest.astype(np.int64),
+                types.SETTLE: settle,
+                types.PRE_SETTLE: pre_settle,
+                types.EXPIRE: expire,
+            }))
+
+        df = pd.concat(frames, ignore_index=True)
+        df[types.VARIETY] = name
+        df[types.SOURCE] = self.source
+        df[types.COUNTRY] = self.country
+        df[types.EXCHANGE] = EXCHANGE
+        df[types.GROUP] = self.get_group(name)
+
+        return df.sort_values([types.DATE, types.EXPIRE], ignore_index=True)
+
+    def get_contracts(self, name):
+        """get all the contracts of the variety as dataframe."""
+        if name not in self._contracts:
+            self._contracts[name] = self._generate(name)
+
+        return self._contracts[name]
+
+    def _select_main_contracts(self, name):
+        """
+        select the main contract for every date with the same rule as the
+        continuous contract preprocess, the main contract has the most open
+        interest, rolls ROLLING_INTERVAL days before expiry and never
+        switches back to an early contract.
+
+        Return the row positions of the main contracts in the contracts
+        dataframe and the adjust factors.
+        """
+        df = self.get_contracts(name)
+        date_idx = pd.DatetimeIndex(df[types.DATE].unique()).sort_values()
+        date_pos = date_idx.get_indexer(df[types.DATE])
+        # the contract names are ordered by the expire date
+        names = pd.Index(df.drop_duplicates(types.NAME).sort_values(
+            types.EXPIRE, kind="stable")[types.NAME])
+        name_pos = names.get_indexer(df[types.NAME])
+
+        shape = (len(date_idx), len(names))
+        open_interest = np.full(shape, -1, dtype=np.int64)
+        open_interest[date_pos, name_pos] = df[types.OPEN_INTEREST]
+        close = np.full(shape, np.nan)
+        close[date_pos, name_pos] = df[types.CLOSE]
+        rows = np.full(shape, -1, dtype=np.int64)
+        rows[date_pos, name_pos] = np.arange(len(df))
+
+        expires = np.empty(len(names), dtype="datetime64[ns]")
+        expires[name_pos] = df[types.EXPIRE].to_numpy()
+        interval = np.timedelta64(continuous_contract.ROLLING_INTERVAL, "D")
+        eligible = (open_interest >= 0) & \
+            (expires[None, :] > date_idx.to_numpy()[:, None] + interval)
+
+        mains = np.empty(len(date_idx), dtype=np.int64)
+        factors = np.ones(len(date_idx))
+        prev = None
+        for d in range(len(date_idx)):
+            mask = eligible[d]
+            if prev is not None:
+                mask = mask & (expires >= expires[prev])
+            # the first one is the earliest expire if the same
+            now = int(np.argmax(np.where(mask, open_interest[d], -1)))
+            mains[d] = now
+
+            if prev is not None and now != prev:
+                if not np.isnan(close[d, prev]):
+                    factors[d] = close[d, now] / close[d, prev]
+                else:
+                    factors[d] = close[d - 1, now] / close[d - 1, prev]
+            prev = now
+
+        totals = {
+            column: np.bincount(date_pos, weights=df[column])
+            for column in (types.VOLUME, types.OPEN_INTEREST)
+        }
+        return rows[np.arange(len(date_idx)), mains], factors, totals
+
+    def get_continuous_contracts(self, name):
+        """get the continuous contracts of the variety."""
+        df = self.get_contracts(name)
+        rows, factors, totals = self._select_main_contracts(name)
+
+        result = []
+        records = df.iloc[rows].to_dict("records")
+        for i, values in enumerate(records):
+            values[types.DATE] = values[types.DATE].to_pydatetime()
+            values[types.EXPIRE] = values[types.EXPIRE].to_pydatetime()
+            values[types.ADJUST_FACTOR] = factors[i]
+            values[types.TOTAL_VOLUME] = int(totals[types.VOLUME][i])
+            values[types.TOTAL_OPEN_INTEREST] = int(
+                totals[types.OPEN_INTEREST][i])
+            result.append(models.ContinuousContract(**values))
+
+        return result
+
+    def get_arrays(self, name):
+        """
+        get the adjusted continuous arrays of the variety, the prices are
+        adjusted in the same way as ContinuousContractDB.
+        """
+        df = self.get_contracts(name)
+        rows, factors, _ = self._select_main_contracts(name)
+        main = df.iloc[rows]
+        # backward adjust, the price is multiplied by the later factors
+        multiplier = np.concatenate((np.cumprod(factors[::-1])[::-1][1:],
+                                     [1.0]))
+
+        arrays = {
+            types.DATETIME: main[types.DATE].to_numpy(
+                dtype="datetime64[us]"),
+            types.VOLUME: main[types.VOLUME].to_numpy(dtype=np.float64),
+            types.OPEN_INTEREST: main[types.OPEN_INTEREST].to_numpy(
+                dtype=np.float64),
+        }
+        for column in (types.OPEN, types.HIGH, types.LOW, types.CLOSE):
+            arrays[column] = main[column].to_numpy() * multiplier
+
+        return arrays
+
+    def get_feed(self, name, fromdate=None, todate=None):
+        """get the backtrader datafeed of the variety from memory."""
+        return array.get_feed_from_arrays(name,
+                                          self.get_arrays(name),
+                                          fromdate=fromdate,
+                                          todate=todate)
+
+    def write_to_db(self, dbapi):
+        """write all the contracts to the contract table."""
+        for name in self.names:
+            df = self.get_contracts(name)
+            values_list = df.to_dict("records")
+            for values in values_list:
+                values[types.DATE] = values[types.DATE].to_pydatetime()
+                values[types.EXPIRE] = values[types.EXPIRE].to_pydatetime()
+            dbapi.contract_bulk_create(values_list)
+            logger.info("write %d synthetic %s contracts to database",
+                        len(df), name)
+
+    def write_to_files(self, dst_dir, file_format="csv"):
+        """write the contracts of every variety to csv or parquet files."""
+        os.makedirs(dst_dir, exist_ok=True)
+        for name in self.names:
+            df = self.get_contracts(name)
+            path = os.path.join(dst_dir, f"{name}.{file_format}")
+            if file_format == "csv":
+                df.to_csv(path, index=False)
+            elif file_format == "parquet":
+                df.to_parquet(path, index=False)
+            else:
+                raise ValueError(f"unsupported file format {file_format}")
+
+    def write_continuous_csv(self, name, path):
+        """
+        write the adjusted continuous contracts to the csv file with the
+        layout of the csv datafeed.
+        """
+        contracts = self.get_continuous_contracts(name)
+        arrays = self.get_arrays(name)
+
+        df = pd.DataFrame({
+            types.DATE: pd.DatetimeIndex(
+                arrays[types.DATETIME]).strftime(types.DATE_FORMAT),
+            types.CONTRACT: [c.name for c in contracts],
+            types.EXPIRE: [c.expire.strftime(types.DATE_FORMAT)
+                           for c in contracts],
+            types.OPEN: arrays[types.OPEN],
+            types.HIGH: arrays[types.HIGH],
+            types.LOW: arrays[types.LOW],
+            types.CLOSE: arrays[types.CLOSE],
+            types.ORI_OPEN: [c.open for c in contracts],
+            types.ORI_HIGH: [c.high for c in contracts],
+            types.ORI_LOW: [c.low for c in contracts],
+            types.ORI_CLOSE: [c.close for c in contracts],
+            types.VOLUME: [c.volume for c in contracts],
+            types.TOTAL_VOLUME: [c.total_volume for c in contracts],
+            types.OPEN_INTEREST: [c.open_interest for c in contracts],
+            types.TOTAL_OPEN_INTEREST: [c.total_open_interest
+                                        for c in contracts],
+            types.VALID: 1,
+        })
+        df.to_csv(path, index=False)
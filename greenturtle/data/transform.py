@@ -15,8 +15,10 @@
 
 """data transform for csv, db, datafeed etc"""
 
+import numpy as np
 import pandas as pd
 
+from greenturtle.constants import types
 from greenturtle.db import models
 
 
@@ -55,3 +57,32 @@ def contract_model_2_continuous_contract_model(contract):
     continuous_contract.update(attr_dict)
     continuous_contract.adjust_factor = 1
     return continuous_contract
+
+
+def continuous_contracts_2_arrays(continuous_contracts):
+    """continuous contract models to columnar arrays for datafeed."""
+    length = len(continuous_contracts)
+    arrays = {
+        types.DATETIME: np.empty(length, dtype="datetime64[us]"),
+        types.OPEN: np.empty(length, dtype=np.float64),
+        types.HIGH: np.empty(length, dtype=np.float64),
+        types.LOW: np.empty(length, dtype=np.float64),
+        types.CLOSE: np.empty(length, dtype=np.float64),
+        types.VOLUME: np.empty(length, dtype=np.float64),
+        types.VALID: np.ones(length, dtype=np.float64),
+        types.ADJUST_FACTOR: np.ones(length, dtype=np.float64),
+    }
+
+    for i, c in enumerate(continuous_contracts):
+        arrays[types.DATETIME][i] = c.date
+        arrays[types.OPEN][i] = c.open
+        arrays[types.HIGH][i] = c.high
+        arrays[types.LOW][i] = c.low
+        arrays[types.CLOSE][i] = c.close
+        arrays[types.VOLUME][i] = np.nan if c.volume is None else c.volume
+        if hasattr(c, types.VALID):
+            arrays[types.VALID][i] = c.valid
+        if c.adjust_factor is not None:
+            arrays[types.ADJUST_FACTOR][i] = c.adjust_factor
+
+    return arrays
@@ -17,49 +17,68 @@
 
 import sqlalchemy
 from sqlalchemy import desc
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from greenturtle.constants import types
 from greenturtle.db import models
 
 
+DEFAULT_DRIVERNAME = "mysql+pymysql"
+SQLITE_DRIVERNAME = "sqlite"
+
+
+def get_engine(db_conf):
+    """
+    get the database engine, the driver is mysql by default, sqlite is
+    supported for the embedded database without server, such as offline
+    benchmark and testing, the database is the file path then.
+    """
+    drivername = getattr(db_conf, "drivername", None) or DEFAULT_DRIVERNAME
+
+    if drivername == SQLITE_DRIVERNAME:
+        url = sqlalchemy.URL.create(drivername=drivername,
+                                    database=db_conf.database)
+        return sqlalchemy.create_engine(url)
+
+    url = sqlalchemy.URL.create(
+        drivername=drivername,
+        username=db_conf.username,
+        password=db_conf.password,
+        host=db_conf.host,
+        port=db_conf.port,
+        database=db_conf.database,
+    )
+    return sqlalchemy.create_engine(url,
+                                    pool_recycle=3600,
+                                    pool_pre_ping=True)
+
+
 # pylint: disable=too-few-public-methods
 class DBManager:
     """Database manager."""
     def __init__(self, db_conf):
-        url = sqlalchemy.URL.create(
-            drivername='mysql+pymysql',
-            username=db_conf.username,
-            password=db_conf.password,
-            host=db_conf.host,
-            port=db_conf.port,
-            database=db_conf.database,
-        )
-        self.engine = sqlalchemy.create_engine(url,
-                                               pool_recycle=3600,
-                                               pool_pre_ping=True)
+        self.engine = get_engine(db_conf)
 
     def create_all(self):
         """create all tables."""
         models.Base.metadata.create_all(self.engine)
 
+    def create_backtest_tables(self):
+        """create the tables of the backtest results only."""
+        models.Base.metadata.create_all(self.engine, tables=[
+            models.BacktestRun.__table__,
+            models.BacktestReturn.__table__,
+            models.BacktestPositionPNL.__table__,
+        ])
+
 
 # pylint: disable=too-many-public-methods
 class DBAPI:
     """Database API."""
 
     def __init__(self, db_conf):
-        url = sqlalchemy.URL.create(
-            drivername='mysql+pymysql',
-            username=db_conf.username,
-            password=db_conf.password,
-            host=db_conf.host,
-            port=db_conf.port,
-            database=db_conf.database,
-        )
-        self.engine = sqlalchemy.create_engine(url,
-                                               pool_recycle=3600,
-                                               pool_pre_ping=True)
+        self.engine = get_engine(db_conf)
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     def contract_create(self,
@@ -96,6 +115,15 @@ class DBAPI:
 
         return contract_ref
 
+    def contract_bulk_create(self, values_list):
+        """
+        create the contracts in bulk without checking the existing ones,
+        values_list is a list of dict with all the contract columns.
+        """
+        with Session(self.engine) as session:
+            session.execute(sqlalchemy.insert(models.Contract), values_list)
+            session.commit()
+
     def contract_update_by_id(self, contract_id, values):
         """update contract to the database."""
         with Session(self.engine) as session:
@@ -349,6 +377,40 @@ class DBAPI:
 
             return query
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def continuous_contract_get_version_by_variety_source_country(
+            self, variety, source, country, start_date=None, end_date=None):
+
+        """
+        get the data version stamp of the continuous contracts by variety,
+        source and country, the stamp changes once any row is created,
+        updated or deleted.
+        """
+        model = models.ContinuousContract
+        with Session(self.engine) as session:
+            # pylint: disable=not-callable
+            query = session.query(
+                func.count(model.id),
+                func.max(model.date),
+                func.max(model.created_at),
+                func.max(model.updated_at),
+            )
+
+            if start_date is not None:
+                query = query.filter(model.date >= start_date)
+            if end_date is not None:
+                query = query.filter(model.date <= end_date)
+
+            query = query.filter(
+                model.variety == variety,
+                model.source == source,
+                model.country == country
+            )
+
+            count, max_date, max_created_at, max_updated_at = query.one()
+
+        return f"{count}:{max_date}:{max_created_at}:{max_updated_at}"
+
     def continuous_contract_get_all_by_name_from_csi_us(self, name):
         """
         get all continuous contracts by name from csi data and country us.
@@ -376,3 +438,52 @@ class DBAPI:
         """
         return self.continuous_contract_get_all_by_variety_source_country(
             variety, types.AKSHARE, types.CN)
+
+    def indicator_snapshot_get_by_version(self, version):
+        """get the indicator snapshot by version."""
+        with Session(self.engine) as session:
+            query = session.query(models.IndicatorSnapshot).filter(
+                models.IndicatorSnapshot.version == version
+            )
+            return query.first()
+
+    def indicator_snapshot_put(self, version, date, content):
+        """create or update the indicator snapshot of the version."""
+        with Session(self.engine) as session:
+            snapshot_ref = session.query(models.IndicatorSnapshot).filter(
+                models.IndicatorSnapshot.version == version
+            ).first()
+            if snapshot_ref is None:
+                snapshot_ref = models.IndicatorSnapshot()
+                snapshot_ref.version = version
+                session.add(snapshot_ref)
+
+            snapshot_ref.date = date
+            snapshot_ref.content = content
+            session.commit()
+
+    def backtest_run_create(self, run, returns, positions_pnl):
+        """
+        create the backtest run with its returns and positions pnl in one
+        transaction, the returns and positions pnl are inserted in bulk.
+        """
+        with Session(self.engine) as session:
+            session.add(models.BacktestRun(**run))
+            if returns:
+                session.execute(sqlalchemy.insert(models.BacktestReturn),
+                                returns)
+            if positions_pnl:
+                session.execute(
+                    sqlalchemy.insert(models.BacktestPositionPNL),
+                    positions_pnl)
+            session.commit()
+
+    def backtest_run_delete(self, run_id):
+        """delete the backtest run with its returns and positions pnl."""
+        with Session(self.engine) as session:
+            for model in (models.BacktestRun,
+                          models.BacktestReturn,
+                          models.BacktestPositionPNL):
+                session.query(model).filter(
+                    model.run_id == run_id).delete()
+            session.commit()
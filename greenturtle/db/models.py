@@ -15,7 +15,8 @@
 
 """models for the greenturtle database."""
 
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text
+from sqlalchemy import LargeBinary
 from sqlalchemy import UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.sql import func
@@ -118,3 +119,80 @@ class ContinuousContract(Base):
     pre_settle = Column(Float, default=None)
     expire = Column(DateTime, nullable=False)
     adjust_factor = Column(Float, nullable=False)
+
+
+# pylint: disable=too-few-public-methods
+class IndicatorSnapshot(Base):
+    """indicator snapshot model"""
+    __tablename__ = 'indicator_snapshot'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    version = Column(String(64), unique=True, nullable=False)
+    date = Column(DateTime, nullable=False)
+    # mediumtext in mysql since the states of all varieties exceed 64KB
+    content = Column(Text(16777215), nullable=False)
+
+
+# pylint: disable=too-few-public-methods
+class BacktestRun(Base):
+    """backtest run model"""
+    __tablename__ = 'backtest_run'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(String(32), unique=True, nullable=False)
+    strategy = Column(String(255), index=True, nullable=False)
+    params = Column(Text, nullable=False)
+    varieties = Column(Text, default=None)
+    data_version = Column(String(255), default=None)
+    start_date = Column(DateTime, default=None)
+    end_date = Column(DateTime, default=None)
+    total_return = Column(Float, default=None)
+    annual_return = Column(Float, default=None)
+    sharpe_ratio = Column(Float, default=None)
+    max_draw_down = Column(Float, default=None)
+    leverage_ratio = Column(Float, default=None)
+    net = Column(Float, default=None)
+    trade_number = Column(Integer, default=None)
+    won_trade_number = Column(Integer, default=None)
+
+
+# pylint: disable=too-few-public-methods
+class BacktestReturn(Base):
+    """daily or yearly returns of the backtest run model"""
+    __tablename__ = 'backtest_return'
+
+    __table_args__ = (
+        UniqueConstraint(
+            'run_id',
+            'period',
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(String(32), index=True, nullable=False)
+    period = Column(String(15), nullable=False)
+    # the packed int64 nanoseconds and float64 arrays, mediumblob in mysql
+    dates = Column(LargeBinary(16777215), nullable=False)
+    values = Column(LargeBinary(16777215), nullable=False)
+
+
+# pylint: disable=too-few-public-methods
+class BacktestPositionPNL(Base):
+    """profit and lost per position of the backtest run model"""
+    __tablename__ = 'backtest_position_pnl'
+
+    __table_args__ = (
+        UniqueConstraint(
+            'run_id',
+            'name',
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(String(32), index=True, nullable=False)
+    name = Column(String(31), nullable=False)
+    net = Column(Float, default=None)
+    gross = Column(Float, default=None)
+    profit = Column(Float, default=None)
+    lost = Column(Float, default=None)
+    trade_number = Column(Integer, default=None)
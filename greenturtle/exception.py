@@ -182,3 +182,18 @@ class BuyOrSellSizeAbnormalError(GreenTurtleBaseException):
 class NotifierNotSupportedError(GreenTurtleBaseException):
     """notifier not supported error"""
     msg_fmt = "notifier not supported error."
+
+
+class StrategyNotSupportedError(GreenTurtleBaseException):
+    """strategy not supported error"""
+    msg_fmt = "strategy not supported error."
+
+
+class BatchJobTimeoutError(GreenTurtleBaseException):
+    """batch job timeout error"""
+    msg_fmt = "batch job timeout error."
+
+
+class AnalyzerProfileNotSupportedError(GreenTurtleBaseException):
+    """analyzer profile not supported error"""
+    msg_fmt = "analyzer profile not supported error."
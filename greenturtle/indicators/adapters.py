@@ -0,0 +1,201 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+backtrader indicators over the numpy kernels.
+
+In the runonce mode, once computes the whole line by the kernel over the
+input arrays at once, instead of the python loop of the backtrader
+indicators, the result is shared by the registry with the other
+indicators over the same data with the same parameters. In the next mode,
+the values are updated bar by bar in O(1), the rolling highest and lowest
+by the monotonic deque. The values are the
+same as the backtrader built-in ones in both modes, so they are drop-in
+replacements of
+
+    EMA: MovAv.Exponential
+    ATR: ATR
+    Highest: Highest
+    Lowest: Lowest
+"""
+
+import array
+import collections
+import math
+import operator
+
+import backtrader as bt
+import numpy as np
+
+from greenturtle.indicators import kernels
+from greenturtle.indicators import registry
+
+
+def get_values(line, length):
+    """get the copy of the line values as the numpy array."""
+    return np.frombuffer(line.array, dtype=np.float64, count=length).copy()
+
+
+def set_values(line, values, start, end):
+    """set the values of the line from the start to the end."""
+    line.array[start:end] = array.array("d", values[start:end])
+
+
+def compute_once(indicator, kernel, inputs, start, end, **params):
+    """
+    compute the kernel over the whole input lines by the registry and set
+    the values of the indicator line from the start to the end, the whole
+    lines are used so the calls of oncestart and once share the result.
+    """
+    length = indicator.buflen()
+    values = registry.compute(kernel,
+                              [get_values(line, length) for line in inputs],
+                              **params)
+    set_values(indicator.lines[0], values, start, end)
+
+
+# pylint: disable=too-few-public-methods
+class MonotonicDeque:
+    """
+    the extreme of the rolling window in amortized O(1), the deque keeps
+    the candidates by the index in the monotonic order of the values.
+    """
+
+    def __init__(self, period, compare):
+        self.period = period
+        self.compare = compare
+        self.candidates = collections.deque()
+        self.index = 0
+
+    def push(self, value):
+        """push the value and return the extreme of the window."""
+        candidates = self.candidates
+        while candidates and not self.compare(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((self.index, value))
+        if candidates[0][0] <= self.index - self.period:
+            candidates.popleft()
+
+        self.index += 1
+        return candidates[0][1]
+
+
+class EMA(bt.Indicator):
+    """exponential moving average over the kernel."""
+
+    lines = ("ema",)
+    params = (("period", 30),)
+
+    def __init__(self):
+        super().__init__()
+        self.addminperiod(self.p.period)
+        self.alpha = 2.0 / (1.0 + self.p.period)
+        self.alpha1 = 1.0 - self.alpha
+
+    # pylint: disable=no-member
+    def nextstart(self):
+        self.lines.ema[0] = \
+            math.fsum(self.data.get(size=self.p.period)) / self.p.period
+
+    # pylint: disable=no-member
+    def next(self):
+        self.lines.ema[0] = \
+            self.lines.ema[-1] * self.alpha1 + self.data[0] * self.alpha
+
+    def once(self, start, end):
+        compute_once(self, kernels.ema, [self.data.lines[0]], start, end,
+                     period=self.p.period)
+
+
+class ATR(bt.Indicator):
+    """average true range over the kernel."""
+
+    lines = ("atr",)
+    params = (("period", 14),)
+
+    def __init__(self):
+        super().__init__()
+        # the true range starts from the second bar
+        self.addminperiod(self.p.period + 1)
+        self.alpha = 1.0 / self.p.period
+        self.alpha1 = 1.0 - self.alpha
+        self.true_ranges = collections.deque(maxlen=self.p.period)
+
+    def get_true_range(self):
+        """get the true range of the current bar."""
+        prev_close = self.data.close[-1]
+        return max(self.data.high[0], prev_close) - \
+            min(self.data.low[0], prev_close)
+
+    def prenext(self):
+        if len(self) > 1:
+            self.true_ranges.append(self.get_true_range())
+
+    # pylint: disable=no-member
+    def nextstart(self):
+        self.true_ranges.append(self.get_true_range())
+        self.lines.atr[0] = math.fsum(self.true_ranges) / self.p.period
+
+    # pylint: disable=no-member
+    def next(self):
+        self.lines.atr[0] = self.lines.atr[-1] * self.alpha1 + \
+            self.get_true_range() * self.alpha
+
+    def once(self, start, end):
+        data = self.data
+        compute_once(self, kernels.atr, [data.high, data.low, data.close],
+                     start, end, period=self.p.period)
+
+
+class _Rolling(bt.Indicator):
+    """rolling extreme over the kernel and the monotonic deque."""
+
+    params = (("period", 1),)
+
+    # the comparison to keep the candidate and the kernel
+    compare = None
+    kernel = None
+
+    def __init__(self):
+        super().__init__()
+        self.addminperiod(self.p.period)
+        # pylint: disable=not-callable
+        self.deque = MonotonicDeque(self.p.period, self.compare)
+
+    def prenext(self):
+        self.deque.push(self.data[0])
+
+    def next(self):
+        self.lines[0][0] = self.deque.push(self.data[0])
+
+    def once(self, start, end):
+        compute_once(self, self.kernel, [self.data.lines[0]], start, end,
+                     period=self.p.period)
+
+
+class Highest(_Rolling):
+    """highest of the rolling window over the kernel."""
+
+    lines = ("highest",)
+    compare = staticmethod(operator.gt)
+    kernel = staticmethod(kernels.highest)
+
+
+class Lowest(_Rolling):
+    """lowest of the rolling window over the kernel."""
+
+    lines = ("lowest",)
+    compare = staticmethod(operator.lt)
+    kernel = staticmethod(kernels.lowest)
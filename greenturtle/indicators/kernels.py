@@ -0,0 +1,276 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+numpy indicator kernels over the full price arrays.
+
+The kernels accept the array with shape (time,) or (time, variety) and
+compute along the time axis, the leading values without enough history are
+nan. The floating point operations are in the same order as the backtrader
+indicators in the runonce mode, so the values are the same, including
+
+    ema: seeded by the simple average, then prev * (1 - alpha) + x * alpha
+    atr: wilder smoothing of the true range with alpha = 1 / period
+    highest and lowest: max and min of the rolling window
+
+The rolling regression kernels are computed by the sums of the rolling
+window instead, which are close to the fitted ones within the rounding.
+"""
+
+import math
+
+import numpy as np
+
+
+# the variance by the sums within the rounding relative to the sum of
+# squares is regarded as 0
+ROUNDING = 1e-12
+
+
+def _as_2d(values):
+    """view the 1d array as a column and return whether it is 1d."""
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        return values[:, np.newaxis], True
+    return values, False
+
+
+def _restore(values, is_1d):
+    """restore the shape of the result."""
+    return values[:, 0] if is_1d else values
+
+
+def _first_valid_index(values):
+    """get the first non nan index of every column, -1 if all nan."""
+    valid = ~np.isnan(values)
+    first = np.argmax(valid, axis=0)
+    first[~valid.any(axis=0)] = -1
+    return first
+
+
+def _get_seeds(values, period):
+    """
+    get the seed index and the simple average seed of every column, the
+    index is -1 if the column is too short.
+    """
+    length, width = values.shape
+    first = _first_valid_index(values)
+    seeds = np.full(width, -1)
+    seed_values = np.full(width, np.nan)
+    for j in range(width):
+        seed = first[j] + period - 1
+        if first[j] < 0 or seed >= length:
+            continue
+        seeds[j] = seed
+        seed_values[j] = math.fsum(values[first[j]:seed + 1, j]) / period
+
+    return seeds, seed_values
+
+
+def exponential_smoothing(values, period, alpha):
+    """
+    exponential smoothing seeded with the simple average of the first
+    period values of every column. The recursive filter runs over the
+    python floats of every column, which is much cheaper than the numpy
+    operations per row, and the result is the same.
+    """
+    values, is_1d = _as_2d(values)
+    result = np.full(values.shape, np.nan)
+    seeds, seed_values = _get_seeds(values, period)
+
+    alpha1 = 1.0 - alpha
+    for j, seed in enumerate(seeds):
+        if seed < 0:
+            continue
+
+        prev = float(seed_values[j])
+        smoothed = [prev]
+        for value in values[seed + 1:, j].tolist():
+            prev = prev * alpha1 + value * alpha
+            smoothed.append(prev)
+        result[seed:, j] = smoothed
+
+    return _restore(result, is_1d)
+
+
+def ema(values, period):
+    """exponential moving average."""
+    return exponential_smoothing(values, period, 2.0 / (1.0 + period))
+
+
+def smma(values, period):
+    """smoothed moving average, known as wilder's moving average."""
+    return exponential_smoothing(values, period, 1.0 / period)
+
+
+def get_convergence_bars(period, alpha, tolerance):
+    """
+    get the bars for the exponential smoothing to converge, the weight of
+    the simple average seed decays by (1 - alpha) every bar after the first
+    period values, and it converges when the weight is below the tolerance.
+    """
+    if alpha >= 1:
+        return period
+
+    return period + math.ceil(math.log(tolerance) / math.log(1.0 - alpha))
+
+
+def get_ema_convergence_bars(period, tolerance):
+    """get the bars for the ema to converge."""
+    return get_convergence_bars(period, 2.0 / (1.0 + period), tolerance)
+
+
+def get_atr_convergence_bars(period, tolerance):
+    """get the bars for the atr to converge, one more for the true range."""
+    return get_convergence_bars(period, 1.0 / period, tolerance) + 1
+
+
+def true_range(high, low, close):
+    """true range, the first one is nan without the previous close."""
+    high, is_1d = _as_2d(high)
+    low, _ = _as_2d(low)
+    close, _ = _as_2d(close)
+
+    prev_close = np.full(close.shape, np.nan)
+    prev_close[1:] = close[:-1]
+
+    result = np.maximum(high, prev_close) - np.minimum(low, prev_close)
+    return _restore(result, is_1d)
+
+
+def atr(high, low, close, period):
+    """average true range."""
+    return smma(true_range(high, low, close), period)
+
+
+def _rolling(values, period, func):
+    """apply the func over the rolling window."""
+    values, is_1d = _as_2d(values)
+    result = np.full(values.shape, np.nan)
+    if len(values) >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(
+            values, period, axis=0)
+        result[period - 1:] = func(windows, axis=-1)
+
+    return _restore(result, is_1d)
+
+
+def highest(values, period):
+    """the highest value of the rolling window."""
+    return _rolling(values, period, np.max)
+
+
+def lowest(values, period):
+    """the lowest value of the rolling window."""
+    return _rolling(values, period, np.min)
+
+
+def shift(values, periods=1):
+    """shift the values forward along the time axis, fill with nan."""
+    values, is_1d = _as_2d(values)
+    result = np.full(values.shape, np.nan)
+    if periods < len(values):
+        result[periods:] = values[:len(values) - periods]
+
+    return _restore(result, is_1d)
+
+
+def rolling_sum(values, period):
+    """
+    the sum of the rolling window in O(1) per bar. The rows are split into
+    the blocks of the period, the cumulative sums restart at every block,
+    and the window ending in a block is the prefix sum of the block plus
+    the suffix sum of the previous block, so nothing is subtracted and the
+    rounding error does not accumulate along the history.
+    """
+    values, is_1d = _as_2d(values)
+    length, width = values.shape
+    result = np.full(values.shape, np.nan)
+    if length < period:
+        return _restore(result, is_1d)
+
+    blocks = -(-length // period)
+    padded = np.zeros((blocks * period, width))
+    padded[:length] = values
+    padded = padded.reshape((blocks, period, width))
+    prefix = np.cumsum(padded, axis=1).reshape(-1, width)
+    suffix = np.cumsum(padded[:, ::-1], axis=1)[:, ::-1].reshape(-1, width)
+
+    ends = np.arange(period - 1, length)
+    result[period - 1:] = prefix[ends]
+    # the window starts within the previous block
+    ends = ends[ends % period != period - 1]
+    result[ends] += suffix[ends - period + 1]
+
+    return _restore(result, is_1d)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def ols_by_sums(n, sx, sy, sxy, sxx, syy):
+    """
+    the slope and r squared of the simple linear regression of y on x by
+    the sums, both are 0 if x or y is constant.
+    """
+    vxx = sxx - sx * sx / n
+    vyy = syy - sy * sy / n
+    vxy = sxy - sx * sy / n
+    x_varied = vxx > ROUNDING * sxx
+    y_varied = vyy > ROUNDING * syy
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(x_varied, vxy / vxx, 0.0)
+        r2 = np.where(x_varied & y_varied, vxy * vxy / (vxx * vyy), 0.0)
+
+    # keep the leading nan without enough history
+    invalid = np.isnan(vxx) | np.isnan(vyy)
+    slope[invalid] = np.nan
+    r2[invalid] = np.nan
+    return slope, r2
+
+
+def rolling_ols(x, y, period):
+    """
+    rolling simple linear regression of y on x, return the slope and the
+    r squared of every window.
+    """
+    x, is_1d = _as_2d(x)
+    y, _ = _as_2d(y)
+
+    slope, r2 = ols_by_sums(period,
+                            rolling_sum(x, period),
+                            rolling_sum(y, period),
+                            rolling_sum(x * y, period),
+                            rolling_sum(x * x, period),
+                            rolling_sum(y * y, period))
+    return _restore(slope, is_1d), _restore(r2, is_1d)
+
+
+def rolling_zscore(values, period):
+    """
+    standard score of the value in the rolling window with the population
+    standard deviation, it is 0 if the window is constant.
+    """
+    values, is_1d = _as_2d(values)
+    mean = rolling_sum(values, period) / period
+    mean_sq = rolling_sum(values * values, period) / period
+    var = mean_sq - mean * mean
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(var > ROUNDING * mean_sq,
+                          (values - mean) / np.sqrt(var),
+                          0.0)
+
+    result[np.isnan(var)] = np.nan
+    return _restore(result, is_1d)
@@ -0,0 +1,162 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+registry of the computed indicator arrays shared across the strategies.
+
+The indicator is identified by the kernel, the parameters and the content
+of the input arrays, so the strategies and the runs over the same data get
+the same key, such as the parameter sweep with the same periods, and the
+kernel is only computed once. The arrays are kept in the memory of the
+process with the least recently used eviction bounded by the entries and
+bytes, and optionally persisted in the indicators directory next to the feed
+cache, so the other processes over the same data reuse them. The key changes
+with the content, so the files of the old data are never hit again, the
+directory is pruned by the least recently used files beyond the disk budget.
+"""
+
+import collections
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from greenturtle.data import cache
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+# bump the version if the result of any kernel changes
+REGISTRY_FORMAT_VERSION = 1
+VALUES = "values"
+INDICATORS_DIR = "indicators"
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 2 * 1024 * 1024 * 1024
+
+
+def get_indicator_key(kernel, inputs, params):
+    """get the indicator key by the kernel, input content and params."""
+    digest = hashlib.sha256()
+    header = {
+        "format": REGISTRY_FORMAT_VERSION,
+        "kernel": f"{kernel.__module__}.{kernel.__qualname__}",
+        "params": params,
+    }
+    digest.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+    for values in inputs:
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        digest.update(str(values.shape).encode("utf-8"))
+        digest.update(values.tobytes())
+
+    return f"indicator-{kernel.__name__}-{digest.hexdigest()}"
+
+
+# pylint: disable=too-many-instance-attributes
+class IndicatorRegistry:
+    """in memory and optionally on disk registry of indicator arrays."""
+
+    def __init__(self,
+                 cache_dir=None,
+                 max_entries=DEFAULT_MAX_ENTRIES,
+                 max_bytes=DEFAULT_MAX_BYTES,
+                 max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.arrays = collections.OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.nbytes = 0
+        self.feed_cache = None
+        self.hits = 0
+        self.misses = 0
+        self.set_cache_dir(cache_dir)
+
+    def set_cache_dir(self, cache_dir):
+        """persist the arrays into the directory next to the feed cache."""
+        self.feed_cache = None
+        if cache_dir is not None:
+            self.feed_cache = cache.FeedCache(
+                os.path.join(cache_dir, INDICATORS_DIR))
+
+    def clear(self):
+        """clear the arrays in memory."""
+        self.arrays.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self, key):
+        """load the arrays from memory or disk, return None if missed."""
+        values = self.arrays.get(key)
+        if values is not None:
+            self.arrays.move_to_end(key)
+            return values
+
+        if self.feed_cache is not None:
+            cached = self.feed_cache.get(key)
+            if cached is not None:
+                values = cached[VALUES]
+                values.setflags(write=False)
+                return values
+
+        return None
+
+    def _save(self, key, values, persist):
+        """save the arrays into memory and disk."""
+        if key not in self.arrays:
+            self.nbytes += values.nbytes
+        self.arrays[key] = values
+        self.arrays.move_to_end(key)
+        while self.arrays and (len(self.arrays) > self.max_entries or
+                               self.nbytes > self.max_bytes):
+            _, evicted = self.arrays.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+        if persist and self.feed_cache is not None:
+            self.feed_cache.put(key, {VALUES: values})
+            self.feed_cache.prune(self.max_disk_bytes)
+
+    def compute(self, kernel, inputs, **params):
+        """
+        compute the kernel over the inputs with the params, or return the
+        registered result, the result is read only since it is shared.
+        """
+        key = get_indicator_key(kernel, inputs, params)
+        values = self._load(key)
+        if values is not None:
+            self.hits += 1
+            self._save(key, values, persist=False)
+            return values
+
+        self.misses += 1
+        values = np.asarray(kernel(*inputs, **params))
+        values.setflags(write=False)
+        self._save(key, values, persist=True)
+        return values
+
+
+_REGISTRY = IndicatorRegistry()
+
+
+def get_registry():
+    """get the registry of the process."""
+    return _REGISTRY
+
+
+def compute(kernel, inputs, **params):
+    """compute the kernel by the registry of the process."""
+    return _REGISTRY.compute(kernel, inputs, **params)
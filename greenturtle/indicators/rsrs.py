@@ -13,39 +13,135 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
-""" RSRS indicator for backtrader"""
+"""
+RSRS indicator for backtrader.
 
+The slope of the high on the low over the rolling window is computed by the
+closed form of the simple linear regression from the rolling sums, which
+are updated in O(1) per bar in next, and over the whole arrays in once.
+
+    rsrs: the slope, -1 before the first full window
+    r2: the r squared of the regression
+    zscore: the standard score of the slope over zscore_period slopes
+    weighted: the zscore weighted by the r squared
+"""
+
+import collections
+import math
 
 from backtrader.indicator import Indicator
 import numpy as np
-from sklearn.linear_model import LinearRegression
+
+from greenturtle.indicators import kernels
+
+
+class RollingSums:
+    """
+    sums of the columns over the rolling window updated in O(1), the sums
+    are recomputed from the window every period updates, so the rounding
+    error does not accumulate over the history.
+    """
+
+    def __init__(self, period, width):
+        self.period = period
+        self.window = collections.deque()
+        self.sums = [0.0] * width
+        self.updates = 0
+
+    def push(self, values):
+        """push the values into the window and drop the oldest one."""
+        self.window.append(values)
+        oldest = None
+        if len(self.window) > self.period:
+            oldest = self.window.popleft()
+
+        self.updates += 1
+        if self.updates >= self.period:
+            self.sums = [math.fsum(column) for column in zip(*self.window)]
+            self.updates = 0
+            return
+
+        for i, value in enumerate(values):
+            self.sums[i] += value
+            if oldest is not None:
+                self.sums[i] -= oldest[i]
+
+    def is_full(self):
+        """whether the window is full."""
+        return len(self.window) == self.period
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def ols_by_sums(n, sx, sy, sxy, sxx, syy):
+    """scalar version of kernels.ols_by_sums."""
+    vxx = sxx - sx * sx / n
+    vyy = syy - sy * sy / n
+    vxy = sxy - sx * sy / n
+    x_varied = vxx > kernels.ROUNDING * sxx
+    y_varied = vyy > kernels.ROUNDING * syy
+
+    slope = vxy / vxx if x_varied else 0.0
+    r2 = vxy * vxy / (vxx * vyy) if x_varied and y_varied else 0.0
+    return slope, r2
+
+
+def zscore_by_sums(n, value, sv, svv):
+    """scalar version of kernels.rolling_zscore."""
+    mean = sv / n
+    mean_sq = svv / n
+    var = mean_sq - mean * mean
+    if var > kernels.ROUNDING * mean_sq:
+        return (value - mean) / math.sqrt(var)
+    return 0.0
 
 
 class RSRS(Indicator):
 
     """RSRS indicator."""
 
-    lines = ('rsrs',)
-    params = (('period', 18),)
+    lines = ('rsrs', 'r2', 'zscore', 'weighted')
+    params = (('period', 18), ('zscore_period', 600))
 
     def __init__(self):
         super().__init__()
         self.period = self.p.period
+        self.price_sums = RollingSums(self.p.period, 5)
+        self.slope_sums = RollingSums(self.p.zscore_period, 2)
 
+    # pylint: disable=no-member
     def next(self):
-        """compute teh rsrs value."""
-
-        x = self.data.low.get(size=self.period)
-        y = self.data.high.get(size=self.period)
-        if len(x) == 0 or len(y) == 0:
-            # pylint: disable=no-member
+        """compute the rsrs value."""
+        x, y = self.data.low[0], self.data.high[0]
+        self.price_sums.push((x, y, x * y, x * x, y * y))
+        if not self.price_sums.is_full():
             self.lines.rsrs[0] = -1
             return
 
-        x = np.array(x)
-        y = np.array(y)
-        lr = LinearRegression()
-        lr.fit(x.reshape(-1, 1), y)
+        slope, r2 = ols_by_sums(self.period, *self.price_sums.sums)
+        self.lines.rsrs[0] = slope
+        self.lines.r2[0] = r2
+
+        self.slope_sums.push((slope, slope * slope))
+        if self.slope_sums.is_full():
+            zscore = zscore_by_sums(self.p.zscore_period,
+                                    slope,
+                                    *self.slope_sums.sums)
+            self.lines.zscore[0] = zscore
+            self.lines.weighted[0] = zscore * r2
+
+    # pylint: disable=no-member
+    def once(self, start, end):
+        """compute the rsrs values over the arrays."""
+        low = np.asarray(self.data.low.array[:end])
+        high = np.asarray(self.data.high.array[:end])
+        slope, r2 = kernels.rolling_ols(low, high, self.period)
+        zscore = kernels.rolling_zscore(slope, self.p.zscore_period)
+        slope[np.isnan(slope)] = -1
 
-        # pylint: disable=no-member
-        self.lines.rsrs[0] = lr.coef_[0]
+        for line, values in ((self.lines.rsrs, slope),
+                             (self.lines.r2, r2),
+                             (self.lines.zscore, zscore),
+                             (self.lines.weighted, zscore * r2)):
+            array = line.array
+            for i in range(start, end):
+                array[i] = values[i]
@@ -0,0 +1,182 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+resumable indicators with the persisted rolling state.
+
+The state of an indicator after the last bar is enough to advance it by the
+new bars, including
+
+    ema: the last value
+    atr: the last value and the last close for the true range
+    highest and lowest: the last period - 1 values of the input
+
+The resumed indicators start from the state and are ready from the first
+new bar, the floating point operations are the same as the backtrader
+indicators, so the values are the same as the ones over the full history.
+"""
+
+import backtrader as bt
+
+from greenturtle.indicators import adapters
+
+
+EMA = "ema"
+ATR = "atr"
+HIGHEST = "highest"
+LOWEST = "lowest"
+
+VALUE = "value"
+CLOSE = "close"
+WINDOW = "window"
+
+
+class ResumedEMA(bt.Indicator):
+    """ema resumed from the last value."""
+
+    lines = ("ema",)
+    params = (("period", 30), (VALUE, None))
+
+    def __init__(self):
+        super().__init__()
+        self.alpha = 2.0 / (1.0 + self.p.period)
+        self.alpha1 = 1.0 - self.alpha
+
+    # pylint: disable=no-member
+    def next(self):
+        prev = self.lines.ema[-1] if len(self) > 1 else self.p.value
+        self.lines.ema[0] = prev * self.alpha1 + self.data[0] * self.alpha
+
+    # pylint: disable=no-member
+    def get_state(self):
+        """get the state after the current bar."""
+        return {VALUE: self.lines.ema[0]}
+
+
+class ResumedATR(bt.Indicator):
+    """atr resumed from the last value and the last close."""
+
+    lines = ("atr",)
+    params = (("period", 14), (VALUE, None), (CLOSE, None))
+
+    def __init__(self):
+        super().__init__()
+        self.alpha = 1.0 / self.p.period
+        self.alpha1 = 1.0 - self.alpha
+
+    # pylint: disable=no-member
+    def next(self):
+        if len(self) > 1:
+            prev, prev_close = self.lines.atr[-1], self.data.close[-1]
+        else:
+            prev, prev_close = self.p.value, self.p.close
+
+        true_range = max(self.data.high[0], prev_close) - \
+            min(self.data.low[0], prev_close)
+        self.lines.atr[0] = prev * self.alpha1 + true_range * self.alpha
+
+    # pylint: disable=no-member
+    def get_state(self):
+        """get the state after the current bar."""
+        return {VALUE: self.lines.atr[0], CLOSE: self.data.close[0]}
+
+
+class _ResumedRolling(bt.Indicator):
+    """rolling indicator resumed from the last period - 1 values."""
+
+    params = (("period", 1), (WINDOW, ()))
+
+    # the function over the values of the rolling window
+    func = None
+
+    def get_values(self, size):
+        """get the last size inputs including the ones in the state."""
+        count = min(len(self), size)
+        values = list(self.data.get(size=count)) if count > 0 else []
+        missing = size - count
+        if missing > 0:
+            values = list(self.p.window[-missing:]) + values
+
+        return values
+
+    def next(self):
+        # pylint: disable=not-callable
+        self.lines[0][0] = self.func(self.get_values(self.p.period))
+
+    def get_state(self):
+        """get the state after the current bar."""
+        return {WINDOW: self.get_values(self.p.period - 1)}
+
+
+class ResumedHighest(_ResumedRolling):
+    """highest resumed from the last period - 1 values."""
+
+    lines = ("highest",)
+    func = staticmethod(max)
+
+
+class ResumedLowest(_ResumedRolling):
+    """lowest resumed from the last period - 1 values."""
+
+    lines = ("lowest",)
+    func = staticmethod(min)
+
+
+def create_indicator(kind, data, period, state=None):
+    """
+    create the kernel indicator of the data feed shared by the registry,
+    or the resumed one if the state is given, the rolling indicators are
+    over the close.
+    """
+    # pylint: disable=too-many-function-args,unexpected-keyword-arg
+    if kind == EMA:
+        if state is None:
+            return adapters.EMA(data, period=period)
+        return ResumedEMA(data, period=period, value=state[VALUE])
+
+    if kind == ATR:
+        if state is None:
+            return adapters.ATR(data, period=period)
+        return ResumedATR(data,
+                          period=period,
+                          value=state[VALUE],
+                          close=state[CLOSE])
+
+    if kind in (HIGHEST, LOWEST):
+        builtin, resumed = (adapters.Highest, ResumedHighest) \
+            if kind == HIGHEST else (adapters.Lowest, ResumedLowest)
+        if state is None:
+            return builtin(data.close, period=period)
+        return resumed(data.close, period=period, window=tuple(state[WINDOW]))
+
+    raise ValueError(f"unknown indicator kind {kind}")
+
+
+def get_state(kind, indicator, data, period):
+    """get the state of the indicator created by create_indicator."""
+    if hasattr(indicator, "get_state"):
+        return indicator.get_state()
+
+    if kind == EMA:
+        return {VALUE: indicator[0]}
+
+    if kind == ATR:
+        return {VALUE: indicator[0], CLOSE: data.close[0]}
+
+    if kind in (HIGHEST, LOWEST):
+        size = period - 1
+        return {WINDOW: list(data.close.get(size=size)) if size > 0 else []}
+
+    raise ValueError(f"unknown indicator kind {kind}")
@@ -17,6 +17,7 @@
 
 from datetime import datetime
 from datetime import date as datetime_date
+from datetime import timedelta
 
 import backtrader as bt
 
@@ -25,14 +26,26 @@ from greenturtle.brokers import tqbroker
 from greenturtle.constants import types
 from greenturtle.constants import varieties
 from greenturtle.data.datafeed import db
+from greenturtle.db import api
 from greenturtle import exception
+from greenturtle.inference import snapshot
 from greenturtle.stragety import ema
+from greenturtle.util import calendar
 from greenturtle.util.logging import logging
+from greenturtle.util import profiler
 from greenturtle.util import util
 
 
 logger = logging.get_logger()
 
+STRATEGY = ema.EMAEnhanced
+STRATEGY_PERIODS = {
+    "fast_period": 10,
+    "slow_period": 100,
+    "channel_period": 50,
+    "atr_period": 100,
+}
+
 
 # pylint: disable=too-many-instance-attributes
 class Inference:
@@ -51,6 +64,12 @@ class Inference:
         self.trading_date = trading_date
         self.varieties = varieties.CN_VARIETIES
 
+        # the indicators are resumed from the restored snapshot if any
+        self.snapshot_store = snapshot.get_snapshot_store(conf)
+        self.snapshot_version = snapshot.get_snapshot_version(
+            STRATEGY, STRATEGY_PERIODS)
+        self.snapshot = None
+
         self.cerebro = bt.Cerebro()
         self.set_broker()
 
@@ -61,6 +80,7 @@ class Inference:
         """initiate all"""
 
         logger.info("start initializing data and strategy")
+        self.snapshot = self.restore_snapshot()
         self.add_strategy()
         self.add_data()
         logger.info("initializing data and strategy success")
@@ -179,59 +199,193 @@ class Inference:
                     "group_risk_factors: %s, allow_short: %s",
                     risk_factor, group_risk_factors, allow_short)
 
-        self.cerebro.addstrategy(ema.EMAEnhanced,
-                                 fast_period=10,
-                                 slow_period=100,
-                                 channel_period=50,
-                                 atr_period=100,
+        indicator_states = None
+        if self.snapshot is not None:
+            indicator_states = self.snapshot.states
+
+        self.cerebro.addstrategy(STRATEGY,
                                  risk_factor=risk_factor,
                                  varieties=self.varieties,
                                  group_risk_factors=group_risk_factors,
                                  allow_short=allow_short,
                                  inference=True,
-                                 trading_date=self.trading_date)
-
-    def add_data(self):
-        """add data to cerebro."""
-
+                                 trading_date=self.trading_date,
+                                 indicator_states=indicator_states,
+                                 **STRATEGY_PERIODS)
+
+    def get_start_date(self):
+        """
+        get the start date of the data, which only covers the bars to warm
+        up the indicators of the strategy before the trading date.
+        """
+        bars = STRATEGY.get_warmup_bars(**STRATEGY_PERIODS)
+        start_date = calendar.get_cn_start_date_by_bars(self.trading_date,
+                                                        bars)
+        logger.info("warm up %d bars from %s", bars, start_date)
+        return datetime.combine(start_date, datetime.min.time())
+
+    def get_names(self):
+        """get the names of the varieties in the whitelist."""
         whitelist = []
         if hasattr(self.conf, "whitelist"):
             whitelist = self.conf.whitelist
 
-        start_date = datetime(2024, 1, 1)
+        return [name for group in self.varieties.values() for name in group
+                if name in whitelist]
+
+    def get_data_version(self, dbapi, name, date):
+        """get the data version of the variety up to the date."""
+        get_version = \
+            dbapi.continuous_contract_get_version_by_variety_source_country
+        return get_version(
+            name,
+            self.conf.source,
+            self.conf.country,
+            end_date=datetime.combine(date, datetime.min.time()))
+
+    def get_new_contracts(self, dbapi, name, start_date):
+        """get the continuous contracts of the variety from the date."""
+        get_contracts = dbapi.\
+            continuous_contract_get_by_variety_source_country_start_end_date
+        return get_contracts(name,
+                             self.conf.source,
+                             self.conf.country,
+                             start_date=start_date)
+
+    def get_stale_reason(self, indicator_snapshot):
+        """
+        get the reason why the snapshot is stale, or None if it is valid.
+        The snapshot is stale if the varieties changed, it is too old to
+        warm up, the data up to the snapshot date was revised, any variety
+        has no bar on the next trading day since the padding of the new
+        bars can not copy the bar before the snapshot, or any contract
+        rolled after the date since the back adjustment rescales all the
+        history prices.
+        """
+        names = self.get_names()
+        if set(names) != set(indicator_snapshot.states):
+            return "the varieties changed"
+
+        if indicator_snapshot.date >= self.trading_date:
+            return "no new bar after the snapshot"
+
+        bars = STRATEGY.get_warmup_bars(**STRATEGY_PERIODS)
+        start_date = calendar.get_cn_start_date_by_bars(self.trading_date,
+                                                        bars)
+        if indicator_snapshot.date < start_date:
+            return "the snapshot is older than the warm up bars"
+
+        dbapi = api.DBAPI(self.conf.db)
+        for name in names:
+            reason = self.get_data_stale_reason(dbapi,
+                                                name,
+                                                indicator_snapshot)
+            if reason is not None:
+                return reason
+
+        return None
+
+    def get_data_stale_reason(self, dbapi, name, indicator_snapshot):
+        """get the reason why the data of the variety is stale, or None."""
+        data_version = self.get_data_version(dbapi,
+                                             name,
+                                             indicator_snapshot.date)
+        if data_version != indicator_snapshot.data_versions.get(name):
+            return f"the data of {name} was revised"
+
+        start_date = datetime.combine(indicator_snapshot.date,
+                                      datetime.min.time()) + timedelta(days=1)
+        contracts = self.get_new_contracts(dbapi, name, start_date)
+        next_date = calendar.get_cn_next_trading_day(indicator_snapshot.date)
+        if all(c.date.date() != next_date for c in contracts):
+            return f"no bar of {name} on {next_date}"
+
+        if any(c.adjust_factor != 1 for c in contracts):
+            return f"the contract of {name} rolled"
+
+        return None
+
+    def restore_snapshot(self):
+        """restore the snapshot, return None to rebuild all indicators."""
+        if self.snapshot_store is None:
+            return None
+
+        indicator_snapshot = self.snapshot_store.get(self.snapshot_version)
+        if indicator_snapshot is None:
+            logger.info("no indicator snapshot, rebuild all indicators")
+            return None
+
+        reason = self.get_stale_reason(indicator_snapshot)
+        if reason is not None:
+            logger.info("indicator snapshot of %s is stale since %s, "
+                        "rebuild all indicators",
+                        indicator_snapshot.date, reason)
+            return None
+
+        logger.info("restore indicator snapshot of %s",
+                    indicator_snapshot.date)
+        return indicator_snapshot
+
+    def save_snapshot(self, strategy):
+        """save the indicator states after the last bar."""
+        if self.snapshot_store is None or len(strategy) == 0:
+            return
+
+        date = strategy.datas[0].datetime.date(0)
+        dbapi = api.DBAPI(self.conf.db)
+        data_versions = {name: self.get_data_version(dbapi, name, date)
+                         for name in strategy.names}
+        self.snapshot_store.put(snapshot.Snapshot(
+            self.snapshot_version,
+            date,
+            data_versions,
+            strategy.get_indicator_states()))
+        logger.info("save indicator snapshot of %s", date)
+
+    def add_data(self):
+        """add data to cerebro."""
+
+        # only the bars after the snapshot are required if restored
+        if self.snapshot is not None:
+            start_date = datetime.combine(self.snapshot.date,
+                                          datetime.min.time()) + \
+                timedelta(days=1)
+        else:
+            start_date = self.get_start_date()
         end_date = datetime.today()
 
         # add all data to simulator
-        for group in self.varieties.values():
-            for name in group:
-                if name not in whitelist:
-                    continue
-                data = db.ContinuousContractDB(db_conf=self.conf.db,
-                                               variety=name,
-                                               source=self.conf.source,
-                                               country=self.conf.country,
-                                               start_date=start_date,
-                                               end_date=end_date,
-                                               plot=False,
-                                               padding=True)
-
-                # add the data to simulator
-                self.cerebro.adddata(data, name=name)
-                self.set_multiplier_and_auto_margin(name)
-
-                logger.info("add data %s to cerebro", name)
+        for name in self.get_names():
+            data = db.ContinuousContractDB(db_conf=self.conf.db,
+                                           variety=name,
+                                           source=self.conf.source,
+                                           country=self.conf.country,
+                                           start_date=start_date,
+                                           end_date=end_date,
+                                           plot=False,
+                                           padding=True)
+
+            # add the data to simulator
+            self.cerebro.adddata(data, name=name)
+            self.set_multiplier_and_auto_margin(name)
+
+            logger.info("add data %s to cerebro", name)
 
     def run(self):
         """run the cerebro to perform really trading."""
         # initiate adding the data feed and strategy
-        self.initiate_data_and_strategy()
+        with profiler.phase("inference.initiate"):
+            self.initiate_data_and_strategy()
 
         # Print out the starting conditions
         value = self.cerebro.broker.getvalue()
         logger.info("starting trading with value: %.1f", value)
 
         # Run over everything
-        self.cerebro.run()
+        with profiler.phase("inference.run"):
+            strategies = self.cerebro.run()
+        with profiler.phase("inference.save_snapshot"):
+            self.save_snapshot(strategies[0])
 
         # Print out the final result
         value = self.cerebro.broker.getvalue()
@@ -240,7 +394,8 @@ class Inference:
     def rolling(self):
         """rolling the contract which is going to be expired."""
         logger.info("start rolling contract")
-        self.cerebro.broker.rolling()
+        with profiler.phase("inference.rolling"):
+            self.cerebro.broker.rolling()
         logger.info("finish rolling contract")
 
     def account_overview(self):
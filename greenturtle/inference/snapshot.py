@@ -0,0 +1,161 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+snapshot of the indicator states for the incremental inference.
+
+The snapshot holds the indicator states of the strategy after the last bar,
+the date of the bar and the data version of every variety up to the date.
+It is addressed by the version of the strategy and its parameters, so the
+snapshot of other parameters is never restored. The snapshot is stored in
+the local directory or the database.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+
+from greenturtle.db import api
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+# bump the version if the format of the snapshot or the states changes
+SNAPSHOT_FORMAT_VERSION = 1
+SUFFIX = ".json"
+
+
+def get_snapshot_version(strategy, params):
+    """get the version of the snapshot by the strategy and parameters."""
+    content = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "strategy": f"{strategy.__module__}.{strategy.__qualname__}",
+        "params": params,
+    }
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# pylint: disable=too-few-public-methods
+class Snapshot:
+    """indicator states of the strategy after the bar of the date."""
+
+    def __init__(self, version, date, data_versions, states):
+        self.version = version
+        self.date = date
+        self.data_versions = data_versions
+        self.states = states
+
+    def dumps(self):
+        """dump the snapshot to json."""
+        return json.dumps({
+            "version": self.version,
+            "date": self.date.isoformat(),
+            "data_versions": self.data_versions,
+            "states": self.states,
+        })
+
+    @classmethod
+    def loads(cls, content):
+        """load the snapshot from json."""
+        values = json.loads(content)
+        return cls(values["version"],
+                   datetime.date.fromisoformat(values["date"]),
+                   values["data_versions"],
+                   values["states"])
+
+
+class LocalSnapshotStore:
+    """snapshot store in the local directory."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_path(self, version):
+        """get the snapshot file path by version."""
+        return os.path.join(self.directory, version + SUFFIX)
+
+    def get(self, version):
+        """get the snapshot by version, return None if missed."""
+        path = self.get_path(version)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                return Snapshot.loads(f.read())
+        # pylint: disable=broad-except
+        except Exception:
+            logger.warning("broken indicator snapshot %s, ignore it", path)
+            return None
+
+    def put(self, snapshot):
+        """
+        put the snapshot, the file is written to a temporary file then
+        renamed to avoid partial file read.
+        """
+        path = self.get_path(snapshot.version)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=SUFFIX)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(snapshot.dumps())
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class DBSnapshotStore:
+    """snapshot store in the database."""
+
+    def __init__(self, db_conf):
+        self.dbapi = api.DBAPI(db_conf)
+
+    def get(self, version):
+        """get the snapshot by version, return None if missed."""
+        snapshot_ref = self.dbapi.indicator_snapshot_get_by_version(version)
+        if snapshot_ref is None:
+            return None
+
+        return Snapshot.loads(snapshot_ref.content)
+
+    def put(self, snapshot):
+        """put the snapshot."""
+        self.dbapi.indicator_snapshot_put(
+            snapshot.version,
+            datetime.datetime.combine(snapshot.date, datetime.time()),
+            snapshot.dumps())
+
+
+def get_snapshot_store(conf):
+    """
+    get the snapshot store by the config, the snapshot config is either
+    the local directory or the database, return None if not configured.
+    """
+    snapshot_conf = getattr(conf, "snapshot", None)
+    if snapshot_conf is None:
+        return None
+
+    if getattr(snapshot_conf, "directory", None):
+        return LocalSnapshotStore(snapshot_conf.directory)
+
+    if getattr(snapshot_conf, "db", False):
+        return DBSnapshotStore(conf.db)
+
+    return None
@@ -26,6 +26,7 @@ from greenturtle.inference import inference
 from greenturtle.util import calendar
 from greenturtle.util.logging import logging
 from greenturtle.util.notifier import notifier
+from greenturtle.util import profiler
 from greenturtle.util import util
 
 
@@ -73,6 +74,12 @@ class Server:
         logger.info("initializing syncing delta data success")
 
     def trading(self, sleep_time=200):
+        """do trading, which is profiled if the profiler is configured."""
+        with profiler.profiling(name="trading",
+                                **profiler.get_options(self.conf)):
+            self._trading(sleep_time)
+
+    def _trading(self, sleep_time):
         """do trading"""
 
         today = datetime.date.today()
@@ -85,8 +92,10 @@ class Server:
                                  "wakeup, it's time to swimming")
 
         logger.info("prepare syncing the delta data")
-        self.delta_data_syncer.synchronize_delta_contracts()
-        self.delta_data_syncer.synchronize_delta_continuous_contracts()
+        with profiler.phase("server.sync_delta_contracts"):
+            self.delta_data_syncer.synchronize_delta_contracts()
+        with profiler.phase("server.sync_delta_continuous_contracts"):
+            self.delta_data_syncer.synchronize_delta_continuous_contracts()
 
         util.logger_and_notifier(self.notifier,
                                  "finish preparing the delta data success")
@@ -16,22 +16,56 @@
 """ Base strategy class for backtrader which implements some basic interface"""
 
 import abc
-import copy
 from datetime import date as datetime_date
 
 import backtrader as bt
+import numpy as np
 
 from greenturtle.constants import types
+from greenturtle.data.datafeed import array
 from greenturtle.data.datafeed import db
 from greenturtle.data.datafeed import mock
 from greenturtle.data import validation
+from greenturtle.indicators import kernels
+from greenturtle.indicators import state
+from greenturtle.stragety import sizing
 from greenturtle.util.logging import logging
 from greenturtle import exception
 
 
 logger = logging.get_logger()
 
+# the weight of the seed below which the smoothed indicators are converged
+WARMUP_TOLERANCE = 0.01
+
+
+# pylint: disable=too-few-public-methods
+class PositionSnapshot:
+    """
+    snapshot of the positions in one pass, including the hold, long and
+    short symbols and the current portfolios from name to size.
+    """
+
+    def __init__(self):
+        self.hold = set()
+        self.long = set()
+        self.short = set()
+        self.portfolios = {}
+
+    def add(self, name, size):
+        """add the position size of the name to the snapshot."""
+        if size > 0:
+            self.long.add(name)
+        elif size < 0:
+            self.short.add(name)
+        else:
+            return
+
+        self.hold.add(name)
+        self.portfolios[name] = size
 
+
+# pylint: disable=too-many-public-methods
 class BaseStrategy(bt.Strategy):
 
     """ base strategy for backtrader framework."""
@@ -45,7 +79,9 @@ class BaseStrategy(bt.Strategy):
                  varieties=None,
                  group_risk_factors=None,
                  inference=False,
-                 trading_date=datetime_date.today()):
+                 trading_date=datetime_date.today(),
+                 indicator_states=None,
+                 trade_start_date=None):
 
         super().__init__()
         self.allow_short = allow_short
@@ -54,9 +90,19 @@ class BaseStrategy(bt.Strategy):
         self.group_risk_factors = group_risk_factors
         self.inference = inference
         self.trading_date = trading_date
+        # the bars before the trade start date only warm up the indicators
+        if hasattr(trade_start_date, "date"):
+            trade_start_date = trade_start_date.date()
+        self.trade_start_date = trade_start_date
         self.order = None
         self.bankruptcy = False
         self.portfolio_type = types.PORTFOLIO_TYPE_ATR
+        self.mults = None
+        self.current_atrs = None
+        # the persisted states from name to key to state, the indicators
+        # with the state are resumed from it instead of the full history
+        self.indicator_states = indicator_states or {}
+        self.indicator_specs = {}
         self._init_others(atr_period)
 
     def _init_others(self, atr_period):
@@ -64,10 +110,66 @@ class BaseStrategy(bt.Strategy):
         self.symbols_data = {}
         self.atrs = {}
         self.names = self.getdatanames()
+        # index the position key to name and the name to group
+        self.data_names = {}
+        self.group_names = {}
         for name in self.names:
             data = self.getdatabyname(name)
             self.symbols_data[name] = data
-            self.atrs[name] = bt.indicators.ATR(data, period=atr_period)
+            self.atrs[name] = self.add_indicator(name,
+                                                 "atr",
+                                                 state.ATR,
+                                                 atr_period)
+
+        if self.varieties is not None:
+            for group_name, group_value in self.varieties.items():
+                for variety in group_value:
+                    self.group_names.setdefault(variety, group_name)
+
+        # the arrays for sizing all the names at once
+        self.name_index = {name: i for i, name in enumerate(self.names)}
+        self.groups = list(self.varieties or {})
+        self.membership = sizing.get_membership(self.names,
+                                                self.groups,
+                                                self.group_names)
+
+    def add_indicator(self, name, key, kind, period):
+        """
+        add the indicator of the name, which is resumed from the persisted
+        state if any, the state is saved by get_indicator_states.
+        """
+        data = self.symbols_data[name]
+        indicator_state = self.indicator_states.get(name, {}).get(key)
+        indicator = state.create_indicator(kind, data, period, indicator_state)
+        self.indicator_specs.setdefault(name, {})[key] = \
+            (kind, indicator, period)
+
+        return indicator
+
+    def get_indicator_states(self):
+        """get the states of the indicators added by add_indicator."""
+        return {
+            name: {key: state.get_state(kind,
+                                        indicator,
+                                        self.symbols_data[name],
+                                        period)
+                   for key, (kind, indicator, period) in specs.items()}
+            for name, specs in self.indicator_specs.items()
+        }
+
+    # pylint: disable=unused-argument
+    @classmethod
+    def get_warmup_bars(cls,
+                        *,
+                        tolerance=WARMUP_TOLERANCE,
+                        atr_period=100,
+                        **kwargs):
+        """
+        get the number of bars to warm up the indicators with the same
+        parameters as __init__, the indicators of the strategy computed
+        over the bars are close to the ones over the full history.
+        """
+        return kernels.get_atr_convergence_bars(atr_period, tolerance)
 
     def _clear_order(self):
         self.order = None
@@ -95,16 +197,24 @@ class BaseStrategy(bt.Strategy):
 
         data_date = self.datas[0].datetime.date(0)
 
-        self._validate_all_data()
-
-        # In the inference model, only perform a trade with the same date.
+        # In the inference model, only perform a trade with the same date,
+        # the bars before the trading date only warm up the indicators, they
+        # are not validated so the stale or padded history does not abort
+        # the inference.
         # TODO(wsfdl), more strict validation for online trading data.
         if self.inference:
             if self.trading_date != data_date:
-                logger.info("%s skip trading since not match inference date",
-                            data_date)
+                if data_date > self.trading_date:
+                    logger.info("%s skip trading since not match inference "
+                                "date", data_date)
                 return
 
+        if (self.trade_start_date is not None and
+                data_date < self.trade_start_date):
+            return
+
+        self._validate_all_data()
+
         if self.order:
             return
 
@@ -120,9 +230,10 @@ class BaseStrategy(bt.Strategy):
             logger.warning("%s trading with open order", data_date)
 
         # 1. get the long and short hold position
-        hold = self.get_hold_symbols()
-        hold_long = self.get_long_symbols_within_hold()
-        hold_short = self.get_short_symbols_within_hold()
+        snapshot = self.get_position_snapshot()
+        hold = snapshot.hold
+        hold_long = snapshot.long
+        hold_short = snapshot.short
 
         # 2. compute the long and short desired position
         desired_long = self.compute_desired_long_symbols(hold_long, hold)
@@ -140,7 +251,7 @@ class BaseStrategy(bt.Strategy):
                  f"\ndesired short: {sorted(list(desired_short))}")
 
         # 4. get the current portfolios
-        current_portfolios = self.get_current_portfolios()
+        current_portfolios = dict(snapshot.portfolios)
 
         # 5. compute the desired portfolios with detailed size
         desired_portfolios = self.compute_desired_portfolios(
@@ -191,46 +302,36 @@ class BaseStrategy(bt.Strategy):
         if isinstance(key, db.ContinuousContractDB):
             return key.p.variety
 
-        if isinstance(key, mock.MockPandasData):
+        if isinstance(key, (array.ArrayData, mock.MockPandasData)):
             return key.get_name()
 
         raise ValueError("unknown position key")
 
-    def get_hold_symbols(self):
-        """get symbols in hold."""
-        symbols = set()
+    def get_position_snapshot(self):
+        """get the hold, long, short symbols and portfolios in one pass."""
+        snapshot = PositionSnapshot()
         positions = self.getpositions()
 
         for key, position in positions.items():
-            name = self._get_name_from_position_key(key)
-            if position.size > 0 or position.size < 0:
-                symbols.add(name)
+            name = self.data_names.get(key)
+            if name is None:
+                name = self._get_name_from_position_key(key)
+                self.data_names[key] = name
+            snapshot.add(name, position.size)
 
-        return symbols
+        return snapshot
+
+    def get_hold_symbols(self):
+        """get symbols in hold."""
+        return self.get_position_snapshot().hold
 
     def get_long_symbols_within_hold(self):
         """get long symbols in hold."""
-        symbols = set()
-        positions = self.getpositions()
-
-        for key, position in positions.items():
-            name = self._get_name_from_position_key(key)
-            if position.size > 0:
-                symbols.add(name)
-
-        return symbols
+        return self.get_position_snapshot().long
 
     def get_short_symbols_within_hold(self):
         """get short symbols in hold."""
-        symbols = set()
-        positions = self.getpositions()
-
-        for key, position in positions.items():
-            name = self._get_name_from_position_key(key)
-            if position.size < 0:
-                symbols.add(name)
-
-        return symbols
+        return self.get_position_snapshot().short
 
     def compute_desired_long_symbols(self, long_hold, hold):
         """compute the desired long symbols"""
@@ -314,76 +415,44 @@ class BaseStrategy(bt.Strategy):
 
     def get_current_portfolios(self):
         """get current portfolios within hold."""
+        return self.get_position_snapshot().portfolios
 
-        portfolios = {}
-        positions = self.getpositions()
-
-        for key, position in positions.items():
-            name = self._get_name_from_position_key(key)
-            if position.size != 0:
-                # pylint: disable=protected-access
-                portfolios[name] = position.size
-
-        return portfolios
-
-    def _compute_single_risk_with_size(self, name, size):
-        """compute real risk according to the size."""
-        # get the mult parameter
-        data = self.symbols_data[name]
-        commissioninfo = self.broker.getcommissioninfo(data)
-        mult = commissioninfo.p.mult
-
-        # get the atr
-        atr = self.atrs[name]
+    def _get_mults(self):
+        """get the multipliers of all the names, which are fetched once."""
+        if self.mults is None:
+            self.mults = np.array(
+                [self.broker.getcommissioninfo(self.symbols_data[name]).p.mult
+                 for name in self.names],
+                dtype=float)
 
-        # get the total value
-        total_value = self.broker.get_value()
+        return self.mults
 
-        # compute the risk
-        risk = abs(size) * mult * atr[0] / total_value
+    def _get_current_atrs(self):
+        """get the current atr of all the names, which are fetched per bar."""
+        length = len(self)
+        if self.current_atrs is None or self.current_atrs[0] != length:
+            self.current_atrs = (
+                length, np.array([self.atrs[name][0] for name in self.names]))
 
-        return risk
+        return self.current_atrs[1]
 
-    def _compute_single_portfolio_by_atr(self, name):
-        """compute portfolio by atr.
+    def _compute_sizes(self):
+        """compute the sizes of all the names in one pass.
 
         formula: size = risk_factor * value / atr / mult
         """
-        # get the mult parameter
-        data = self.symbols_data[name]
-        commissioninfo = self.broker.getcommissioninfo(data)
-        mult = commissioninfo.p.mult
-
-        # get the atr
-        atr = self.atrs[name]
-
-        # get the total value
-        total_value = self.broker.get_value()
-
-        # compute the size
-        size = int(self.risk_factor * total_value / (atr[0] * mult))
-
-        return size
-
-    def _compute_single_portfolio(self, name):
-        """compute single portfolio."""
-
-        if self.portfolio_type == types.PORTFOLIO_TYPE_ATR:
-            size = self._compute_single_portfolio_by_atr(name)
-        else:
+        if self.portfolio_type != types.PORTFOLIO_TYPE_ATR:
             raise NotImplementedError
 
-        return size
+        return sizing.compute_sizes_by_atr(self.risk_factor,
+                                           self.broker.get_value(),
+                                           self._get_current_atrs(),
+                                           self._get_mults())
 
     def _get_group_by_name(self, name):
         """get group name by variety name"""
-        for group_name, group_value in self.varieties.items():
-            for variety in group_value:
-                if variety == name:
-                    return group_name
-        return None
+        return self.group_names.get(name)
 
-    # pylint: disable = too-many-branches, too-many-locals, too-many-statements
     def adjust_portfolio_by_group(self,
                                   desired_portfolios,
                                   current_portfolios):
@@ -391,107 +460,37 @@ class BaseStrategy(bt.Strategy):
         if self.group_risk_factors is None:
             return desired_portfolios
 
-        adjust_desired_portfolios = copy.deepcopy(desired_portfolios)
-
-        # 1. calculate the group risk
-        group_risk_dict = {}
-        # calculate the group risk
-        for name, size in desired_portfolios.items():
-            # get group name
-            group_name = self._get_group_by_name(name)
-            # raise exception if group not found.
-            if group_name is None:
-                raise exception.GroupNameNotFound
-
-            # accumulate group risk in the desired portfolio
-            risk = self._compute_single_risk_with_size(name, size)
-            if group_name in group_risk_dict:
-                group_risk_dict[group_name] += risk
-            else:
-                group_risk_dict[group_name] = risk
-
-        # 2. adjust the size according to current group risk and the
-        # limitation of the group risk.
-        adjust_group_risk_dict = {}
+        desired = np.zeros(len(self.names))
+        in_desired = np.zeros(len(self.names), dtype=bool)
         for name, size in desired_portfolios.items():
-            # get the group name, group risk and limit
-            group_name = self._get_group_by_name(name)
-            group_risk = group_risk_dict[group_name]
-            group_limit = self.group_risk_factors[group_name]
-
-            # if the group risk it more than limit, then adjust the size
-            if group_risk > group_limit:
-                size = int(size * group_limit / group_risk)
-
-            # set the value to adjust_desired_portfolios
-            adjust_desired_portfolios[name] = size
-
-            # accumulate the adjust group risk in the desired portfolio
-            adjust_risk = self._compute_single_risk_with_size(name, size)
-            if group_name in adjust_group_risk_dict:
-                adjust_group_risk_dict[group_name] += adjust_risk
-            else:
-                adjust_group_risk_dict[group_name] = adjust_risk
-
-        # 3. refine the desired_portfolios with low startup value
-        # 3.1 refine the size with current and desired hold position
-        for name, current_size in current_portfolios.items():
-            # skip if it not in the desired and adjust portfolios
-            if name not in desired_portfolios:
-                continue
-            if name not in adjust_desired_portfolios:
-                continue
-
-            # refine the 0 adjust size
-            desired_size = desired_portfolios[name]
-            adjust_size = adjust_desired_portfolios[name]
-            if desired_size != 0 and adjust_size == 0 and current_size != 0:
-                adjust_size = 1 if desired_size > 0 else -1
-            else:
-                continue
-
-            # compute the risk and prepare the group risk parameters
-            risk = self._compute_single_risk_with_size(name, adjust_size)
-            group_name = self._get_group_by_name(name)
-            adjust_group_risk = adjust_group_risk_dict[group_name]
-            group_limit = self.group_risk_factors[group_name]
-
-            # check if respect to the group risk limitation
-            if risk + adjust_group_risk > group_limit:
-                continue
-
-            # meet the requirement and refine the risk and size value
-            adjust_group_risk_dict[group_name] += risk
-            adjust_desired_portfolios[name] = adjust_size
-
-        # 3.2 refine the size with desired hold position
-        for name, desired_size in desired_portfolios.items():
-            # skip if it not in the adjust portfolios
-            if name not in adjust_desired_portfolios:
-                continue
-
-            # refine the 0 adjust size
-            adjust_size = adjust_desired_portfolios[name]
-            if desired_size != 0 and adjust_size == 0:
-                adjust_size = 1 if desired_size > 0 else -1
-            else:
-                continue
-
-            # compute the risk and prepare the group risk parameters
-            risk = self._compute_single_risk_with_size(name, adjust_size)
-            group_name = self._get_group_by_name(name)
-            adjust_group_risk = adjust_group_risk_dict[group_name]
-            group_limit = self.group_risk_factors[group_name]
-
-            # check if respect to the group risk limitation
-            if risk + adjust_group_risk > group_limit:
-                continue
-
-            # meet the requirement and refine the risk and size value
-            adjust_group_risk_dict[group_name] += risk
-            adjust_desired_portfolios[name] = adjust_size
-
-        return adjust_desired_portfolios
+            index = self.name_index[name]
+            desired[index] = size
+            in_desired[index] = True
+
+        limits = sizing.get_group_limits(self.groups,
+                                         self.group_risk_factors,
+                                         self.membership,
+                                         in_desired)
+
+        current = np.zeros(len(self.names))
+        current_order = []
+        for name, size in current_portfolios.items():
+            if name in self.name_index:
+                current[self.name_index[name]] = size
+                current_order.append(self.name_index[name])
+
+        adjusted = sizing.adjust_sizes_by_group(desired,
+                                                current,
+                                                self._get_current_atrs(),
+                                                self._get_mults(),
+                                                self.broker.get_value(),
+                                                self.membership,
+                                                limits,
+                                                current_order=current_order)
+
+        adjusted = adjusted.tolist()
+        return {name: int(adjusted[self.name_index[name]])
+                for name in desired_portfolios}
 
     def compute_desired_portfolios(self,
                                    long_desired,
@@ -503,13 +502,12 @@ class BaseStrategy(bt.Strategy):
         if len(long_desired) + len(short_desired) == 0:
             return desired_portfolios
 
-        for name in self.names:
-            size = self._compute_single_portfolio(name)
-
+        sizes = self._compute_sizes()
+        for name, size in zip(self.names, sizes):
             if name in long_desired:
-                desired_portfolios[name] = size
+                desired_portfolios[name] = int(size)
             if name in short_desired:
-                desired_portfolios[name] = -size
+                desired_portfolios[name] = -int(size)
 
         desired_portfolios = self.adjust_portfolio_by_group(
             desired_portfolios, current_portfolios)
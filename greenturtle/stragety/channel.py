@@ -15,7 +15,7 @@
 
 """ Channel class strategy for backtrader"""
 
-from backtrader.indicators import Highest, Lowest
+from greenturtle.indicators import adapters
 from greenturtle.stragety import base
 
 
@@ -36,10 +36,27 @@ class DonchianChannel(base.BaseStrategy):
         self.short_lowests = {}
         for name in self.names:
             data = self.symbols_data[name]
-            self.long_highests[name] = Highest(data.high, period=long_period)
-            self.long_lowests[name] = Lowest(data.low, period=long_period)
-            self.short_highests[name] = Highest(data.high, period=short_period)
-            self.short_lowests[name] = Lowest(data.low, period=short_period)
+            # pylint: disable=unexpected-keyword-arg,too-many-function-args
+            self.long_highests[name] = adapters.Highest(data.high,
+                                                        period=long_period)
+            self.long_lowests[name] = adapters.Lowest(data.low,
+                                                      period=long_period)
+            self.short_highests[name] = adapters.Highest(data.high,
+                                                         period=short_period)
+            self.short_lowests[name] = adapters.Lowest(data.low,
+                                                       period=short_period)
+
+    @classmethod
+    def get_warmup_bars(cls,
+                        *,
+                        tolerance=base.WARMUP_TOLERANCE,
+                        short_period=25,
+                        long_period=50,
+                        **kwargs):
+        """get the number of bars to warm up the indicators."""
+        bars = super().get_warmup_bars(tolerance=tolerance, **kwargs)
+        # the channel of the previous bar is compared
+        return max(bars, short_period + 1, long_period + 1)
 
     def is_buy_to_open(self, name):
         """determine whether a position should buy to open or not."""
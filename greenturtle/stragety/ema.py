@@ -15,7 +15,8 @@
 
 """Collection of EMA strategies for backtrader"""
 
-from backtrader.indicators import MovAv, Highest, Lowest
+from greenturtle.indicators import kernels
+from greenturtle.indicators import state
 from greenturtle.stragety import base
 
 
@@ -29,14 +30,29 @@ class EMA(base.BaseStrategy):
         self.fast_emas = {}
         self.slow_emas = {}
         for name in self.names:
-            data = self.getdatabyname(name)
-            self.fast_emas[name] = MovAv.Exponential(
-                data,
-                period=fast_period)
-
-            self.slow_emas[name] = MovAv.Exponential(
-                data,
-                period=slow_period)
+            self.fast_emas[name] = self.add_indicator(name,
+                                                      "fast_ema",
+                                                      state.EMA,
+                                                      fast_period)
+            self.slow_emas[name] = self.add_indicator(name,
+                                                      "slow_ema",
+                                                      state.EMA,
+                                                      slow_period)
+
+    @classmethod
+    def get_warmup_bars(cls,
+                        *,
+                        tolerance=base.WARMUP_TOLERANCE,
+                        fast_period=10,
+                        slow_period=100,
+                        **kwargs):
+        """get the number of bars to warm up the indicators."""
+        bars = super().get_warmup_bars(tolerance=tolerance, **kwargs)
+        for period in (fast_period, slow_period):
+            bars = max(bars,
+                       kernels.get_ema_convergence_bars(period, tolerance))
+
+        return bars
 
     def is_buy_to_open(self, name):
         """determine whether a position should buy to open or not."""
@@ -82,9 +98,24 @@ class EMAEnhanced(EMA):
         self.lowest = {}
         self.highest = {}
         for name in self.names:
-            data = self.getdatabyname(name)
-            self.highest[name] = Highest(data.close, period=channel_period)
-            self.lowest[name] = Lowest(data.close, period=channel_period)
+            self.highest[name] = self.add_indicator(name,
+                                                    "highest",
+                                                    state.HIGHEST,
+                                                    channel_period)
+            self.lowest[name] = self.add_indicator(name,
+                                                   "lowest",
+                                                   state.LOWEST,
+                                                   channel_period)
+
+    @classmethod
+    def get_warmup_bars(cls,
+                        *,
+                        tolerance=base.WARMUP_TOLERANCE,
+                        channel_period=25,
+                        **kwargs):
+        """get the number of bars to warm up the indicators."""
+        bars = super().get_warmup_bars(tolerance=tolerance, **kwargs)
+        return max(bars, channel_period)
 
     def is_buy_to_open(self, name):
         """determine whether a position should buy to open or not."""
@@ -17,6 +17,7 @@
 
 import backtrader as bt
 
+from greenturtle.indicators import adapters
 from greenturtle.stragety import base
 
 
@@ -94,7 +95,7 @@ class MACDWithATRStrategy(base.BaseStrategy):
                 macd.signal)
 
             # To set the stop price
-            self.atrs[name] = bt.indicators.ATR(data, period=atr_period)
+            self.atrs[name] = adapters.ATR(data, period=atr_period)
 
             # Control market trend
             sma = bt.indicators.SMA(data, period=sma_period)
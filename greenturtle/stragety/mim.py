@@ -15,7 +15,8 @@
 
 """ MIM class strategy for backtrader"""
 
-from backtrader.indicators import MovAv
+from greenturtle.indicators import adapters
+from greenturtle.indicators import kernels
 from greenturtle.stragety import base
 
 
@@ -28,7 +29,18 @@ class MIMStrategy(base.BaseStrategy):
         self.movs = {}
         for name in self.names:
             data = self.getdatabyname(name)
-            self.movs[name] = MovAv.Exponential(data, period=period)
+            # pylint: disable=unexpected-keyword-arg,too-many-function-args
+            self.movs[name] = adapters.EMA(data, period=period)
+
+    @classmethod
+    def get_warmup_bars(cls,
+                        *,
+                        tolerance=base.WARMUP_TOLERANCE,
+                        period=100,
+                        **kwargs):
+        """get the number of bars to warm up the indicators."""
+        bars = super().get_warmup_bars(tolerance=tolerance, **kwargs)
+        return max(bars, kernels.get_ema_convergence_bars(period, tolerance))
 
     def is_buy_to_open(self, name):
         """determine whether a position should buy to open or not."""
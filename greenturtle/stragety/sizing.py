@@ -0,0 +1,173 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+array based position sizing and group risk allocation.
+
+The inputs are the vectors of the varieties in the same order, the atr, the
+multiplier, the desired and the current sizes, and the group membership
+matrix with shape (group, variety). The results are the same as sizing the
+varieties one by one, the group risk is accumulated in the variety order
+and the one lot refinement is greedy in the given order within every group,
+so the floating point operations are performed in the same order.
+"""
+
+import numpy as np
+
+from greenturtle import exception
+
+
+def get_membership(names, groups, group_names):
+    """
+    get the membership matrix with shape (group, name), it is true if the
+    name belongs to the group, group_names is a dict from name to group.
+    """
+    index = {group: i for i, group in enumerate(groups)}
+    membership = np.zeros((len(groups), len(names)), dtype=bool)
+    for j, name in enumerate(names):
+        i = index.get(group_names.get(name))
+        if i is not None:
+            membership[i, j] = True
+
+    return membership
+
+
+def get_group_limits(groups, group_risk_factors, membership, in_desired):
+    """
+    get the risk limits of the groups, only the groups of the desired names
+    require the limit, raise exception if the desired name has no group.
+    """
+    if (in_desired & ~membership.any(axis=0)).any():
+        raise exception.GroupNameNotFound
+
+    used = membership[:, in_desired].any(axis=1)
+    return np.array([group_risk_factors[group] if required else np.inf
+                     for group, required in zip(groups, used)])
+
+
+def compute_sizes_by_atr(risk_factor, value, atrs, mults):
+    """
+    compute the sizes by atr, size = int(risk_factor * value / atr / mult),
+    the size is 0 if the atr is not ready or 0.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sizes = risk_factor * value / (atrs * mults)
+
+    return np.trunc(np.where(np.isfinite(sizes), sizes, 0))
+
+
+def compute_risks(sizes, atrs, mults, value):
+    """compute the risks, risk = abs(size) * mult * atr / value."""
+    return np.abs(sizes) * mults * atrs / value
+
+
+def sum_by_group(values, membership):
+    """
+    sum the values by group, the values are accumulated one by one in the
+    name order, so the result is the same as the loop.
+    """
+    if membership.shape[1] == 0:
+        return np.zeros(membership.shape[0])
+
+    return np.cumsum(np.where(membership, values, 0.0), axis=1)[:, -1]
+
+
+def get_group_ranks(groups):
+    """get the rank of every element within its group in the given order."""
+    order = np.argsort(groups, kind="stable")
+    sorted_groups = groups[order]
+    starts = np.flatnonzero(
+        np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+    counts = np.diff(np.r_[starts, len(groups)])
+
+    ranks = np.empty(len(groups), dtype=int)
+    ranks[order] = np.arange(len(groups)) - np.repeat(starts, counts)
+    return ranks
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def refine_by_one_lot(adjusted, desired, candidates, lot_risks, group_index,
+                      group_risks, limits):
+    """
+    refine the candidates, whose adjusted size is 0, to one lot in the
+    desired direction if the group risk is still within the limit. The
+    candidates are visited in the given order, the candidates of different
+    groups are independent, so the k-th candidates of all the groups are
+    refined at once.
+    """
+    if len(candidates) == 0:
+        return
+
+    groups = group_index[candidates]
+    ranks = get_group_ranks(groups)
+    for rank in range(ranks.max() + 1):
+        selected = candidates[ranks == rank]
+        selected_groups = groups[ranks == rank]
+        risks = lot_risks[selected]
+
+        accepted = ~(risks + group_risks[selected_groups] >
+                     limits[selected_groups])
+        group_risks[selected_groups[accepted]] += risks[accepted]
+        adjusted[selected[accepted]] = np.sign(desired[selected[accepted]])
+
+
+# pylint: disable=too-many-locals
+def adjust_sizes_by_group(desired, current, atrs, mults, value, membership,
+                          limits, current_order=None):
+    """
+    adjust the desired sizes by the group risk limits.
+
+    1. scale the sizes of the group proportionally if the group risk of the
+       desired sizes is more than the limit.
+    2. refine the scaled 0 size to one lot if the variety is held currently,
+       in the current_order, and then the others in the name order, as long
+       as the group risk is within the limit.
+
+    the varieties not in the desired portfolios have the desired size 0.
+    """
+    desired = np.asarray(desired, dtype=float)
+    current = np.asarray(current, dtype=float)
+    group_index = np.argmax(membership, axis=0)
+
+    # 1. scale the sizes proportionally by the group risk
+    group_risks = sum_by_group(compute_risks(desired, atrs, mults, value),
+                               membership)
+    name_risks = group_risks[group_index]
+    name_limits = limits[group_index]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        adjusted = np.where(name_risks > name_limits,
+                            np.trunc(desired * name_limits / name_risks),
+                            desired)
+
+    # 2. refine the 0 size to one lot within the group limit
+    group_risks = sum_by_group(compute_risks(adjusted, atrs, mults, value),
+                               membership)
+    lot_risks = compute_risks(np.ones(len(desired)), atrs, mults, value)
+    if current_order is None:
+        current_order = np.flatnonzero(current)
+    current_order = np.asarray(current_order, dtype=int)
+
+    # 2.1 refine the held varieties in the current order
+    refinable = (desired != 0) & (adjusted == 0) & (current != 0)
+    candidates = current_order[refinable[current_order]]
+    refine_by_one_lot(adjusted, desired, candidates,
+                      lot_risks, group_index, group_risks, limits)
+
+    # 2.2 refine all the varieties in the name order
+    refinable = (desired != 0) & (adjusted == 0)
+    refine_by_one_lot(adjusted, desired, np.flatnonzero(refinable),
+                      lot_risks, group_index, group_risks, limits)
+
+    return adjusted
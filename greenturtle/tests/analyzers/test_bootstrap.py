@@ -0,0 +1,104 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for bootstrap.py"""
+
+import datetime
+import unittest
+
+import numpy as np
+
+from greenturtle.analyzers import bootstrap
+
+
+def get_days_return(n_days=500, seed=0):
+    """get the random daily returns in percent."""
+    returns = np.random.default_rng(seed).normal(0.05, 1.0, n_days)
+    start = datetime.datetime(2020, 1, 1)
+    return {start + datetime.timedelta(days=i): value
+            for i, value in enumerate(returns)}
+
+
+class TestBootstrap(unittest.TestCase):
+    """unittest for bootstrap module"""
+
+    def test_compute_metrics(self):
+        """test the metrics of the known path"""
+        paths = np.array([[0.1, -0.5, 1.0, 0.0]])
+        metrics = bootstrap.compute_metrics(paths)
+
+        self.assertAlmostEqual(50, metrics[bootstrap.MAX_DRAW_DOWN][0])
+        cagr = (1.1 ** (bootstrap.DAYS_PER_YEAR / 4) - 1) * 100
+        self.assertAlmostEqual(cagr, metrics[bootstrap.CAGR][0])
+        sharpe_ratio = paths.mean() / paths.std(ddof=1) * \
+            np.sqrt(bootstrap.DAYS_PER_YEAR)
+        self.assertAlmostEqual(sharpe_ratio,
+                               metrics[bootstrap.SHARPE_RATIO][0])
+
+        # the draw down starts from the initial equity
+        metrics = bootstrap.compute_metrics(np.array([[-0.2, 0.1]]))
+        self.assertAlmostEqual(20, metrics[bootstrap.MAX_DRAW_DOWN][0])
+
+    def test_get_block_indices(self):
+        """test the blocks are the consecutive days"""
+        rng = np.random.default_rng(0)
+        indices = bootstrap.get_block_indices(rng, 50, 8, 7)
+
+        self.assertEqual((8, 50), indices.shape)
+        self.assertTrue(((indices >= 0) & (indices < 50)).all())
+        for block in np.split(indices[:, :49], 7, axis=1):
+            self.assertTrue((np.diff(block, axis=1) == 1).all())
+
+    def test_run(self):
+        """test the distributions and the percentiles"""
+        days_return = get_days_return()
+        for method in bootstrap.METHODS:
+            result = bootstrap.Bootstrap(days_return,
+                                         method=method,
+                                         n_resamples=250,
+                                         chunk_size=100).run()
+
+            for metric in bootstrap.METRICS:
+                self.assertEqual(250, len(result.distributions[metric]))
+                values = list(result.percentiles[metric].values())
+                self.assertEqual(sorted(values), values)
+
+            self.assertGreater(
+                result.get_percentile(bootstrap.MAX_DRAW_DOWN, 95), 0)
+            self.assertIn("sharpe_ratio", result.to_string())
+
+    def test_same_in_pool(self):
+        """test the result is the same with any number of processes"""
+        days_return = get_days_return()
+        inline = bootstrap.Bootstrap(days_return,
+                                     n_resamples=300,
+                                     chunk_size=100).run()
+        pooled = bootstrap.Bootstrap(days_return,
+                                     n_resamples=300,
+                                     chunk_size=100,
+                                     processes=2).run()
+
+        for metric in bootstrap.METRICS:
+            np.testing.assert_array_equal(inline.distributions[metric],
+                                          pooled.distributions[metric])
+
+    def test_invalid(self):
+        """test the invalid method and returns"""
+        self.assertRaises(ValueError,
+                          bootstrap.Bootstrap,
+                          get_days_return(),
+                          method="unknown")
+        self.assertRaises(ValueError, bootstrap.Bootstrap, None)
+        self.assertRaises(ValueError, bootstrap.Bootstrap, {})
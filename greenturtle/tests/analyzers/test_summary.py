@@ -102,3 +102,21 @@ class TestSummary(unittest.TestCase):
                  "total Return: 699.89%\n")
 
         self.assertEqual(first, s.to_string())
+
+    def test_get_metrics(self):
+        """test get_metrics function"""
+        s = summary.Summary()
+        self.assertEqual(dict.fromkeys(summary.METRICS), s.get_metrics())
+
+        s.return_summary = summary.ReturnSummary(total_return=10.0,
+                                                 annual_return=2.0)
+        s.trade_summary = summary.TradeSummary(net=100,
+                                               trader_number=5,
+                                               won_trader_number=2)
+
+        metrics = s.get_metrics()
+        self.assertEqual(10.0, metrics["total_return"])
+        self.assertEqual(2.0, metrics["annual_return"])
+        self.assertEqual(5, metrics["trade_number"])
+        self.assertEqual(2, metrics["won_trade_number"])
+        self.assertIsNone(metrics["sharpe_ratio"])
@@ -22,6 +22,7 @@ from greenturtle.backtesting import backtesting
 from greenturtle.constants import varieties
 from greenturtle.data.datafeed import mock
 from greenturtle.stragety import ema
+from greenturtle.tests.backtesting import test_sweep
 from greenturtle.util.logging import logging
 
 
@@ -118,3 +119,79 @@ class TestFutureSimulator(unittest.TestCase):
         return_summary = b.summary.return_summary
         self.assertEqual(4, int(return_summary.total_return))
         self.assertEqual(5.5, round(return_summary.annual_return, 1))
+
+    def test_do_backtesting_with_profile(self):
+        """test do_backtesting with the lean and returns-only profile"""
+        name = "mock"
+        full = backtesting.BackTesting(varieties=varieties.US_VARIETIES)
+        full.add_data(mock.get_mock_datafeed(name), name)
+        full.add_strategy(ema.EMA, risk_factor=0.1)
+        full.do_backtesting()
+
+        b = backtesting.BackTesting(varieties=varieties.US_VARIETIES,
+                                    profile=backtesting.LEAN)
+        b.add_data(mock.get_mock_datafeed(name), name)
+        b.add_strategy(ema.EMA, risk_factor=0.1)
+        b.do_backtesting()
+
+        metrics = b.summary.get_metrics()
+        full_metrics = full.summary.get_metrics()
+        for metric in ("total_return", "max_draw_down", "sharpe_ratio"):
+            self.assertEqual(full_metrics[metric], metrics[metric])
+        self.assertIsNone(b.summary.return_summary.days_return)
+        self.assertIsNone(b.summary.trade_summary)
+        self.assertIsNone(b.summary.leverage_ratio_summary)
+        self.assertIsNone(b.summary.positions_pnl_summary)
+
+        b = backtesting.BackTesting(varieties=varieties.US_VARIETIES,
+                                    profile=["Returns", "DaysTimeReturn"])
+        b.add_data(mock.get_mock_datafeed(name), name)
+        b.add_strategy(ema.EMA, risk_factor=0.1)
+        b.do_backtesting()
+
+        self.assertEqual(full.summary.return_summary.days_return,
+                         b.summary.return_summary.days_return)
+        self.assertIsNone(b.summary.return_summary.years_return)
+        self.assertIsNone(b.summary.max_draw_down_summary)
+
+    def test_unknown_profile(self):
+        """test the unknown analyzer profile"""
+        self.assertRaises(exception.AnalyzerProfileNotSupportedError,
+                          backtesting.BackTesting,
+                          profile="unknown")
+        self.assertRaises(exception.AnalyzerProfileNotSupportedError,
+                          backtesting.BackTesting,
+                          profile=["Returns", "Unknown"])
+
+    def test_memory_bounded(self):
+        """test the memory bounded mode is the same as the bar by bar one"""
+        market = test_sweep.get_market()
+
+        def get_backtesting(memory_bounded):
+            b = backtesting.BackTesting(varieties=market.get_varieties(),
+                                        plot=True,
+                                        memory_bounded=memory_bounded)
+            for name in market.names:
+                b.add_data(market.get_feed(name), name)
+                b.set_default_commission_by_name(name)
+            b.add_strategy(ema.EMA,
+                           varieties=market.get_varieties(),
+                           atr_period=20,
+                           allow_short=True)
+            return b
+
+        # the memory bounded mode runs bar by bar without runonce
+        full = get_backtesting(False)
+        full.cerebro.run(runonce=False)
+
+        b = get_backtesting(True)
+        b.analysis(b.run())
+
+        self.assertFalse(b.plot)
+        self.assertNotIn("AnnualReturn", b.analyzer_names)
+        self.assertGreater(b.process_peak_memory, 0)
+        self.assertEqual(full.cerebro.broker.getvalue(),
+                         b.cerebro.broker.getvalue())
+        self.assertIsNotNone(b.summary.return_summary.days_return)
+        self.assertTrue(all(order.alive()
+                            for order in b.cerebro.broker.orders))
@@ -0,0 +1,168 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for batch.py"""
+
+import os
+import signal
+import tempfile
+import unittest
+
+import munch
+
+from greenturtle.analyzers import summary
+from greenturtle.backtesting import batch
+from greenturtle.backtesting import result_store
+from greenturtle.db import api
+from greenturtle.stragety import ema
+from greenturtle.tests.backtesting import test_sweep
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+class ExitEMA(ema.EMA):
+    """the strategy kills the worker like the oom killer."""
+
+    def __init__(self, *args, **kwargs):
+        # pylint: disable=protected-access,super-init-not-called
+        os._exit(1)
+
+
+def get_data_version(names):
+    """get the data version of the synthetic market."""
+    return ",".join(f"{name}@synthetic" for name in names)
+
+
+def get_batch(jobs, processes=1, timeout=None, store=None):
+    """get the batch backtesting over the synthetic market."""
+    market = test_sweep.get_market()
+    return batch.BatchBackTesting(jobs,
+                                  test_sweep.load_synthetic_arrays,
+                                  strategy_kwargs={"atr_period": 20},
+                                  varieties=market.get_varieties(),
+                                  processes=processes,
+                                  timeout=timeout,
+                                  result_store=store,
+                                  get_data_version=get_data_version)
+
+
+class TestBatchBackTesting(unittest.TestCase):
+    """unittest for BatchBackTesting class"""
+
+    def setUp(self):
+        self.names = test_sweep.get_market().names
+
+    def test_run(self):
+        """test run the jobs per variety in the pool"""
+        jobs = [(ema.EMA, {"fast_period": 5}, [name]) for name in self.names]
+        jobs.append((ema.EMA, {}, self.names, "portfolio"))
+        results, return_summaries = get_batch(jobs, processes=2).run()
+
+        self.assertEqual(self.names + ["portfolio"], list(results["name"]))
+        self.assertEqual(list(batch.COLUMNS), list(results.columns))
+        self.assertTrue(results[batch.ERROR].isna().all())
+        self.assertTrue(results["total_return"].notna().all())
+        self.assertEqual(",".join(self.names), results[batch.VARIETIES][2])
+
+        self.assertEqual(list(results["name"]), list(return_summaries))
+        for return_summary in return_summaries.values():
+            self.assertIsInstance(return_summary, summary.ReturnSummary)
+
+        corr = batch.get_correlation(return_summaries).compute_correlation()
+        self.assertEqual((3, 3), corr.shape)
+
+    def test_same_as_inline(self):
+        """test the result in the pool is the same as the inline one"""
+        jobs = [(ema.EMA, {}, [name]) for name in self.names]
+        inline, _ = get_batch(jobs, processes=1).run()
+        pooled, _ = get_batch(jobs, processes=2).run()
+
+        self.assertEqual(list(inline["total_return"]),
+                         list(pooled["total_return"]))
+
+    def test_failed_job(self):
+        """test the failed jobs do not affect the others"""
+        jobs = [(ema.EMA, {"unknown": 1}, [self.names[0]]),
+                (ema.EMA, {}, ["UNKNOWN"]),
+                (ema.EMA, {}, [self.names[1]])]
+        results, return_summaries = get_batch(jobs).run()
+
+        self.assertIsNotNone(results[batch.ERROR][0])
+        self.assertIn("KeyError", results[batch.ERROR][1])
+        self.assertTrue(results["total_return"].isna()[1])
+        self.assertIsNone(results[batch.ERROR][2])
+        self.assertEqual([self.names[1]], list(return_summaries))
+
+    def test_worker_died(self):
+        """test the job killing the worker does not affect the others"""
+        jobs = [(ema.EMA, {}, [self.names[0]]),
+                (ExitEMA, {}, [self.names[1]]),
+                (ema.EMA, {}, [self.names[1]], "second")]
+        results, return_summaries = get_batch(jobs, processes=2).run()
+
+        self.assertIn("worker died", results[batch.ERROR][1])
+        self.assertEqual("ExitEMA", results[batch.STRATEGY][1])
+        self.assertTrue(results["total_return"].isna()[1])
+        self.assertTrue(results[batch.ERROR][[0, 2]].isna().all())
+        self.assertEqual([self.names[0], "second"], list(return_summaries))
+
+    def test_timeout(self):
+        """test the job exceeding the timeout fails"""
+        jobs = [(ema.EMA, {}, [self.names[0]])]
+        handler = signal.getsignal(signal.SIGALRM)
+        results, return_summaries = get_batch(jobs, timeout=0.001).run()
+
+        self.assertIn("timeout", results[batch.ERROR][0])
+        self.assertEqual({}, return_summaries)
+        # the handler of the caller is restored after the inline jobs
+        self.assertEqual(handler, signal.getsignal(signal.SIGALRM))
+
+        # the timer is cleared and the next run is not interrupted
+        results, _ = get_batch(jobs, timeout=60).run()
+        self.assertIsNone(results[batch.ERROR][0])
+
+    def test_duplicated_names(self):
+        """test the duplicated job names"""
+        jobs = [(ema.EMA, {"fast_period": 5}, [self.names[0]]),
+                (ema.EMA, {"fast_period": 10}, [self.names[0]])]
+        self.assertRaises(ValueError, get_batch, jobs)
+
+    def test_result_store(self):
+        """test the succeeded jobs are saved into the result store"""
+        jobs = [(ema.EMA, {"fast_period": 5}, [self.names[0]]),
+                (ema.EMA, {"unknown": 1}, [self.names[1]])]
+        with tempfile.TemporaryDirectory() as tmp:
+            db_conf = munch.Munch(drivername=api.SQLITE_DRIVERNAME,
+                                  database=os.path.join(tmp, "result.db"))
+            store = result_store.ResultStore(db_conf)
+            results, return_summaries = \
+                get_batch(jobs, processes=2, store=store).run()
+            runs = store.load_runs()
+            returns = store.load_returns()
+            store.dbapi.engine.dispose()
+
+        self.assertEqual(1, len(runs))
+        self.assertEqual(self.names[0], runs["varieties"].iloc[0])
+        self.assertEqual(f"{self.names[0]}@synthetic",
+                         runs["data_version"].iloc[0])
+        self.assertEqual(5, runs["param_fast_period"].iloc[0])
+        self.assertEqual(20, runs["param_atr_period"].iloc[0])
+        self.assertAlmostEqual(results["total_return"][0],
+                               runs["total_return"].iloc[0])
+        days_return = return_summaries[self.names[0]].days_return
+        self.assertEqual(len(days_return), len(returns))
@@ -0,0 +1,148 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for result_store.py"""
+
+import os
+import tempfile
+import unittest
+
+import munch
+
+from greenturtle.backtesting import backtesting
+from greenturtle.backtesting import result_store
+from greenturtle.constants import varieties
+from greenturtle.data.datafeed import mock
+from greenturtle.db import api
+from greenturtle.stragety import ema
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+NAME = "mock"
+
+
+def run_backtesting(fast_period):
+    """run the backtesting of EMA over the mock data."""
+    b = backtesting.BackTesting(varieties=varieties.US_VARIETIES)
+    b.add_data(mock.get_mock_datafeed(NAME), NAME)
+    b.add_strategy(ema.EMA, risk_factor=0.1, fast_period=fast_period)
+    b.do_backtesting()
+    return b
+
+
+class TestResultStore(unittest.TestCase):
+    """unittest for ResultStore class"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.backtests = {p: run_backtesting(p) for p in (10, 20)}
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp = tempfile.TemporaryDirectory()
+        db_conf = munch.Munch(drivername=api.SQLITE_DRIVERNAME,
+                              database=os.path.join(self.tmp.name, "r.db"))
+        self.store = result_store.ResultStore(db_conf)
+
+    def tearDown(self):
+        self.store.dbapi.engine.dispose()
+        self.tmp.cleanup()
+
+    def save(self, fast_period, **kwargs):
+        """save the backtesting of the fast period."""
+        return self.store.save(self.backtests[fast_period].summary,
+                               ema.EMA,
+                               {"fast_period": fast_period},
+                               varieties=[NAME],
+                               **kwargs)
+
+    def test_load_runs(self):
+        """test save and load the runs"""
+        run_ids = [self.save(10, data_version="v1"), self.save(20)]
+        runs = self.store.load_runs()
+
+        self.assertEqual(run_ids, list(runs.index))
+        self.assertEqual([10, 20], list(runs["param_fast_period"]))
+        self.assertEqual("greenturtle.stragety.ema.EMA",
+                         runs["strategy"].iloc[0])
+        self.assertEqual(NAME, runs["varieties"].iloc[0])
+        self.assertEqual("v1", runs["data_version"].iloc[0])
+
+        metrics = self.backtests[10].summary.get_metrics()
+        for metric, value in metrics.items():
+            self.assertAlmostEqual(value, runs[metric].iloc[0])
+
+        days = list(self.backtests[10].summary.return_summary.days_return)
+        self.assertEqual(min(days), runs["start_date"].iloc[0])
+        self.assertEqual(max(days), runs["end_date"].iloc[0])
+
+    def test_filter_runs(self):
+        """test load the runs by the run ids and the strategy"""
+        run_id = self.save(10)
+        self.save(20)
+
+        self.assertEqual([run_id],
+                         list(self.store.load_runs(run_ids=[run_id]).index))
+        self.assertEqual(2, len(self.store.load_runs(strategy=ema.EMA)))
+        self.assertTrue(self.store.load_runs(strategy="unknown").empty)
+
+    def test_load_returns(self):
+        """test load the daily and yearly returns"""
+        run_ids = [self.save(10), self.save(20)]
+
+        days = self.store.load_returns()
+        self.assertEqual(sorted(run_ids), sorted(days.columns))
+        return_summary = self.backtests[20].summary.return_summary
+        self.assertEqual(len(return_summary.days_return), len(days))
+        for day, value in return_summary.days_return.items():
+            self.assertAlmostEqual(value, days[run_ids[1]][day])
+
+        years = self.store.load_returns(run_ids=run_ids[:1],
+                                        period=result_store.YEAR)
+        self.assertEqual(run_ids[:1], list(years.columns))
+        self.assertEqual(len(return_summary.years_return), len(years))
+
+    def test_load_positions_pnl(self):
+        """test load the pnl per position"""
+        run_id = self.save(10)
+        pnl = self.store.load_positions_pnl(run_ids=[run_id])
+
+        positions_pnl = \
+            self.backtests[10].summary.positions_pnl_summary.positions_pnl
+        self.assertEqual(list(positions_pnl), list(pnl["name"]))
+        self.assertAlmostEqual(positions_pnl[NAME]["net"], pnl["net"][0])
+
+    def test_delete(self):
+        """test delete the run"""
+        run_id = self.save(10)
+        self.store.delete(run_id)
+
+        self.assertTrue(self.store.load_runs().empty)
+        self.assertTrue(self.store.load_returns().empty)
+        self.assertTrue(self.store.load_positions_pnl().empty)
+
+    def test_get_result_store(self):
+        """test get the result store by the config"""
+        self.assertIsNone(result_store.get_result_store(munch.Munch()))
+
+        path = os.path.join(self.tmp.name, "store", "result.sqlite")
+        conf = munch.Munch(result_store=munch.Munch(path=path))
+        store = result_store.get_result_store(conf)
+        self.assertIsInstance(store, result_store.ResultStore)
+        self.assertTrue(store.load_runs().empty)
+        store.dbapi.engine.dispose()
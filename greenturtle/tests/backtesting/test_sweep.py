@@ -0,0 +1,186 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for sweep.py"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from greenturtle.analyzers import summary
+from greenturtle.backtesting import sweep
+from greenturtle.data import synthetic
+from greenturtle.stragety import ema
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+N_VARIETIES = 2
+YEARS = 2
+
+
+def get_market():
+    """get the small synthetic market."""
+    return synthetic.SyntheticMarket(n_varieties=N_VARIETIES,
+                                     years=YEARS,
+                                     bad_print_ratio=0)
+
+
+def load_synthetic_arrays():
+    """loader of the synthetic arrays for the workers."""
+    market = get_market()
+    return {name: market.get_arrays(name) for name in market.names}
+
+
+def get_sweep(samples, processes=1, checkpoint=None):
+    """get the sweep of EMA over the synthetic market."""
+    return sweep.Sweep(ema.EMA,
+                       samples,
+                       load_synthetic_arrays,
+                       strategy_kwargs={"atr_period": 20},
+                       varieties=get_market().get_varieties(),
+                       processes=processes,
+                       checkpoint=checkpoint)
+
+
+def load_nothing():
+    """loader of no arrays."""
+    return {}
+
+
+def exit_on_negative(task):
+    """kill the worker on the negative task like the oom killer."""
+    value, = task
+    if value < 0:
+        # pylint: disable=protected-access
+        os._exit(1)
+    return value
+
+
+class TestMapInPool(unittest.TestCase):
+    """unittest for map_in_pool"""
+
+    def test_worker_died(self):
+        """test the task killing the worker only fails itself"""
+        tasks = [(v,) for v in (1, -1, 2, 3, -2, 4)]
+        results = sweep.map_in_pool(exit_on_negative,
+                                    tasks,
+                                    load_nothing,
+                                    {},
+                                    processes=2,
+                                    on_broken=lambda task, error: None)
+
+        self.assertEqual([None, None, 1, 2, 3, 4],
+                         sorted(results, key=lambda r: (r is not None, r)))
+
+    def test_worker_died_without_handler(self):
+        """test the broken pool is raised without the handler"""
+        results = sweep.map_in_pool(exit_on_negative,
+                                    [(-1,)],
+                                    load_nothing,
+                                    {},
+                                    processes=2)
+        self.assertRaises(sweep.process.BrokenProcessPool, list, results)
+
+
+class TestSamples(unittest.TestCase):
+    """unittest for the samplers"""
+
+    def test_grid(self):
+        """test the grid samples"""
+        samples = sweep.get_samples(sweep.GRID,
+                                    {"a": [1, 2], "b": [0.1, 0.2, 0.3]})
+        self.assertEqual(6, len(samples))
+        self.assertEqual({"a": 1, "b": 0.1}, samples[0])
+        self.assertEqual({"a": 2, "b": 0.3}, samples[-1])
+
+    def test_random(self):
+        """test the random samples are in the space and deterministic"""
+        space = {"a": (10, 20), "b": (0.001, 0.003), "c": ["x", "y"]}
+        samples = sweep.get_samples(sweep.RANDOM, space, n=50, seed=1)
+        self.assertEqual(samples,
+                         sweep.get_samples(sweep.RANDOM, space, n=50, seed=1))
+
+        for sample in samples:
+            self.assertIsInstance(sample["a"], int)
+            self.assertTrue(10 <= sample["a"] <= 20)
+            self.assertTrue(0.001 <= sample["b"] < 0.003)
+            self.assertIn(sample["c"], ["x", "y"])
+
+    def test_lhs(self):
+        """test every stratum is sampled exactly once"""
+        n = 20
+        samples = sweep.get_lhs_samples({"b": (0.0, 1.0)}, n, seed=3)
+        strata = np.floor(np.array([s["b"] for s in samples]) * n)
+        self.assertEqual(list(range(n)), sorted(strata.astype(int)))
+
+    def test_unknown_sampler(self):
+        """test the unknown sampler"""
+        self.assertRaises(ValueError, sweep.get_samples, "unknown", {})
+
+
+class TestSweep(unittest.TestCase):
+    """unittest for Sweep class"""
+
+    def test_run(self):
+        """test run the sweep in the pool"""
+        samples = sweep.get_grid_samples({"fast_period": [5, 10],
+                                          "slow_period": [30]})
+        results = get_sweep(samples, processes=2).run()
+
+        self.assertEqual(2, len(results))
+        self.assertEqual([5, 10], sorted(results["fast_period"]))
+        for metric in summary.METRICS:
+            self.assertIn(metric, results.columns)
+        self.assertTrue(results[sweep.ERROR].isna().all())
+        self.assertTrue(results["total_return"].notna().all())
+
+    def test_resume(self):
+        """test the sweep resumes from the checkpoint"""
+        samples = sweep.get_grid_samples({"fast_period": [5, 10, 15],
+                                          "slow_period": [30]})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, "checkpoint.csv")
+            first = get_sweep(samples[:2], checkpoint=checkpoint).run()
+            self.assertEqual(2, len(first))
+
+            # only the new sample is run after resumed
+            with mock.patch.object(sweep, "run_sample",
+                                   wraps=sweep.run_sample) as run_sample:
+                results = get_sweep(samples, checkpoint=checkpoint).run()
+                self.assertEqual(1, run_sample.call_count)
+
+            self.assertEqual(3, len(results))
+            self.assertEqual([5, 10, 15], sorted(results["fast_period"]))
+            np.testing.assert_allclose(
+                first["total_return"],
+                results["total_return"][:2])
+
+    def test_failed_sample(self):
+        """test the failed sample is not saved to the checkpoint"""
+        samples = [{"fast_period": 5, "unknown": 1}]
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpoint = os.path.join(tmp, "checkpoint.csv")
+            results = get_sweep(samples, checkpoint=checkpoint).run()
+
+            self.assertEqual(1, len(results))
+            self.assertIsNotNone(results[sweep.ERROR][0])
+            self.assertFalse(os.path.exists(checkpoint))
@@ -0,0 +1,231 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for vector.py"""
+
+import datetime
+import unittest
+
+import backtrader as bt
+import numpy as np
+
+from greenturtle.backtesting import backtesting
+from greenturtle.backtesting import vector
+from greenturtle.constants import types
+from greenturtle.data.datafeed import mock
+from greenturtle.data import synthetic
+from greenturtle import exception
+from greenturtle.indicators import kernels
+from greenturtle.stragety import buyhold
+from greenturtle.stragety import channel
+from greenturtle.stragety import ema
+from greenturtle.stragety import mim
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+# the max relative difference of the value to the backtrader run
+TOLERANCE = 1e-9
+
+MOCK_VARIETIES = {
+    "mock_group": {
+        "mock": {
+            types.MULTIPLIER: 10,
+            types.AUTO_MARGIN: 1,
+        },
+    },
+}
+
+
+class ValueAnalyzer(bt.Analyzer):
+    """record the value of every bar."""
+
+    def create_analysis(self):
+        # pylint: disable=attribute-defined-outside-init
+        self.rets = []
+
+    def next(self):
+        # pylint: disable=no-member
+        self.rets.append(self.strategy.broker.getvalue())
+
+
+def get_mock_arrays():
+    """get the arrays of the mock data."""
+    df = mock.get_mock_dataframe()
+    arrays = {types.DATETIME: df.index.values}
+    for column in df.columns:
+        arrays[column] = df[column].values
+    return arrays
+
+
+def run_backtrader(feeds, strategy, kwargs, cash=1000000):
+    """run the backtrader and return the value of every bar."""
+    b = backtesting.BackTesting(cash=cash, varieties=kwargs["varieties"])
+    for name, feed in feeds.items():
+        b.add_data(feed, name)
+        b.set_default_commission_by_name(name)
+    b.add_strategy(strategy, **kwargs)
+    b.cerebro.addanalyzer(ValueAnalyzer, _name="Value")
+
+    result = b.run()
+    return np.array(result[0].analyzers.Value.get_analysis())
+
+
+def run_vector(arrays_by_variety, strategy, kwargs, cash=1000000):
+    """run the vector backtesting."""
+    b = vector.VectorBackTesting(cash=cash, varieties=kwargs["varieties"])
+    for name, arrays in arrays_by_variety.items():
+        b.add_data(arrays, name)
+    b.add_strategy(strategy, **kwargs)
+    return b.run()
+
+
+class TestVectorBackTesting(unittest.TestCase):
+    """unittest for the vector backtesting"""
+
+    def assert_values_close(self, expected, actual):
+        """assert the values are close to the backtrader run."""
+        self.assertEqual(len(expected), len(actual))
+        difference = np.abs(expected - actual) / np.abs(expected)
+        self.assertLess(difference.max(), TOLERANCE)
+
+    def test_mock_parity(self):
+        """test the value is the same as backtrader with the mock data"""
+        for strategy in (ema.EMA, ema.EMAEnhanced, mim.MIMStrategy):
+            kwargs = {"atr_period": 20, "varieties": MOCK_VARIETIES}
+            expected = run_backtrader({"mock": mock.get_mock_datafeed()},
+                                      strategy,
+                                      kwargs)
+            actual = run_vector({"mock": get_mock_arrays()},
+                                strategy,
+                                kwargs)
+            self.assert_values_close(expected, actual.values)
+            self.assertGreater(actual.orders, 0)
+
+    def test_synthetic_parity(self):
+        """test the value is the same as backtrader with synthetic data"""
+        market = synthetic.SyntheticMarket(n_varieties=4,
+                                           years=2,
+                                           missing_ratio=0,
+                                           bad_print_ratio=0)
+        varieties = market.get_varieties()
+
+        for strategy in (ema.EMA,
+                         ema.EMAEnhanced,
+                         channel.DonchianChannel,
+                         mim.MIMStrategy):
+            # a large risk factor to involve the margin rejection
+            for risk_factor in (0.01, 0.2):
+                kwargs = {"allow_short": True,
+                          "risk_factor": risk_factor,
+                          "varieties": varieties}
+                expected = run_backtrader(
+                    {n: market.get_feed(n) for n in market.names},
+                    strategy,
+                    kwargs)
+                actual = run_vector(
+                    {n: market.get_arrays(n) for n in market.names},
+                    strategy,
+                    kwargs)
+                self.assert_values_close(expected, actual.values)
+
+    def test_synthetic_parity_with_gaps(self):
+        """test the value is the same as backtrader with the missing bars"""
+        market = synthetic.SyntheticMarket(n_varieties=4,
+                                           years=2,
+                                           missing_ratio=0.05)
+        varieties = market.get_varieties()
+
+        for strategy in (ema.EMAEnhanced, channel.DonchianChannel):
+            kwargs = {"allow_short": True,
+                      "risk_factor": 0.01,
+                      "atr_period": 20,
+                      "varieties": varieties,
+                      "group_risk_factors": {k: 0.02 for k in varieties}}
+            expected = run_backtrader(
+                {n: market.get_feed(n) for n in market.names},
+                strategy,
+                kwargs)
+            actual = run_vector(
+                {n: market.get_arrays(n) for n in market.names},
+                strategy,
+                kwargs)
+            self.assert_values_close(expected, actual.values)
+
+    def test_panel_from_arrays(self):
+        """test the missing bar holds the last bar of the variety"""
+        dates = [np.datetime64(datetime.datetime(2025, 3, d), "us")
+                 for d in (3, 4, 5)]
+        arrays_by_variety = {
+            "A": {types.DATETIME: dates, types.CLOSE: [1.0, 2.0, 3.0]},
+            "B": {types.DATETIME: [dates[0], dates[2]],
+                  types.CLOSE: [10.0, 30.0]},
+        }
+        panel = vector.Panel.from_arrays(arrays_by_variety)
+
+        self.assertEqual(["A", "B"], panel.names)
+        np.testing.assert_array_equal([[1, 10], [2, 10], [3, 30]],
+                                      panel.close)
+        np.testing.assert_array_equal([[1, 1], [1, 1], [1, 1]],
+                                      panel.valid)
+        np.testing.assert_array_equal([[1, 1], [1, 0], [1, 1]],
+                                      panel.present)
+
+        # the kernel is computed over the own bars of the variety
+        np.testing.assert_array_equal(
+            [[np.nan, np.nan], [1, np.nan], [2, 10]],
+            panel.apply(lambda columns: kernels.shift(columns[0]),
+                        [panel.close]))
+
+    def test_get_signal_class(self):
+        """test get the signal class by the strategy"""
+        self.assertIs(vector.EMAEnhancedSignal,
+                      vector.get_signal_class(ema.EMAEnhanced))
+        self.assertIs(vector.MIMSignal,
+                      vector.get_signal_class(vector.MIMSignal))
+        self.assertRaises(exception.StrategyNotSupportedError,
+                          vector.get_signal_class,
+                          buyhold.BuyHoldStrategy)
+
+    def test_group_risk_parity(self):
+        """test the value is the same as backtrader with the group risk"""
+        market = synthetic.SyntheticMarket(n_varieties=12,
+                                           years=2,
+                                           missing_ratio=0,
+                                           bad_print_ratio=0,
+                                           seed=3)
+        varieties = market.get_varieties()
+
+        # the small cash and group limit to involve the one lot refinement
+        for strategy, factor in ((ema.EMA, 0.004),
+                                 (channel.DonchianChannel, 0.01)):
+            kwargs = {"allow_short": True,
+                      "risk_factor": 0.003,
+                      "atr_period": 20,
+                      "varieties": varieties,
+                      "group_risk_factors": {k: factor for k in varieties}}
+            expected = run_backtrader(
+                {n: market.get_feed(n) for n in market.names},
+                strategy,
+                kwargs,
+                cash=300000)
+            actual = run_vector(
+                {n: market.get_arrays(n) for n in market.names},
+                strategy,
+                kwargs,
+                cash=300000)
+            self.assert_values_close(expected, actual.values)
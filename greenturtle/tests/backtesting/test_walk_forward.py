@@ -0,0 +1,211 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for walk_forward.py"""
+
+import datetime
+import os
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from greenturtle.backtesting import sweep
+from greenturtle.backtesting import walk_forward
+from greenturtle.stragety import ema
+from greenturtle.tests.backtesting import test_sweep
+from greenturtle.util import calendar
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+class ExitEMA(ema.EMA):
+    """the strategy kills the worker like the oom killer if exit is set."""
+
+    def __init__(self, *args, exit_worker=False, **kwargs):
+        if exit_worker:
+            # pylint: disable=protected-access
+            os._exit(1)
+        super().__init__(*args, **kwargs)
+
+
+class TestWindows(unittest.TestCase):
+    """unittest for get_windows"""
+
+    def test_rolling(self):
+        """test the rolling windows"""
+        windows = walk_forward.get_windows(datetime.datetime(2020, 1, 1),
+                                           datetime.datetime(2022, 3, 1),
+                                           12,
+                                           6)
+
+        self.assertEqual(3, len(windows))
+        self.assertEqual(
+            walk_forward.Window(datetime.datetime(2020, 7, 1),
+                                datetime.datetime(2021, 6, 30),
+                                datetime.datetime(2021, 7, 1),
+                                datetime.datetime(2021, 12, 31)),
+            windows[1])
+        # the last test window is cut by the end date
+        self.assertEqual(datetime.datetime(2022, 3, 1), windows[-1].test_end)
+
+    def test_expanding(self):
+        """test the expanding windows"""
+        windows = walk_forward.get_windows(datetime.datetime(2020, 1, 1),
+                                           datetime.datetime(2021, 12, 31),
+                                           12,
+                                           6,
+                                           mode=walk_forward.EXPANDING)
+
+        self.assertEqual(2, len(windows))
+        for window in windows:
+            self.assertEqual(datetime.datetime(2020, 1, 1),
+                             window.train_start)
+            self.assertEqual(window.train_end + datetime.timedelta(days=1),
+                             window.test_start)
+
+    def test_unknown_mode(self):
+        """test the unknown mode"""
+        self.assertRaises(ValueError,
+                          walk_forward.get_windows,
+                          datetime.datetime(2020, 1, 1),
+                          datetime.datetime(2021, 12, 31),
+                          12,
+                          6,
+                          mode="unknown")
+
+
+class TestWalkForward(unittest.TestCase):
+    """unittest for WalkForward class"""
+
+    def get_walk_forward(self, processes, strategy=ema.EMA):
+        """get the walk forward of EMA over the synthetic market."""
+        market = test_sweep.get_market()
+        dates = market.get_trading_dates()
+        windows = walk_forward.get_windows(dates[0].to_pydatetime(),
+                                           dates[-1].to_pydatetime(),
+                                           12,
+                                           6)
+        samples = sweep.get_grid_samples({"fast_period": [5, 10],
+                                          "slow_period": [30]})
+        return walk_forward.WalkForward(strategy,
+                                        samples,
+                                        test_sweep.load_synthetic_arrays,
+                                        windows,
+                                        strategy_kwargs={"atr_period": 20},
+                                        varieties=market.get_varieties(),
+                                        processes=processes)
+
+    def test_run(self):
+        """test the out of sample returns are stitched from the windows"""
+        wf = self.get_walk_forward(processes=1)
+        result = wf.run()
+
+        self.assertEqual(len(wf.windows), len(result.windows))
+        self.assertTrue(result.windows["params"].notna().all())
+        self.assertTrue(result.returns.index.is_monotonic_increasing)
+        self.assertEqual(len(result.returns), len(result.equity))
+
+        # all the returns are within the test windows
+        first = pd.Timestamp(wf.windows[0].test_start)
+        self.assertGreaterEqual(result.returns.index[0], first)
+        self.assertIn("sharpe_ratio", result.metrics)
+
+        # the same result in the pool
+        parallel = self.get_walk_forward(processes=2).run()
+        pd.testing.assert_series_equal(result.returns, parallel.returns)
+
+    def test_test_failed(self):
+        """test the failed test window is recorded and the others go on"""
+        wf = self.get_walk_forward(processes=1)
+        best = {i: ({"fast_period": 5, "slow_period": 30}, 1.0)
+                for i in range(len(wf.windows))}
+        best[0] = ({"unknown": 1}, 1.0)
+        with mock.patch.object(wf, "select_best", return_value=best):
+            result = wf.run()
+
+        self.assertIn("unknown", result.windows["test_error"][0])
+        self.assertTrue(result.windows["test_error"][1:].isna().all())
+        self.assertTrue(result.windows["test_return"][1:].notna().all())
+        first = pd.Timestamp(wf.windows[1].test_start)
+        self.assertGreaterEqual(result.returns.index[0], first)
+
+    def test_worker_died(self):
+        """test the test window killing its worker only fails itself"""
+        wf = self.get_walk_forward(processes=2, strategy=ExitEMA)
+        best = {i: ({"fast_period": 5, "slow_period": 30}, 1.0)
+                for i in range(len(wf.windows))}
+        best[0] = ({"exit_worker": True}, 1.0)
+        with mock.patch.object(wf, "select_best", return_value=best):
+            result = wf.run()
+
+        self.assertIn("worker died", result.windows["test_error"][0])
+        self.assertTrue(result.windows["test_error"][1:].isna().all())
+        self.assertTrue(result.windows["test_return"][1:].notna().all())
+
+    def test_warmup(self):
+        """test the train and test runs warm up before the window"""
+        wf = self.get_walk_forward(processes=1)
+        best = {i: {"fast_period": 5, "slow_period": 30}
+                for i in range(len(wf.windows))}
+        cal = calendar.get_cn_calendar()
+        for tasks, start in ((wf.get_train_tasks(), "train_start"),
+                             (wf.get_test_tasks(best), "test_start")):
+            for task in tasks:
+                window = wf.windows[int(str(task[0]).split(":", 1)[0])]
+                params, options = task[1], task[2]
+                window_start = getattr(window, start)
+                self.assertEqual(window_start, options["window_start"])
+                self.assertEqual(
+                    window_start,
+                    options["strategy_kwargs"]["trade_start_date"])
+
+                # the warm up bars of the params before the window start
+                bars = ema.EMA.get_warmup_bars(atr_period=20, **params)
+                self.assertEqual(
+                    bars,
+                    cal.count(options["fromdate"].date(),
+                              window_start.date() -
+                              datetime.timedelta(days=1)))
+
+        # the strategy does not trade in the warm up months
+        sweep.init_worker(test_sweep.load_synthetic_arrays, {})
+        _, params, options = wf.get_train_tasks()[-1]
+        b = sweep.run_params(params, options)
+        returns = b.summary.return_summary.days_return
+        warmup = [v for k, v in returns.items()
+                  if pd.Timestamp(k) < pd.Timestamp(options["window_start"])]
+        self.assertGreater(len(warmup), 0)
+        self.assertEqual(0, sum(abs(v) for v in warmup))
+
+    def test_get_warmup_start(self):
+        """test the longer period warms up more bars"""
+        wf = self.get_walk_forward(processes=1)
+        window_start = wf.windows[0].test_start
+        short = wf.get_warmup_start(window_start, {"slow_period": 30})
+        long = wf.get_warmup_start(window_start, {"slow_period": 300})
+        self.assertLess(long, short)
+        self.assertLess(short, window_start)
+
+    def test_get_metrics(self):
+        """test the metrics of the returns"""
+        returns = pd.Series([0.1, -0.5, 0.2])
+        metrics = walk_forward.get_metrics(returns)
+        self.assertAlmostEqual(-34.0, metrics["total_return"])
+        self.assertAlmostEqual(50.0, metrics["max_draw_down"])
+        self.assertEqual({}, walk_forward.get_metrics(pd.Series([])))
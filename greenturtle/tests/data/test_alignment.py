@@ -0,0 +1,141 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for alignment.py"""
+
+import datetime
+import random
+import unittest
+
+import pandas as pd
+
+from greenturtle.constants import types
+from greenturtle.data import alignment
+from greenturtle import exception
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+def reference_align_and_padding(rows, trading_dates):
+    """
+    the two passes padding which is used before, rows is a dict from date
+    to the row dict.
+    """
+    rows = dict(rows)
+    for dates in (trading_dates, list(reversed(trading_dates))):
+        prev = None
+        for date in dates:
+            if date not in rows:
+                if prev is not None:
+                    padding = dict(prev)
+                    padding[types.VALID] = 0
+                    padding[types.ADJUST_FACTOR] = 1
+                    rows[date] = padding
+                    prev = padding
+            else:
+                prev = rows[date]
+    return rows
+
+
+def build_dataframe(rows):
+    """build dataframe from rows dict"""
+    index = pd.DatetimeIndex(list(rows.keys()))
+    return pd.DataFrame(list(rows.values()), index=index).sort_index()
+
+
+class TestAlignment(unittest.TestCase):
+    """unittest for alignment"""
+
+    def test_validate_trading_dates(self):
+        """test validate_trading_dates"""
+        trading_dates = [datetime.date(2025, 3, 24)]
+        alignment.validate_trading_dates([datetime.date(2025, 3, 24)],
+                                         trading_dates)
+        self.assertRaises(exception.ValidateTradingDayError,
+                          alignment.validate_trading_dates,
+                          [datetime.date(2025, 3, 27)],
+                          trading_dates)
+
+    def test_align_and_padding(self):
+        """test align_and_padding with leading, middle and tailing gap"""
+        trading_dates = [datetime.date(2025, 3, d) for d in range(3, 8)]
+        rows = {
+            datetime.datetime(2025, 3, 4): {
+                types.CLOSE: 10.0,
+                types.VALID: 1,
+                types.ADJUST_FACTOR: 2.0,
+            },
+            datetime.datetime(2025, 3, 6): {
+                types.CLOSE: 11.0,
+                types.VALID: 1,
+                types.ADJUST_FACTOR: 1.0,
+            },
+        }
+
+        actual = alignment.align_and_padding(build_dataframe(rows),
+                                             trading_dates)
+
+        self.assertEqual(list(pd.DatetimeIndex(trading_dates)),
+                         list(actual.index))
+        self.assertEqual([10, 10, 10, 11, 11], list(actual[types.CLOSE]))
+        self.assertEqual([0, 1, 0, 1, 0], list(actual[types.VALID]))
+        self.assertEqual([1, 2, 1, 1, 1],
+                         list(actual[types.ADJUST_FACTOR]))
+
+    def test_align_and_padding_failed(self):
+        """test align_and_padding with non trading date"""
+        rows = {datetime.datetime(2025, 3, 8): {types.CLOSE: 10.0}}
+        self.assertRaises(exception.ValidateTradingDayError,
+                          alignment.align_and_padding,
+                          build_dataframe(rows),
+                          [datetime.date(2025, 3, 7)])
+
+    def test_align_and_padding_empty(self):
+        """test align_and_padding with empty data"""
+        df = pd.DataFrame({types.CLOSE: []},
+                          index=pd.DatetimeIndex([]))
+        actual = alignment.align_and_padding(df, [datetime.date(2025, 3, 7)])
+        self.assertEqual(0, len(actual))
+
+    def test_align_and_padding_same_as_reference(self):
+        """test align_and_padding is the same as the two passes padding"""
+        rand = random.Random(7)
+        start = datetime.date(2025, 1, 1)
+        trading_dates = [start + datetime.timedelta(days=i)
+                         for i in range(200)]
+
+        for _ in range(20):
+            rows = {}
+            for i, date in enumerate(trading_dates):
+                if rand.random() < 0.7:
+                    continue
+                rows[pd.Timestamp(date)] = {
+                    types.CLOSE: float(i),
+                    types.VALID: 1,
+                    types.ADJUST_FACTOR: rand.choice([1.0, 1.1]),
+                }
+
+            trading_index = list(pd.DatetimeIndex(trading_dates))
+            expected = build_dataframe(
+                reference_align_and_padding(rows, trading_index))
+            actual = alignment.align_and_padding(build_dataframe(rows),
+                                                 trading_dates)
+            pd.testing.assert_frame_equal(expected,
+                                          actual,
+                                          check_dtype=False,
+                                          check_freq=False)
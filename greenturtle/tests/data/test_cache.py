@@ -0,0 +1,148 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for cache.py"""
+
+import datetime
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from greenturtle.constants import types
+from greenturtle.data import cache
+from greenturtle.data.datafeed import db
+from greenturtle.db import models
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+def get_key(data_version="v1", padding=True):
+    """get the cache key of the mock variety"""
+    return cache.get_cache_key("mock",
+                               "csi",
+                               "us",
+                               datetime.datetime(2025, 1, 1),
+                               datetime.datetime(2025, 3, 1),
+                               padding,
+                               data_version)
+
+
+class TestFeedCache(unittest.TestCase):
+    """unittest for FeedCache class"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # noqa: E501 pylint: disable=consider-using-with
+        self.feed_cache = cache.FeedCache(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_cache_key(self):
+        """test the cache key changes with the content"""
+        self.assertEqual(get_key(), get_key())
+        self.assertNotEqual(get_key(), get_key(data_version="v2"))
+        self.assertNotEqual(get_key(), get_key(padding=False))
+        self.assertTrue(get_key().startswith("mock-csi-us-"))
+
+    def test_put_and_get(self):
+        """test put and get the arrays"""
+        arrays = {
+            types.DATETIME: np.array(["2025-03-24"], dtype="datetime64[us]"),
+            types.CLOSE: np.array([10.0]),
+        }
+        self.assertIsNone(self.feed_cache.get(get_key()))
+
+        self.feed_cache.put(get_key(), arrays, data_version="v1")
+        actual = self.feed_cache.get(get_key())
+        self.assertEqual(set(arrays.keys()), set(actual.keys()))
+        np.testing.assert_array_equal(arrays[types.DATETIME],
+                                      actual[types.DATETIME])
+        np.testing.assert_array_equal(arrays[types.CLOSE],
+                                      actual[types.CLOSE])
+
+    def test_get_broken_file(self):
+        """test get the broken cache file"""
+        with open(self.feed_cache.get_path(get_key()), "wb") as f:
+            f.write(b"broken")
+        self.assertIsNone(self.feed_cache.get(get_key()))
+
+    def test_remove_stale(self):
+        """test the stale cache is removed after the new one is put"""
+        arrays = {types.CLOSE: np.array([1.0])}
+        prefix = cache.get_cache_prefix("mock", "csi", "us")
+        self.feed_cache.put(get_key("v1"), arrays, "v1", prefix)
+        self.feed_cache.put(get_key("v2"), arrays, "v2", prefix)
+
+        self.assertFalse(os.path.exists(
+            self.feed_cache.get_path(get_key("v1"))))
+        self.assertIsNotNone(self.feed_cache.get(get_key("v2")))
+
+
+class TestContinuousContractDBCache(unittest.TestCase):
+    """unittest for ContinuousContractDB with feed cache"""
+
+    @mock.patch("greenturtle.db.api.DBAPI")
+    def test_load_arrays_with_cache(self, mock_dbapi):
+        """test the database is not queried once the cache is hit"""
+        contract = models.ContinuousContract(
+            date=datetime.datetime(2025, 3, 24),
+            open=9,
+            high=11,
+            low=8,
+            close=10,
+            settle=10,
+            pre_settle=10,
+            volume=100,
+            adjust_factor=1,
+        )
+        dbapi = mock_dbapi.return_value
+        # pylint: disable=line-too-long
+        getter = dbapi.continuous_contract_get_by_variety_source_country_start_end_date  # noqa: E501
+        getter.return_value = [contract]
+        get_version = dbapi.continuous_contract_get_version_by_variety_source_country  # noqa: E501
+        get_version.return_value = "v1"
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            def load(end_date=datetime.datetime(2025, 3, 24)):
+                return db.ContinuousContractDB(
+                    start_date=datetime.datetime(2025, 3, 24),
+                    end_date=end_date,
+                    cache_dir=cache_dir,
+                ).load_arrays()
+
+            expected = load()
+            actual = load()
+            self.assertEqual(1, getter.call_count)
+            self.assertEqual(list(expected[types.CLOSE]),
+                             list(actual[types.CLOSE]))
+
+            # the cache of another date range keeps the former one
+            load(end_date=datetime.datetime(2025, 3, 25))
+            self.assertEqual(2, getter.call_count)
+            self.assertEqual(2, len(os.listdir(cache_dir)))
+            load()
+            self.assertEqual(2, getter.call_count)
+
+            # the data version changes, the cache is missed
+            get_version.return_value = "v2"
+            load()
+            self.assertEqual(3, getter.call_count)
+            self.assertEqual(1, len(os.listdir(cache_dir)))
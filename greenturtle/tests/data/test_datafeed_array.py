@@ -0,0 +1,152 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for datafeed/array.py"""
+
+import datetime
+import unittest
+
+import backtrader as bt
+import numpy as np
+
+from greenturtle.backtesting import backtesting
+from greenturtle.constants import types
+from greenturtle.constants import varieties
+from greenturtle.data.datafeed import array
+from greenturtle.data.datafeed import mock
+from greenturtle.db import models
+from greenturtle.data import transform
+from greenturtle.stragety import ema
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+class RecordStrategy(bt.Strategy):
+    """strategy to record the bars"""
+
+    def __init__(self):
+        super().__init__()
+        self.bars = []
+
+    def next(self):
+        data = self.datas[0]
+        self.bars.append((data.datetime.date(0),
+                          data.open[0],
+                          data.close[0],
+                          data.valid[0]))
+
+
+def run_record(data, **kwargs):
+    """run the record strategy and return the bars."""
+    cerebro = bt.Cerebro(**kwargs)
+    cerebro.adddata(data, name="mock")
+    cerebro.addstrategy(RecordStrategy)
+    result = cerebro.run()
+    return result[0].bars
+
+
+class TestArrayData(unittest.TestCase):
+    """unittest for ArrayData class"""
+
+    def test_datetime64_2_num(self):
+        """test datetime64_2_num"""
+        dates = np.array(["1970-01-01", "2020-01-01T12:00"],
+                         dtype="datetime64[us]")
+        actual = array.datetime64_2_num(dates)
+        self.assertEqual([719163.0, 737425.5], list(actual))
+
+    def test_normalize_arrays(self):
+        """test normalize_arrays with the default columns"""
+        arrays = {
+            types.DATETIME: np.array(["2025-03-24"], dtype="datetime64[D]"),
+            types.CLOSE: [10],
+        }
+        actual = array.normalize_arrays(arrays)
+        self.assertEqual(1, actual[types.VALID][0])
+        self.assertTrue(np.isnan(actual[types.OPEN_INTEREST][0]))
+
+        arrays[types.OPEN] = [1, 2]
+        self.assertRaises(ValueError, array.normalize_arrays, arrays)
+
+    def test_preload_same_as_pandas_data(self):
+        """test the preloaded bars are the same as pandas data"""
+        df = mock.get_mock_dataframe()
+        df.loc[df.index[3], types.VALID] = 0
+
+        # pylint: disable=unexpected-keyword-arg
+        expected = run_record(mock.MockPandasData(dataname=df))
+        actual = run_record(array.get_feed_from_dataframe("mock", df))
+        self.assertEqual(expected, actual)
+        self.assertEqual(0, actual[3][3])
+
+        # test without preload and runonce
+        actual = run_record(array.get_feed_from_dataframe("mock", df),
+                            preload=False,
+                            runonce=False)
+        self.assertEqual(expected, actual)
+
+    def test_fromdate_todate(self):
+        """test filter by fromdate and todate"""
+        df = mock.get_mock_dataframe()
+        data = array.get_feed_from_dataframe(
+            "mock",
+            df,
+            fromdate=datetime.datetime(2020, 1, 3),
+            todate=datetime.datetime(2020, 1, 5))
+        bars = run_record(data)
+        self.assertEqual([datetime.date(2020, 1, 3),
+                          datetime.date(2020, 1, 4),
+                          datetime.date(2020, 1, 5)],
+                         [b[0] for b in bars])
+
+    def test_continuous_contracts_2_arrays(self):
+        """test continuous contracts to arrays"""
+        c = models.ContinuousContract(
+            date=datetime.datetime(2025, 3, 24),
+            open=9,
+            high=10,
+            low=8,
+            close=9.5,
+            volume=None,
+        )
+        c.valid = 0
+        arrays = transform.continuous_contracts_2_arrays([c])
+        self.assertEqual(np.datetime64("2025-03-24"),
+                         arrays[types.DATETIME][0])
+        self.assertEqual(9.5, arrays[types.CLOSE][0])
+        self.assertEqual(0, arrays[types.VALID][0])
+        self.assertTrue(np.isnan(arrays[types.VOLUME][0]))
+
+    def test_do_backtesting(self):
+        """test backtesting with array data is the same as pandas data"""
+        name = "mock"
+        summaries = []
+        for data in (mock.get_mock_datafeed(name),
+                     array.get_feed_from_dataframe(
+                         name, mock.get_mock_dataframe())):
+            b = backtesting.BackTesting(varieties=varieties.US_VARIETIES)
+            b.add_data(data, name)
+            b.add_strategy(ema.EMA, risk_factor=0.1)
+            b.do_backtesting()
+            summaries.append(b.summary)
+
+        expected, actual = summaries[0], summaries[1]
+        self.assertEqual(expected.return_summary.days_return,
+                         actual.return_summary.days_return)
+        self.assertEqual(expected.trade_summary.net,
+                         actual.trade_summary.net)
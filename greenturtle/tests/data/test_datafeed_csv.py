@@ -0,0 +1,122 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for datafeed/csv.py"""
+
+import datetime
+import os
+import tempfile
+import unittest
+
+import backtrader as bt
+
+from greenturtle.constants import types
+from greenturtle.data.datafeed import csv
+from greenturtle.data.datafeed import mock
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+class BarStrategy(bt.Strategy):
+    """strategy to record all the lines of the bars"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def next(self):
+        data = self.datas[0]
+        self.records.append((data.datetime.datetime(0),
+                             data.open[0],
+                             data.high[0],
+                             data.low[0],
+                             data.close[0],
+                             data.volume[0],
+                             data.valid[0]))
+
+
+def write_mock_csv(path):
+    """write the mock data to csv file with the CSV_CLASS_PARAM layout"""
+    df = mock.get_mock_dataframe()
+    df.loc[df.index[5], types.VALID] = 0
+
+    out = df[[types.OPEN, types.HIGH, types.LOW, types.CLOSE]].copy()
+    out.insert(0, types.CONTRACT, "ZC")
+    out.insert(1, types.EXPIRE, "20251201")
+    for column in (types.ORI_OPEN, types.ORI_HIGH,
+                   types.ORI_LOW, types.ORI_CLOSE):
+        out[column] = df[types.CLOSE]
+    out[types.VOLUME] = df[types.VOLUME]
+    out[types.TOTAL_VOLUME] = df[types.VOLUME] * 2
+    out[types.OPEN_INTEREST] = df[types.OPEN_INTEREST]
+    out[types.TOTAL_OPEN_INTEREST] = df[types.OPEN_INTEREST] * 2
+    out[types.VALID] = df[types.VALID]
+
+    out.index = out.index.strftime(types.DATE_FORMAT)
+    out.index.name = types.DATE
+    out.to_csv(path)
+
+
+def run_records(data):
+    """run the strategy and return the records"""
+    cerebro = bt.Cerebro()
+    cerebro.adddata(data, name="ZC")
+    cerebro.addstrategy(BarStrategy)
+    return cerebro.run()[0].records
+
+
+class TestFastFutureCSV(unittest.TestCase):
+    """unittest for FastFutureCSV class"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # noqa: E501 pylint: disable=consider-using-with
+        self.path = os.path.join(self.tmp_dir.name, "ZC.csv")
+        write_mock_csv(self.path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_same_as_generic_csv(self):
+        """test the bars are the same as GenericCSVData"""
+        for fromdate, todate in ((None, None),
+                                 (datetime.datetime(2020, 1, 3),
+                                  datetime.datetime(2020, 2, 10))):
+            # pylint: disable=unexpected-keyword-arg
+            expected = run_records(csv.FutureCSV(
+                dataname=self.path,
+                dtformat=types.DATE_FORMAT,
+                fromdate=fromdate,
+                todate=todate))
+            actual = run_records(csv.get_feed_from_csv_file(
+                "ZC",
+                self.path,
+                fromdate=fromdate,
+                todate=todate))
+
+            self.assertEqual(expected, actual)
+            self.assertGreater(len(actual), 0)
+
+    def test_read_csv_arrays(self):
+        """test read the csv file into arrays"""
+        arrays = csv.read_csv_arrays(self.path,
+                                     fromdate=datetime.datetime(2020, 1, 2),
+                                     todate=datetime.datetime(2020, 1, 6))
+        self.assertEqual(5, len(arrays[types.DATETIME]))
+        self.assertEqual(0, arrays[types.VALID][4])
+        self.assertEqual(100, arrays[types.OPEN_INTEREST][0])
+        self.assertNotIn(types.CONTRACT, arrays)
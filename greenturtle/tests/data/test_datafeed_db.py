@@ -17,9 +17,13 @@
 
 import datetime
 import unittest
+from unittest import mock
 
+from greenturtle.constants import types
 from greenturtle.db import models
+from greenturtle.data.datafeed import array
 from greenturtle.data.datafeed import db
+from greenturtle.data import transform
 from greenturtle import exception
 
 
@@ -43,22 +47,6 @@ class TestContinuousContractDB(unittest.TestCase):
         actual = db.ContinuousContractDB._get_continuous_contracts_dict([c])
         self.assertEqual({c.date: c}, actual)
 
-    def test_validate_trading_dates(self):
-        """test _validate_trading_dates"""
-        trading_dates = [datetime.datetime(2025, 3, 24)]
-
-        # test with validate success
-        dates = [datetime.datetime(2025, 3, 24)]
-        # pylint:disable=protected-access
-        db.ContinuousContractDB._validate_trading_dates(dates, trading_dates)
-
-        # test with validate failed
-        dates = [datetime.datetime(2025, 3, 27)]
-        # pylint:disable=protected-access
-        self.assertRaises(exception.ValidateTradingDayError,
-                          db.ContinuousContractDB._validate_trading_dates,
-                          dates, trading_dates)
-
     def test_validate(self):
         """test validate"""
         datafeed = db.ContinuousContractDB()
@@ -131,6 +119,7 @@ class TestContinuousContractDB(unittest.TestCase):
             high=9,
             low=9,
             close=9,
+            volume=100,
             settle=10,
             pre_settle=10,
             adjust_factor=1,
@@ -141,6 +130,7 @@ class TestContinuousContractDB(unittest.TestCase):
             high=10,
             low=10,
             close=10,
+            volume=100,
             settle=10,
             pre_settle=10,
             adjust_factor=1,
@@ -151,11 +141,74 @@ class TestContinuousContractDB(unittest.TestCase):
             end_date=datetime.datetime(2025, 3, 25),
         )
 
-        continuous_contracts = [c1, c2]
-        datafeed.align_and_padding(continuous_contracts)
-        self.assertEqual(3, len(continuous_contracts))
-        self.assertEqual(9, continuous_contracts[0].open)
-        self.assertEqual(10, continuous_contracts[1].open)
-        self.assertEqual(9, continuous_contracts[2].open)
-        self.assertEqual(datetime.datetime(2025, 3, 21),
-                         continuous_contracts[2].date)
+        df = array.arrays_2_dataframe(
+            transform.continuous_contracts_2_arrays([c1, c2]))
+        df = datafeed.align_and_padding(df)
+        self.assertEqual(3, len(df))
+        self.assertEqual([9, 9, 10], list(df[types.OPEN]))
+        self.assertEqual([0, 1, 1], list(df[types.VALID]))
+        self.assertEqual(datetime.datetime(2025, 3, 21), df.index[0])
+
+    @mock.patch("greenturtle.db.api.DBAPI")
+    def test_load_arrays(self, mock_dbapi):
+        """test load_arrays"""
+        c1 = models.ContinuousContract(
+            date=datetime.datetime(2025, 3, 24),
+            open=9,
+            high=9,
+            low=9,
+            close=9,
+            volume=100,
+            settle=10,
+            pre_settle=10,
+            adjust_factor=1,
+        )
+        c2 = models.ContinuousContract(
+            date=datetime.datetime(2025, 3, 25),
+            open=10,
+            high=10,
+            low=10,
+            close=10,
+            volume=100,
+            settle=10,
+            pre_settle=10,
+            adjust_factor=1,
+        )
+        # pylint: disable=line-too-long
+        getter = mock_dbapi.return_value.continuous_contract_get_by_variety_source_country_start_end_date  # noqa: E501
+        getter.return_value = [c2, c1]
+
+        datafeed = db.ContinuousContractDB(
+            start_date=datetime.datetime(2025, 3, 21),
+            end_date=datetime.datetime(2025, 3, 25),
+            padding=True,
+        )
+        arrays = datafeed.load_arrays()
+
+        self.assertEqual([9, 9, 10], list(arrays[types.OPEN]))
+        self.assertEqual([0, 1, 1], list(arrays[types.VALID]))
+        self.assertEqual("2025-03-21",
+                         str(arrays[types.DATETIME][0].astype("M8[D]")))
+
+    @mock.patch("greenturtle.db.api.DBAPI")
+    def test_get_data_version(self, mock_dbapi):
+        """test get the data version of the varieties in the date range"""
+        # pylint: disable=line-too-long
+        get_version = mock_dbapi.return_value.continuous_contract_get_version_by_variety_source_country  # noqa: E501
+        get_version.side_effect = lambda name, *args, **kwargs: f"v{name}"
+
+        start_date = datetime.datetime(2025, 3, 21)
+        end_date = datetime.datetime(2025, 3, 25)
+        data_version = db.get_data_version(None,
+                                           ["A", "B"],
+                                           types.AKSHARE,
+                                           types.CN,
+                                           start_date=start_date,
+                                           end_date=end_date)
+
+        self.assertEqual("A@vA,B@vB", data_version)
+        get_version.assert_called_with("B",
+                                       types.AKSHARE,
+                                       types.CN,
+                                       start_date=start_date,
+                                       end_date=end_date)
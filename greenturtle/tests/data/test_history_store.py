@@ -0,0 +1,108 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for history_store.py and datafeed/memmap.py"""
+
+import datetime
+import tempfile
+import unittest
+
+import backtrader as bt
+import numpy as np
+
+from greenturtle.constants import types
+from greenturtle.data.datafeed import array
+from greenturtle.data.datafeed import memmap
+from greenturtle.data.datafeed import mock
+from greenturtle.data import history_store
+from greenturtle import exception
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+class OpenStrategy(bt.Strategy):
+    """strategy to record the date and open prices"""
+
+    def __init__(self):
+        super().__init__()
+        self.opens = []
+
+    def next(self):
+        data = self.datas[0]
+        self.opens.append((data.datetime.date(0), data.open[0]))
+
+
+class TestHistoryStore(unittest.TestCase):
+    """unittest for HistoryStore class"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # noqa: E501 pylint: disable=consider-using-with
+        self.df = mock.get_mock_dataframe()
+        self.arrays = array.dataframe_2_arrays(self.df)
+        store = history_store.HistoryStore(self.tmp_dir.name)
+        store.write("mock", self.arrays)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_read(self):
+        """test read the arrays by memory map"""
+        store = history_store.HistoryStore(self.tmp_dir.name)
+        self.assertEqual(["mock"], store.get_varieties())
+        self.assertEqual((datetime.datetime(2020, 1, 1),
+                          datetime.datetime(2020, 7, 18)),
+                         store.get_date_range("mock"))
+
+        records = store.read("mock")
+        self.assertIsInstance(records, np.memmap)
+
+        actual = store.get_arrays("mock",
+                                  start_date=datetime.datetime(2020, 1, 2),
+                                  end_date=datetime.datetime(2020, 1, 4))
+        np.testing.assert_array_equal(self.arrays[types.DATETIME][1:4],
+                                      actual[types.DATETIME])
+        np.testing.assert_array_equal(self.arrays[types.HIGH][1:4],
+                                      actual[types.HIGH])
+
+        self.assertRaises(exception.VarietyNotFound, store.read, "unknown")
+
+    def test_write_empty(self):
+        """test write and read the empty variety"""
+        store = history_store.HistoryStore(self.tmp_dir.name)
+        store.write("empty", {types.DATETIME: []})
+        self.assertEqual((None, None), store.get_date_range("empty"))
+        self.assertEqual(0, len(store.get_arrays("empty")[types.CLOSE]))
+
+    def test_feed(self):
+        """test run backtrader with the history store datafeed"""
+        data = memmap.get_feed_from_history_store(
+            self.tmp_dir.name,
+            "mock",
+            fromdate=datetime.datetime(2020, 2, 1))
+
+        cerebro = bt.Cerebro()
+        cerebro.adddata(data, name="mock")
+        cerebro.addstrategy(OpenStrategy)
+        opens = cerebro.run()[0].opens
+
+        expected = self.df[self.df.index >= datetime.datetime(2020, 2, 1)]
+        self.assertEqual(len(expected), len(opens))
+        self.assertEqual((datetime.date(2020, 2, 1),
+                          expected[types.OPEN].iloc[0]),
+                         opens[0])
+        self.assertEqual("mock", data.get_name())
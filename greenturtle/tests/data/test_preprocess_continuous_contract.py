@@ -460,6 +460,18 @@ class TestContinuousContract(unittest.TestCase):
         # pylint:disable=protected-access
         c._validate_prices_between_days(dates, contracts)
 
+        # the price drifts within the daily limit day by day
+        date2 = datetime.datetime(2025, 3, 28)
+        closes = [10, 12, 14]
+        drift = {date: models.ContinuousContract(name="IF2503",
+                                                 open=close,
+                                                 high=close,
+                                                 low=close,
+                                                 close=close)
+                 for date, close in zip([date0, date1, date2], closes)}
+        # pylint:disable=protected-access
+        c._validate_prices_between_days([date0, date1, date2], drift)
+
         # validate prices between days failed
         contracts = {
             date0: models.ContinuousContract(name="IF2503",
@@ -0,0 +1,147 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for sharedmem.py"""
+
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+import backtrader as bt
+import numpy as np
+
+from greenturtle.backtesting import runner
+from greenturtle.constants import types
+from greenturtle.data.datafeed import array
+from greenturtle.data.datafeed import mock
+from greenturtle.data import sharedmem
+from greenturtle import exception
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+def sum_close_in_worker(manifest, variety):
+    """attach the panel in the worker and sum the close price"""
+    panel = sharedmem.SharedPanel.attach(manifest)
+    total = float(np.sum(panel.get_arrays(variety)[types.CLOSE]))
+    panel.close()
+    return total
+
+
+class CloseStrategy(bt.Strategy):
+    """strategy to record the close prices"""
+
+    def __init__(self):
+        super().__init__()
+        self.closes = []
+
+    def next(self):
+        self.closes.append(self.datas[0].close[0])
+
+
+def get_mock_arrays():
+    """get the mock arrays, b has less dates than a"""
+    arrays = array.dataframe_2_arrays(mock.get_mock_dataframe())
+    return {
+        "a": arrays,
+        "b": {k: v[10:50] for k, v in arrays.items()},
+    }
+
+
+class TestSharedPanel(unittest.TestCase):
+    """unittest for SharedPanel class"""
+
+    def setUp(self):
+        self.arrays = get_mock_arrays()
+        self.panel = sharedmem.SharedPanel.create(self.arrays)
+
+    def tearDown(self):
+        self.panel.close()
+        self.panel.unlink()
+
+    def test_get_arrays(self):
+        """test get arrays from the panel"""
+        self.assertEqual((200, 2, len(sharedmem.FIELDS)),
+                         self.panel.values.shape)
+
+        for name, expected in self.arrays.items():
+            actual = self.panel.get_arrays(name)
+            np.testing.assert_array_equal(expected[types.DATETIME],
+                                          actual[types.DATETIME])
+            np.testing.assert_array_equal(expected[types.CLOSE],
+                                          actual[types.CLOSE])
+
+        # the full variety is zero copy
+        self.assertTrue(np.shares_memory(self.panel.values,
+                                         self.panel.get_arrays("a")["close"]))
+        self.assertRaises(exception.VarietyNotFound,
+                          self.panel.get_arrays,
+                          "c")
+
+    def test_attach_in_worker(self):
+        """test attach the panel in the worker process"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "manifest.json")
+            self.panel.save_manifest(path)
+            manifest = sharedmem.load_manifest(path)
+
+        with multiprocessing.Pool(1) as pool:
+            actual = pool.starmap(sum_close_in_worker, [(manifest, "b")])
+
+        self.assertEqual(float(np.sum(self.arrays["b"][types.CLOSE])),
+                         actual[0])
+
+    def test_get_feed(self):
+        """test run backtrader with the feed from the panel"""
+        cerebro = bt.Cerebro()
+        cerebro.adddata(self.panel.get_feed("b"), name="b")
+        cerebro.addstrategy(CloseStrategy)
+        result = cerebro.run()
+
+        self.assertEqual(list(self.arrays["b"][types.CLOSE]),
+                         result[0].closes)
+
+    def test_load_arrays_from_shared_panel(self):
+        """test the panel is attached once per process"""
+        manifest = self.panel.manifest
+        first = runner.load_arrays_from_shared_panel(manifest)
+        second = runner.load_arrays_from_shared_panel(manifest)
+
+        # pylint: disable=protected-access
+        self.assertEqual([manifest["values"]],
+                         list(runner._ATTACHED_PANELS))
+        np.testing.assert_array_equal(self.arrays["b"][types.CLOSE],
+                                      second["b"][types.CLOSE])
+
+        del first, second
+        runner.close_attached_panels()
+        self.assertEqual({}, runner._ATTACHED_PANELS)
+
+    def test_cleanup(self):
+        """test cleanup the leftover shared memory"""
+        panel = sharedmem.SharedPanel.create({"a": self.arrays["a"]})
+        manifest = panel.manifest
+        panel.close()
+
+        sharedmem.cleanup(manifest)
+        self.assertRaises(FileNotFoundError,
+                          sharedmem.SharedPanel.attach,
+                          manifest)
+        # cleanup twice is fine
+        sharedmem.cleanup(manifest)
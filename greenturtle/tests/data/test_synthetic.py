@@ -0,0 +1,126 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for synthetic.py"""
+
+import os
+import tempfile
+import unittest
+
+import munch
+import numpy as np
+import pandas as pd
+
+from greenturtle.constants import types
+from greenturtle.data.datafeed import db
+from greenturtle.data.preprocess import continuous_contract
+from greenturtle.data import synthetic
+from greenturtle.db import api
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+class TestSyntheticMarket(unittest.TestCase):
+    """unittest for SyntheticMarket class"""
+
+    def test_deterministic(self):
+        """test the data is the same with the same seed"""
+        a = synthetic.SyntheticMarket(n_varieties=2, years=1, seed=1)
+        b = synthetic.SyntheticMarket(n_varieties=2, years=1, seed=1)
+        c = synthetic.SyntheticMarket(n_varieties=2, years=1, seed=2)
+
+        pd.testing.assert_frame_equal(a.get_contracts("S01"),
+                                      b.get_contracts("S01"))
+        self.assertFalse(a.get_contracts("S01")[types.CLOSE].equals(
+            c.get_contracts("S01")[types.CLOSE]))
+
+    def test_contracts(self):
+        """test the contracts overlap, roll and miss some dates"""
+        market = synthetic.SyntheticMarket(n_varieties=1,
+                                           years=2,
+                                           missing_ratio=0.05,
+                                           bad_print_ratio=0.01)
+        df = market.get_contracts("S00")
+
+        # multiple overlapping contracts on the same date
+        self.assertGreater(df.groupby(types.DATE).size().min(), 1)
+        self.assertTrue((df[types.DATE] < df[types.EXPIRE]).all())
+
+        # missing days
+        dates = df[types.DATE].unique()
+        self.assertLess(len(dates), len(market.get_trading_dates()))
+
+        # bad prints break the high or low price
+        bad = (df[types.CLOSE] > df[types.HIGH]) | \
+            (df[types.CLOSE] < df[types.LOW])
+        self.assertGreater(bad.sum(), 0)
+
+        # the main contract rolls
+        contracts = market.get_continuous_contracts("S00")
+        self.assertEqual(len(dates), len(contracts))
+        self.assertGreater(len({c.name for c in contracts}), 4)
+
+    def test_write_to_files(self):
+        """test write the contracts to csv files"""
+        market = synthetic.SyntheticMarket(n_varieties=2, years=1)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            market.write_to_files(tmp_dir)
+            df = pd.read_csv(os.path.join(tmp_dir, "S01.csv"))
+            path = os.path.join(tmp_dir, "continuous.csv")
+            market.write_continuous_csv("S01", path)
+            continuous = pd.read_csv(path)
+
+        self.assertEqual(len(market.get_contracts("S01")), len(df))
+        self.assertEqual(len(market.get_arrays("S01")[types.CLOSE]),
+                         len(continuous))
+
+    def test_same_as_database_pipeline(self):
+        """
+        test the in memory continuous contracts are the same as the ones
+        generated from the database.
+        """
+        market = synthetic.SyntheticMarket(n_varieties=1,
+                                           years=1,
+                                           bad_print_ratio=0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_conf = munch.Munch(drivername=api.SQLITE_DRIVERNAME,
+                                  database=os.path.join(tmp_dir, "db"))
+            api.DBManager(db_conf).create_all()
+            dbapi = api.DBAPI(db_conf)
+            market.write_to_db(dbapi)
+
+            continuous_contract.ContinuousContract(
+                "S00", types.CSI, types.US, dbapi).generate()
+
+            # pylint: disable=unexpected-keyword-arg
+            data = db.ContinuousContractDB(db_conf=db_conf,
+                                           variety="S00",
+                                           source=types.CSI,
+                                           country=types.US,
+                                           start_date=market.start_date,
+                                           end_date=market.end_date)
+            actual = data.load_arrays()
+
+        expected = market.get_arrays("S00")
+        np.testing.assert_array_equal(expected[types.DATETIME],
+                                      actual[types.DATETIME])
+        np.testing.assert_allclose(expected[types.CLOSE],
+                                   actual[types.CLOSE])
+        np.testing.assert_allclose(expected[types.LOW],
+                                   actual[types.LOW])
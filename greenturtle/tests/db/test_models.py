@@ -101,3 +101,100 @@ class TestContinuousModel(unittest.TestCase):
         ]
 
         self.assertEqual(expect, actual)
+
+
+class TestIndicatorSnapshotModel(unittest.TestCase):
+    """unittest for IndicatorSnapshot model"""
+
+    def test_columns(self):
+        """test columns"""
+        table = models.IndicatorSnapshot.__table__
+        actual = sorted(column.name for column in table.columns)
+
+        expect = [
+            "content",
+            "created_at",
+            "date",
+            "id",
+            "updated_at",
+            "version",
+        ]
+
+        self.assertEqual(expect, actual)
+
+
+class TestBacktestRunModel(unittest.TestCase):
+    """unittest for BacktestRun model"""
+
+    def test_columns(self):
+        """test columns"""
+        table = models.BacktestRun.__table__
+        actual = sorted(column.name for column in table.columns)
+
+        expect = [
+            "annual_return",
+            "created_at",
+            "data_version",
+            "end_date",
+            "id",
+            "leverage_ratio",
+            "max_draw_down",
+            "net",
+            "params",
+            "run_id",
+            "sharpe_ratio",
+            "start_date",
+            "strategy",
+            "total_return",
+            "trade_number",
+            "updated_at",
+            "varieties",
+            "won_trade_number",
+        ]
+
+        self.assertEqual(expect, actual)
+
+
+class TestBacktestReturnModel(unittest.TestCase):
+    """unittest for BacktestReturn model"""
+
+    def test_columns(self):
+        """test columns"""
+        table = models.BacktestReturn.__table__
+        actual = sorted(column.name for column in table.columns)
+
+        expect = [
+            "created_at",
+            "dates",
+            "id",
+            "period",
+            "run_id",
+            "updated_at",
+            "values",
+        ]
+
+        self.assertEqual(expect, actual)
+
+
+class TestBacktestPositionPNLModel(unittest.TestCase):
+    """unittest for BacktestPositionPNL model"""
+
+    def test_columns(self):
+        """test columns"""
+        table = models.BacktestPositionPNL.__table__
+        actual = sorted(column.name for column in table.columns)
+
+        expect = [
+            "created_at",
+            "gross",
+            "id",
+            "lost",
+            "name",
+            "net",
+            "profit",
+            "run_id",
+            "trade_number",
+            "updated_at",
+        ]
+
+        self.assertEqual(expect, actual)
@@ -0,0 +1,74 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for adapters.py"""
+
+import operator
+import unittest
+
+import backtrader as bt
+import numpy as np
+
+from greenturtle.data import synthetic
+from greenturtle.indicators import adapters
+
+
+class PairStrategy(bt.Strategy):
+    """strategy which holds the adapters and the built-in indicators."""
+
+    def __init__(self):
+        super().__init__()
+        data = self.data
+        # pylint: disable=unexpected-keyword-arg,too-many-function-args
+        self.pairs = [
+            (adapters.EMA(data, period=20),
+             bt.indicators.MovAv.Exponential(data, period=20)),
+            (adapters.ATR(data, period=14),
+             bt.indicators.ATR(data, period=14)),
+            (adapters.Highest(data.high, period=25),
+             bt.indicators.Highest(data.high, period=25)),
+            (adapters.Lowest(data.low, period=25),
+             bt.indicators.Lowest(data.low, period=25)),
+        ]
+
+
+class TestAdapters(unittest.TestCase):
+    """unittest for the backtrader adapters of the kernels"""
+
+    def test_same_as_backtrader(self):
+        """test the adapters are the same as the built-in indicators"""
+        market = synthetic.SyntheticMarket(n_varieties=1, years=2)
+        length = len(market.get_arrays("S00")["close"])
+
+        for runonce in (True, False):
+            cerebro = bt.Cerebro()
+            cerebro.adddata(market.get_feed("S00"))
+            cerebro.addstrategy(PairStrategy)
+            strategy = cerebro.run(runonce=runonce)[0]
+
+            for actual, expected in strategy.pairs:
+                np.testing.assert_array_equal(
+                    np.array(expected.array[:length]),
+                    np.array(actual.array[:length]))
+
+    def test_monotonic_deque(self):
+        """test the monotonic deque is the extreme of the window"""
+        rng = np.random.default_rng(0)
+        values = rng.integers(0, 10, 200).astype(float)
+        for compare, func in ((operator.gt, max), (operator.lt, min)):
+            deque = adapters.MonotonicDeque(5, compare)
+            for i, value in enumerate(values):
+                self.assertEqual(func(values[max(0, i - 4):i + 1]),
+                                 deque.push(value))
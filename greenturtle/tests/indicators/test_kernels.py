@@ -0,0 +1,128 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for kernels.py"""
+
+import unittest
+
+import backtrader as bt
+import numpy as np
+
+from greenturtle.data.datafeed import mock
+from greenturtle.indicators import kernels
+
+
+class IndicatorStrategy(bt.Strategy):
+    """strategy which only holds the backtrader indicators."""
+
+    def __init__(self):
+        super().__init__()
+        self.ema = bt.indicators.MovAv.Exponential(self.data, period=20)
+        self.atr = bt.indicators.ATR(self.data, period=14)
+        self.highest = bt.indicators.Highest(self.data.high, period=25)
+        self.lowest = bt.indicators.Lowest(self.data.low, period=25)
+
+
+def get_line(indicator, length):
+    """get the values of the indicator line."""
+    return np.array(indicator.array[:length])
+
+
+class TestKernels(unittest.TestCase):
+    """unittest for the indicator kernels"""
+
+    def test_same_as_backtrader(self):
+        """test the kernels are the same as the backtrader indicators"""
+        df = mock.get_mock_dataframe()
+        cerebro = bt.Cerebro()
+        cerebro.adddata(mock.get_mock_datafeed())
+        cerebro.addstrategy(IndicatorStrategy)
+        strategy = cerebro.run()[0]
+
+        length = len(df)
+        high, low, close = df["high"], df["low"], df["close"]
+        cases = [
+            (strategy.ema, kernels.ema(close, 20)),
+            (strategy.atr, kernels.atr(high, low, close, 14)),
+            (strategy.highest, kernels.highest(high, 25)),
+            (strategy.lowest, kernels.lowest(low, 25)),
+        ]
+        for indicator, actual in cases:
+            np.testing.assert_array_equal(get_line(indicator, length), actual)
+
+    def test_ema(self):
+        """test ema seeded by the simple average"""
+        actual = kernels.ema([1.0, 2.0, 3.0, 4.0], 3)
+        np.testing.assert_array_equal([np.nan, np.nan, 2.0, 3.0], actual)
+
+    def test_columns(self):
+        """test the kernels compute every column with leading nan"""
+        values = np.array([[1.0, np.nan],
+                           [2.0, 1.0],
+                           [3.0, 2.0],
+                           [4.0, 3.0]])
+        actual = kernels.ema(values, 2)
+        np.testing.assert_array_equal(kernels.ema(values[:, 0], 2),
+                                      actual[:, 0])
+        np.testing.assert_array_equal([np.nan, np.nan, 1.5, 2.5],
+                                      actual[:, 1])
+
+        np.testing.assert_array_equal([[np.nan, np.nan],
+                                       [np.nan, np.nan],
+                                       [3.0, np.nan],
+                                       [4.0, 3.0]],
+                                      kernels.highest(values, 3))
+
+    def test_short_array(self):
+        """test the kernels with the array shorter than the period"""
+        self.assertTrue(np.isnan(kernels.ema([1.0, 2.0], 3)).all())
+        self.assertTrue(np.isnan(kernels.lowest([1.0, 2.0], 3)).all())
+        self.assertTrue(np.isnan(kernels.atr([2.0], [1.0], [1.5], 3)).all())
+
+    def test_shift(self):
+        """test shift the values forward"""
+        np.testing.assert_array_equal([np.nan, 1.0, 2.0],
+                                      kernels.shift([1.0, 2.0, 3.0]))
+
+    def test_rolling_sum(self):
+        """test the rolling sum is the same as the window sums"""
+        rng = np.random.default_rng(0)
+        values = rng.random((100, 2)) * 1000
+        values[30, 0] = np.nan
+        for period in (1, 7, 10, 100):
+            expected = np.full(values.shape, np.nan)
+            for i in range(period - 1, len(values)):
+                expected[i] = values[i - period + 1:i + 1].sum(axis=0)
+            np.testing.assert_allclose(expected,
+                                       kernels.rolling_sum(values, period),
+                                       rtol=1e-12)
+
+        self.assertTrue(np.isnan(kernels.rolling_sum([1.0, 2.0], 3)).all())
+
+    def test_convergence_bars(self):
+        """test the ema over the convergence bars is close to the full one"""
+        rng = np.random.default_rng(0)
+        values = 100 + np.cumsum(rng.normal(size=2000))
+        tolerance = 0.01
+        for period in (10, 50, 100):
+            bars = kernels.get_ema_convergence_bars(period, tolerance)
+            full = kernels.ema(values, period)[-1]
+            partial = kernels.ema(values[-bars:], period)[-1]
+            span = values[-bars:].max() - values[-bars:].min()
+            self.assertLess(abs(full - partial), tolerance * span)
+
+        self.assertEqual(1, kernels.get_convergence_bars(1, 1.0, tolerance))
+        self.assertEqual(kernels.get_convergence_bars(20, 0.05, 0.01) + 1,
+                         kernels.get_atr_convergence_bars(20, 0.01))
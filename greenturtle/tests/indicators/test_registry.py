@@ -0,0 +1,134 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for registry.py"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from greenturtle.backtesting import backtesting
+from greenturtle.data import synthetic
+from greenturtle.indicators import kernels
+from greenturtle.indicators import registry
+from greenturtle.stragety import ema
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+class TestRegistry(unittest.TestCase):
+    """unittest for the indicator registry"""
+
+    def test_compute(self):
+        """test the result is shared by the kernel, params and content"""
+        reg = registry.IndicatorRegistry()
+        values = np.arange(50, dtype=float)
+
+        first = reg.compute(kernels.ema, [values], period=10)
+        np.testing.assert_array_equal(kernels.ema(values, 10), first)
+        self.assertIs(first, reg.compute(kernels.ema, [values.copy()],
+                                         period=10))
+        self.assertEqual((1, 1), (reg.hits, reg.misses))
+        self.assertRaises(ValueError, first.__setitem__, 0, 1.0)
+
+        # other params, kernel or content is another indicator
+        reg.compute(kernels.ema, [values], period=20)
+        reg.compute(kernels.highest, [values], period=10)
+        reg.compute(kernels.ema, [values + 1], period=10)
+        self.assertEqual((1, 4), (reg.hits, reg.misses))
+
+    def test_eviction(self):
+        """test the least recently used arrays are evicted"""
+        reg = registry.IndicatorRegistry(max_entries=2)
+        values = np.arange(50, dtype=float)
+        for period in (5, 10, 5, 20):
+            reg.compute(kernels.ema, [values], period=period)
+
+        self.assertEqual(2, len(reg.arrays))
+        reg.compute(kernels.ema, [values], period=5)
+        reg.compute(kernels.ema, [values], period=10)
+        self.assertEqual((2, 4), (reg.hits, reg.misses))
+
+    def test_eviction_by_bytes(self):
+        """test the arrays are evicted beyond the bytes budget"""
+        values = np.arange(50, dtype=float)
+        reg = registry.IndicatorRegistry(max_bytes=2 * values.nbytes)
+        for period in (5, 10, 20):
+            reg.compute(kernels.ema, [values], period=period)
+
+        self.assertEqual(2, len(reg.arrays))
+        self.assertEqual(2 * values.nbytes, reg.nbytes)
+        reg.compute(kernels.ema, [values], period=5)
+        self.assertEqual((0, 4), (reg.hits, reg.misses))
+
+        reg.clear()
+        self.assertEqual(0, reg.nbytes)
+
+    def test_prune_disk(self):
+        """test the least recently used files are pruned from the disk"""
+        values = np.arange(50, dtype=float)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reg = registry.IndicatorRegistry(cache_dir=tmp_dir)
+            reg.compute(kernels.ema, [values], period=5)
+            indicators_dir = os.path.join(tmp_dir, registry.INDICATORS_DIR)
+            file_name = os.listdir(indicators_dir)[0]
+            size = os.path.getsize(os.path.join(indicators_dir, file_name))
+            os.utime(os.path.join(indicators_dir, file_name), (0, 0))
+
+            # the disk budget only keeps the latest two files
+            reg.max_disk_bytes = 2 * size
+            for period in (10, 20):
+                reg.compute(kernels.ema, [values], period=period)
+
+            self.assertEqual(2, len(os.listdir(indicators_dir)))
+            self.assertNotIn(file_name, os.listdir(indicators_dir))
+
+    def test_persist(self):
+        """test the arrays are reused by another process via the disk"""
+        values = np.arange(50, dtype=float)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            expected = registry.IndicatorRegistry(cache_dir=tmp_dir).compute(
+                kernels.ema, [values], period=10)
+            self.assertEqual(
+                1, len(os.listdir(os.path.join(tmp_dir,
+                                               registry.INDICATORS_DIR))))
+
+            reg = registry.IndicatorRegistry(cache_dir=tmp_dir)
+            actual = reg.compute(kernels.ema, [values], period=10)
+            np.testing.assert_array_equal(expected, actual)
+            self.assertEqual((1, 0), (reg.hits, reg.misses))
+
+    def test_shared_by_strategies(self):
+        """test the strategies over the same data share the indicators"""
+        market = synthetic.SyntheticMarket(n_varieties=2, years=1)
+        reg = registry.get_registry()
+        reg.clear()
+
+        for strategy in (ema.EMA, ema.EMAEnhanced):
+            b = backtesting.BackTesting(varieties=market.get_varieties())
+            for name in market.names:
+                b.add_data(market.get_feed(name), name)
+                b.set_default_commission_by_name(name)
+            b.add_strategy(strategy, varieties=market.get_varieties())
+            b.run()
+
+        # the atr, fast and slow ema of every variety are computed once,
+        # only the highest and lowest are computed by the second strategy
+        self.assertEqual(5 * len(market.names), reg.misses)
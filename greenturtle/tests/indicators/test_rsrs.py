@@ -0,0 +1,123 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for rsrs.py"""
+
+import unittest
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+from greenturtle.data.datafeed import array
+from greenturtle.data import synthetic
+from greenturtle.indicators import kernels
+from greenturtle.indicators import rsrs
+
+PERIOD = 18
+ZSCORE_PERIOD = 60
+
+# the max relative difference to the fitted regression
+TOLERANCE = 1e-8
+
+
+class RSRSStrategy(bt.Strategy):
+    """strategy which only holds the rsrs indicator."""
+
+    def __init__(self):
+        super().__init__()
+        # pylint: disable=unexpected-keyword-arg,too-many-function-args
+        self.rsrs = rsrs.RSRS(self.data,
+                              period=PERIOD,
+                              zscore_period=ZSCORE_PERIOD)
+
+
+def run(arrays, runonce):
+    """run the rsrs indicator and return the values of the lines."""
+    feed = array.get_feed_from_arrays("S00", arrays)
+    cerebro = bt.Cerebro()
+    cerebro.adddata(feed)
+    cerebro.addstrategy(RSRSStrategy)
+    indicator = cerebro.run(runonce=runonce)[0].rsrs
+
+    length = len(arrays["close"])
+    return {name: np.array(getattr(indicator.lines, name).array[:length])
+            for name in indicator.lines.getlinealiases()}
+
+
+def fit(low, high):
+    """fit the regression by sklearn as the reference."""
+    slopes, r2s = [], []
+    for i in range(len(low)):
+        if i < PERIOD - 1:
+            slopes.append(-1)
+            r2s.append(np.nan)
+            continue
+        x = low[i - PERIOD + 1:i + 1].reshape(-1, 1)
+        y = high[i - PERIOD + 1:i + 1]
+        lr = LinearRegression()
+        lr.fit(x, y)
+        slopes.append(lr.coef_[0])
+        r2s.append(lr.score(x, y))
+
+    return np.array(slopes), np.array(r2s)
+
+
+class TestRSRS(unittest.TestCase):
+    """unittest for the RSRS indicator"""
+
+    def test_same_as_regression(self):
+        """test the lines are the same as the fitted regression"""
+        market = synthetic.SyntheticMarket(n_varieties=1, years=2)
+        arrays = market.get_arrays("S00")
+        slope, r2 = fit(arrays["low"], arrays["high"])
+        zscore = (pd.Series(slope[PERIOD - 1:])
+                  .rolling(ZSCORE_PERIOD)
+                  .apply(lambda w: (w.iloc[-1] - w.mean()) / w.std(ddof=0)))
+        zscore = np.r_[np.full(PERIOD - 1, np.nan), zscore.values]
+
+        for runonce in (True, False):
+            lines = run(arrays, runonce)
+            np.testing.assert_allclose(slope, lines["rsrs"], rtol=TOLERANCE)
+            np.testing.assert_allclose(r2, lines["r2"], rtol=TOLERANCE)
+            np.testing.assert_allclose(zscore,
+                                       lines["zscore"],
+                                       rtol=1e-6,
+                                       atol=1e-6)
+            np.testing.assert_array_equal(lines["zscore"] * lines["r2"],
+                                          lines["weighted"])
+
+    def test_constant_window(self):
+        """test the slope and r squared of the constant window"""
+        x = np.array([1.0, 1.0, 1.0, 2.0, 3.0])
+        y = np.array([5.0, 5.0, 5.0, 7.0, 9.0])
+        slope, r2 = kernels.rolling_ols(x, y, 3)
+        np.testing.assert_allclose([np.nan, np.nan, 0, 2, 2], slope)
+        np.testing.assert_allclose([np.nan, np.nan, 0, 1, 1], r2)
+
+        self.assertEqual((0.0, 0.0), rsrs.ols_by_sums(3, 3, 15, 15, 3, 75))
+        self.assertEqual(0.0, rsrs.zscore_by_sums(3, 1.0, 3.0, 3.0))
+
+    def test_rolling_sums(self):
+        """test the rolling sums are the same as the window sums"""
+        rng = np.random.default_rng(0)
+        values = rng.random(100) * 1000
+        sums = rsrs.RollingSums(7, 1)
+        for i, value in enumerate(values):
+            sums.push((value,))
+            self.assertEqual(i >= 6, sums.is_full())
+            self.assertAlmostEqual(values[max(0, i - 6):i + 1].sum(),
+                                   sums.sums[0])
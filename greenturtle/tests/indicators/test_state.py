@@ -0,0 +1,197 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for state.py"""
+
+import datetime
+import unittest
+
+import backtrader as bt
+
+from greenturtle.backtesting import backtesting
+from greenturtle.constants import types
+from greenturtle.data import alignment
+from greenturtle.data.datafeed import array
+from greenturtle.data import synthetic
+from greenturtle.indicators import state
+from greenturtle.stragety import ema
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+PERIODS = {
+    "fast_period": 5,
+    "slow_period": 20,
+    "channel_period": 10,
+    "atr_period": 15,
+}
+
+
+class SignalAnalyzer(bt.Analyzer):
+    """record the indicators of every bar."""
+
+    def create_analysis(self):
+        # pylint: disable=attribute-defined-outside-init
+        self.rets = {}
+
+    def next(self):
+        # pylint: disable=no-member
+        strategy = self.strategy
+        date = strategy.datas[0].datetime.date(0)
+        self.rets[date] = {
+            name: (strategy.fast_emas[name][0],
+                   strategy.slow_emas[name][0],
+                   strategy.highest[name][0],
+                   strategy.lowest[name][0],
+                   strategy.atrs[name][0])
+            for name in strategy.names
+        }
+
+
+def get_padded_arrays(market, name, fromdate=None):
+    """
+    get the arrays of the variety from the date padded over the trading
+    dates, the same as the database feed loaded from the date.
+    """
+    df = array.arrays_2_dataframe(market.get_arrays(name))
+    trading_dates = market.get_trading_dates()
+    if fromdate is not None:
+        df = df[df.index >= fromdate]
+        trading_dates = trading_dates[trading_dates >= fromdate]
+
+    return array.dataframe_2_arrays(
+        alignment.align_and_padding(df, trading_dates, name=name))
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def run(market,
+        fromdate=None,
+        todate=None,
+        indicator_states=None,
+        padding=False):
+    """run the strategy over the market and return the strategy."""
+    b = backtesting.BackTesting(varieties=market.get_varieties())
+    for name in market.names:
+        arrays = market.get_arrays(name)
+        if padding:
+            arrays = get_padded_arrays(market, name, fromdate=fromdate)
+        feed = array.get_feed_from_arrays(name,
+                                          arrays,
+                                          fromdate=fromdate,
+                                          todate=todate)
+        b.add_data(feed, name)
+        b.set_default_commission_by_name(name)
+
+    b.add_strategy(ema.EMAEnhanced,
+                   varieties=market.get_varieties(),
+                   indicator_states=indicator_states,
+                   **PERIODS)
+    b.cerebro.addanalyzer(SignalAnalyzer, _name="Signal")
+    return b.run()[0]
+
+
+class TestState(unittest.TestCase):
+    """unittest for the resumed indicators"""
+
+    def test_resume(self):
+        """test the resumed indicators are the same as the full run"""
+        market = synthetic.SyntheticMarket(n_varieties=3,
+                                           years=1,
+                                           missing_ratio=0,
+                                           bad_print_ratio=0)
+        full = run(market)
+        expected = full.analyzers.Signal.get_analysis()
+        dates = sorted(expected)
+
+        # resume the second part from the states of the first part, and
+        # then resume the last bar from the states of the second part
+        split = datetime.datetime.combine(dates[100], datetime.time())
+        last = datetime.datetime.combine(dates[-1], datetime.time())
+        first = run(market, todate=split)
+        second = run(market,
+                     fromdate=split + datetime.timedelta(days=1),
+                     todate=last - datetime.timedelta(days=1),
+                     indicator_states=first.get_indicator_states())
+        third = run(market,
+                    fromdate=last,
+                    indicator_states=second.get_indicator_states())
+
+        actual = dict(second.analyzers.Signal.get_analysis())
+        actual.update(third.analyzers.Signal.get_analysis())
+        self.assertEqual(dates[101:], sorted(actual))
+        for date, values in actual.items():
+            self.assertEqual(expected[date], values)
+
+        self.assertEqual(full.get_indicator_states(),
+                         third.get_indicator_states())
+
+    def test_resume_with_gaps(self):
+        """
+        test the resumed indicators over the padded bars with gaps are the
+        same as the full run once every variety has the next bar
+        """
+        market = synthetic.SyntheticMarket(n_varieties=3,
+                                           years=1,
+                                           missing_ratio=0.05,
+                                           bad_print_ratio=0)
+        full = run(market, padding=True)
+        expected = full.analyzers.Signal.get_analysis()
+
+        # the first date after the middle that every variety has a bar,
+        # following a date that some variety misses
+        dates = market.get_trading_dates()
+        present = [set(market.get_arrays(name)[types.DATETIME].astype(
+            "M8[D]").astype(datetime.date)) for name in market.names]
+        split = next(i for i in range(len(dates) // 2, len(dates))
+                     if all(dates[i].date() in p for p in present) and
+                     not all(dates[i - 1].date() in p for p in present))
+        self.assertLess(split, len(dates))
+
+        first = run(market,
+                    todate=dates[split - 1].to_pydatetime(),
+                    padding=True)
+        second = run(market,
+                     fromdate=dates[split].to_pydatetime(),
+                     indicator_states=first.get_indicator_states(),
+                     padding=True)
+
+        actual = second.analyzers.Signal.get_analysis()
+        self.assertEqual([d.date() for d in dates[split:]], sorted(actual))
+        for date, values in actual.items():
+            self.assertEqual(expected[date], values)
+
+    def test_get_state(self):
+        """test the state of the rolling indicator"""
+        market = synthetic.SyntheticMarket(n_varieties=1, years=1)
+        strategy = run(market)
+        name = market.names[0]
+        data = strategy.getdatabyname(name)
+
+        states = strategy.get_indicator_states()[name]
+        self.assertEqual(list(data.close.get(size=9)),
+                         states["highest"][state.WINDOW])
+        self.assertEqual(data.close[0], states["atr"][state.CLOSE])
+        self.assertEqual(strategy.slow_emas[name][0],
+                         states["slow_ema"][state.VALUE])
+
+    def test_create_indicator(self):
+        """test create indicator with unknown kind"""
+        self.assertRaises(ValueError,
+                          state.create_indicator,
+                          "unknown",
+                          None,
+                          1)
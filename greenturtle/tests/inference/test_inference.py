@@ -16,12 +16,33 @@
 """unittest for inference.py"""
 
 
+import datetime
+import os
+import tempfile
 import unittest
 
 import munch
 
+from greenturtle.constants import types
+from greenturtle.db import api
 from greenturtle import exception
 from greenturtle.inference import inference
+from greenturtle.inference import snapshot
+from greenturtle.util import calendar
+
+
+def create_continuous_contract(dbapi, date, adjust_factor=1.0):
+    """create the continuous contract of IF for testing."""
+    values = {
+        types.OPEN: 3900.0,
+        types.HIGH: 3950.0,
+        types.LOW: 3850.0,
+        types.CLOSE: 3920.0,
+        types.EXPIRE: datetime.datetime(2025, 12, 19),
+        types.ADJUST_FACTOR: adjust_factor,
+    }
+    dbapi.continuous_contract_create(date, "IF2512", "IF", types.AKSHARE,
+                                     types.CN, "CFFEX", "indices", values)
 
 
 class TestInference(unittest.TestCase):
@@ -51,6 +72,18 @@ class TestInference(unittest.TestCase):
         infer = inference.Inference()
         infer.set_multiplier_and_auto_margin("IF")
 
+    def test_get_start_date(self):
+        """test the start date only covers the warm up bars"""
+        trading_date = datetime.date(2025, 6, 30)
+        infer = inference.Inference(trading_date=trading_date)
+        start_date = infer.get_start_date()
+
+        bars = inference.STRATEGY.get_warmup_bars(
+            **inference.STRATEGY_PERIODS)
+        cal = calendar.get_cn_calendar()
+        self.assertEqual(bars + 1, cal.count(start_date, trading_date))
+        self.assertEqual(datetime.time(), start_date.time())
+
     def test_validate_config(self):
         """test validate_config"""
         infer = inference.Inference()
@@ -96,3 +129,94 @@ class TestInference(unittest.TestCase):
         self.assertRaises(exception.ValidateGroupRiskFactorError,
                           infer.validate_config,
                           conf)
+
+    def test_restore_snapshot(self):
+        """test restore the snapshot and the stale snapshot"""
+        trading_date = datetime.date(2025, 6, 30)
+        snapshot_date = datetime.date(2025, 6, 27)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            conf = munch.Munch(
+                db=munch.Munch(drivername=api.SQLITE_DRIVERNAME,
+                               database=os.path.join(tmp_dir, "db")),
+                source=types.AKSHARE,
+                country=types.CN,
+                whitelist=["IF"],
+                snapshot=munch.Munch(directory=tmp_dir))
+            api.DBManager(conf.db).create_all()
+            dbapi = api.DBAPI(conf.db)
+            for day in (26, 27, 30):
+                create_continuous_contract(dbapi,
+                                           datetime.datetime(2025, 6, day))
+
+            infer = inference.Inference(conf=conf, trading_date=trading_date)
+            self.assertIsNone(infer.restore_snapshot())
+
+            expected = snapshot.Snapshot(
+                infer.snapshot_version,
+                snapshot_date,
+                {"IF": infer.get_data_version(dbapi, "IF", snapshot_date)},
+                {"IF": {}})
+            infer.snapshot_store.put(expected)
+            self.assertEqual(snapshot_date, infer.restore_snapshot().date)
+
+            # the varieties changed
+            expected.states = {"IF": {}, "IC": {}}
+            self.assertEqual("the varieties changed",
+                             infer.get_stale_reason(expected))
+            expected.states = {"IF": {}}
+
+            # no new bar or too old
+            expected.date = trading_date
+            self.assertIsNotNone(infer.get_stale_reason(expected))
+            expected.date = datetime.date(2024, 1, 2)
+            self.assertIsNotNone(infer.get_stale_reason(expected))
+            expected.date = snapshot_date
+
+            # the data was revised
+            create_continuous_contract(dbapi, datetime.datetime(2025, 6, 25))
+            self.assertEqual("the data of IF was revised",
+                             infer.get_stale_reason(expected))
+            expected.data_versions["IF"] = infer.get_data_version(
+                dbapi, "IF", snapshot_date)
+            self.assertIsNone(infer.get_stale_reason(expected))
+
+            # the contract rolled after the snapshot
+            create_continuous_contract(dbapi,
+                                       datetime.datetime(2025, 7, 1),
+                                       adjust_factor=1.1)
+            self.assertEqual("the contract of IF rolled",
+                             infer.get_stale_reason(expected))
+
+    def test_restore_snapshot_missing_bar(self):
+        """test the snapshot is stale without the bar of the next day"""
+        trading_date = datetime.date(2025, 6, 30)
+        snapshot_date = datetime.date(2025, 6, 26)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            conf = munch.Munch(
+                db=munch.Munch(drivername=api.SQLITE_DRIVERNAME,
+                               database=os.path.join(tmp_dir, "db")),
+                source=types.AKSHARE,
+                country=types.CN,
+                whitelist=["IF"],
+                snapshot=munch.Munch(directory=tmp_dir))
+            api.DBManager(conf.db).create_all()
+            dbapi = api.DBAPI(conf.db)
+            # IF is suspended on 2025-06-27
+            for day in (26, 30):
+                create_continuous_contract(dbapi,
+                                           datetime.datetime(2025, 6, day))
+
+            infer = inference.Inference(conf=conf, trading_date=trading_date)
+            expected = snapshot.Snapshot(
+                infer.snapshot_version,
+                snapshot_date,
+                {"IF": infer.get_data_version(dbapi, "IF", snapshot_date)},
+                {"IF": {}})
+            self.assertEqual("no bar of IF on 2025-06-27",
+                             infer.get_stale_reason(expected))
+
+            infer.snapshot_store.put(expected)
+            self.assertIsNone(infer.restore_snapshot())
+
+            create_continuous_contract(dbapi, datetime.datetime(2025, 6, 27))
+            self.assertIsNone(infer.get_stale_reason(expected))
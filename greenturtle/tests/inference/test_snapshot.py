@@ -0,0 +1,130 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for snapshot.py"""
+
+import datetime
+import os
+import tempfile
+import unittest
+
+import munch
+
+from greenturtle.db import api
+from greenturtle.inference import snapshot
+from greenturtle.stragety import ema
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+STATES = {
+    "IF": {
+        "atr": {"value": 1.5, "close": 3900.0},
+        "highest": {"window": [3800.0, 3900.0]},
+    },
+}
+
+
+def get_snapshot(version="version"):
+    """get the snapshot for testing."""
+    return snapshot.Snapshot(version,
+                             datetime.date(2025, 6, 27),
+                             {"IF": "1:2025-06-27"},
+                             STATES)
+
+
+class TestSnapshot(unittest.TestCase):
+    """unittest for the snapshot and the stores"""
+
+    def assert_snapshot_equal(self, expected, actual):
+        """assert the snapshots are the same."""
+        self.assertEqual(expected.version, actual.version)
+        self.assertEqual(expected.date, actual.date)
+        self.assertEqual(expected.data_versions, actual.data_versions)
+        self.assertEqual(expected.states, actual.states)
+
+    def test_get_snapshot_version(self):
+        """test the version changes with the strategy and parameters"""
+        params = {"fast_period": 10, "slow_period": 100}
+        version = snapshot.get_snapshot_version(ema.EMA, params)
+
+        self.assertEqual(64, len(version))
+        self.assertEqual(version,
+                         snapshot.get_snapshot_version(ema.EMA, dict(params)))
+        self.assertNotEqual(
+            version,
+            snapshot.get_snapshot_version(ema.EMAEnhanced, params))
+        self.assertNotEqual(
+            version,
+            snapshot.get_snapshot_version(ema.EMA, {"fast_period": 10}))
+
+    def test_dumps_and_loads(self):
+        """test dump and load the snapshot"""
+        expected = get_snapshot()
+        actual = snapshot.Snapshot.loads(expected.dumps())
+        self.assert_snapshot_equal(expected, actual)
+
+    def test_local_store(self):
+        """test put and get the snapshot in the local directory"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = snapshot.LocalSnapshotStore(tmp_dir)
+            self.assertIsNone(store.get("version"))
+
+            expected = get_snapshot()
+            store.put(expected)
+            self.assert_snapshot_equal(expected, store.get("version"))
+            self.assertEqual(["version.json"], os.listdir(tmp_dir))
+
+            # the broken snapshot is ignored
+            with open(store.get_path("broken"), "w", encoding="utf-8") as f:
+                f.write("{")
+            self.assertIsNone(store.get("broken"))
+
+    def test_db_store(self):
+        """test put and get the snapshot in the database"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_conf = munch.Munch(drivername=api.SQLITE_DRIVERNAME,
+                                  database=os.path.join(tmp_dir, "db"))
+            api.DBManager(db_conf).create_all()
+            store = snapshot.DBSnapshotStore(db_conf)
+            self.assertIsNone(store.get("version"))
+
+            expected = get_snapshot()
+            store.put(expected)
+            self.assert_snapshot_equal(expected, store.get("version"))
+
+            # overwrite the snapshot of the same version
+            expected.date = datetime.date(2025, 6, 30)
+            store.put(expected)
+            self.assert_snapshot_equal(expected, store.get("version"))
+
+    def test_get_snapshot_store(self):
+        """test get the snapshot store by config"""
+        self.assertIsNone(snapshot.get_snapshot_store(None))
+        self.assertIsNone(snapshot.get_snapshot_store(munch.Munch()))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            conf = munch.Munch(snapshot=munch.Munch(directory=tmp_dir))
+            self.assertIsInstance(snapshot.get_snapshot_store(conf),
+                                  snapshot.LocalSnapshotStore)
+
+            conf = munch.Munch(
+                db=munch.Munch(drivername=api.SQLITE_DRIVERNAME,
+                               database=os.path.join(tmp_dir, "db")),
+                snapshot=munch.Munch(db=True))
+            self.assertIsInstance(snapshot.get_snapshot_store(conf),
+                                  snapshot.DBSnapshotStore)
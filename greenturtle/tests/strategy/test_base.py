@@ -0,0 +1,136 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unit tests for stragety/base.py"""
+
+import datetime
+import unittest
+
+from greenturtle.backtesting import backtesting
+from greenturtle.constants import types
+from greenturtle.data import synthetic
+from greenturtle import exception
+from greenturtle.indicators import kernels
+from greenturtle.stragety import base
+from greenturtle.stragety import channel
+from greenturtle.stragety import ema
+from greenturtle.stragety import mim
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+class CheckedEMA(ema.EMA):
+    """EMA strategy which checks the snapshot with the positions."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checked = 0
+
+    def next(self):
+        positions = {self._get_name_from_position_key(k): p.size
+                     for k, p in self.getpositions().items() if p.size}
+        snapshot = self.get_position_snapshot()
+
+        assert snapshot.portfolios == positions
+        assert snapshot.long == {k for k, v in positions.items() if v > 0}
+        assert snapshot.short == {k for k, v in positions.items() if v < 0}
+        assert snapshot.hold == set(positions.keys())
+        if positions:
+            self.checked += 1
+
+        super().next()
+
+
+class TestBaseStrategy(unittest.TestCase):
+    """unit tests for BaseStrategy"""
+
+    def test_position_snapshot(self):
+        """test add the position to snapshot"""
+        snapshot = base.PositionSnapshot()
+        snapshot.add("a", 2)
+        snapshot.add("b", -1)
+        snapshot.add("c", 0)
+
+        self.assertEqual({"a", "b"}, snapshot.hold)
+        self.assertEqual({"a"}, snapshot.long)
+        self.assertEqual({"b"}, snapshot.short)
+        self.assertEqual({"a": 2, "b": -1}, snapshot.portfolios)
+
+    def test_snapshot_and_group_in_backtesting(self):
+        """test the snapshot and group index in the backtesting"""
+        market = synthetic.SyntheticMarket(n_varieties=6,
+                                           years=1,
+                                           bad_print_ratio=0)
+        varieties = market.get_varieties()
+
+        b = backtesting.BackTesting(cash=10000000, varieties=varieties)
+        for name in market.names:
+            b.add_data(market.get_feed(name), name)
+            b.set_default_commission_by_name(name)
+        b.add_strategy(CheckedEMA,
+                       varieties=varieties,
+                       group_risk_factors={k: 0.01 for k in varieties},
+                       slow_period=20,
+                       atr_period=20,
+                       allow_short=True)
+        strategy = b.run()[0]
+
+        self.assertGreater(strategy.checked, 0)
+        # pylint: disable=protected-access
+        for name in market.names:
+            self.assertEqual(market.get_group(name),
+                             strategy._get_group_by_name(name))
+        self.assertIsNone(strategy._get_group_by_name("unknown"))
+
+    def test_inference_skip_warmup_validation(self):
+        """test the bad prints in the warm up bars do not abort inference"""
+        market = synthetic.SyntheticMarket(n_varieties=1,
+                                           years=1,
+                                           bad_print_ratio=0.05)
+        name = market.names[0]
+        dates = market.get_arrays(name)[types.DATETIME]
+        trading_date = dates[-1].astype(datetime.datetime).date()
+
+        def run(**kwargs):
+            varieties = market.get_varieties()
+            b = backtesting.BackTesting(varieties=varieties)
+            b.set_default_commission_by_name(name)
+            b.add_data(market.get_feed(name), name)
+            b.add_strategy(ema.EMA, atr_period=20, varieties=varieties,
+                           **kwargs)
+            return b.run()
+
+        self.assertRaises(exception.GreenTurtleBaseException, run)
+        run(inference=True, trading_date=trading_date)
+
+    def test_get_warmup_bars(self):
+        """test the warm up bars by the indicator periods"""
+        tolerance = base.WARMUP_TOLERANCE
+        self.assertEqual(kernels.get_atr_convergence_bars(100, tolerance),
+                         base.BaseStrategy.get_warmup_bars())
+        self.assertEqual(kernels.get_ema_convergence_bars(300, tolerance),
+                         ema.EMA.get_warmup_bars(slow_period=300,
+                                                 atr_period=20))
+        self.assertEqual(600,
+                         ema.EMAEnhanced.get_warmup_bars(channel_period=600,
+                                                         risk_factor=0.1))
+        self.assertEqual(51, channel.DonchianChannel.get_warmup_bars(
+            atr_period=2))
+        self.assertEqual(kernels.get_ema_convergence_bars(300, tolerance),
+                         mim.MIMStrategy.get_warmup_bars(period=300,
+                                                         atr_period=20))
@@ -0,0 +1,142 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unit tests for stragety/sizing.py"""
+
+import unittest
+
+import numpy as np
+
+from greenturtle.stragety import sizing
+
+
+def get_risk(size, atr, mult, value):
+    """the risk of one name, the same as the loop in BaseStrategy."""
+    return abs(size) * mult * atr / value
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+# pylint: disable=too-many-locals
+def adjust_by_loop(desired, current, atrs, mults, value, group_names,
+                   limits):
+    """
+    the reference implementation with the dicts, which adjusts the names one
+    by one like the former BaseStrategy.adjust_portfolio_by_group.
+    """
+    adjusted = dict(desired)
+    group_risks = {}
+    for name, size in desired.items():
+        group = group_names[name]
+        risk = get_risk(size, atrs[name], mults[name], value)
+        group_risks[group] = group_risks[group] + risk \
+            if group in group_risks else risk
+
+    adjust_risks = {}
+    for name, size in desired.items():
+        group = group_names[name]
+        if group_risks[group] > limits[group]:
+            size = int(size * limits[group] / group_risks[group])
+        adjusted[name] = size
+        risk = get_risk(size, atrs[name], mults[name], value)
+        adjust_risks[group] = adjust_risks[group] + risk \
+            if group in adjust_risks else risk
+
+    candidates = [n for n, s in current.items() if n in desired and s != 0]
+    for names in (candidates, list(desired)):
+        for name in names:
+            if desired[name] == 0 or adjusted[name] != 0:
+                continue
+            size = 1 if desired[name] > 0 else -1
+            risk = get_risk(size, atrs[name], mults[name], value)
+            group = group_names[name]
+            if risk + adjust_risks[group] > limits[group]:
+                continue
+            adjust_risks[group] += risk
+            adjusted[name] = size
+
+    return adjusted
+
+
+class TestSizing(unittest.TestCase):
+    """unit tests for the sizing functions"""
+
+    def test_get_membership(self):
+        """test the membership matrix"""
+        membership = sizing.get_membership(["a", "b", "c"],
+                                           ["x", "y"],
+                                           {"a": "y", "b": "x"})
+        np.testing.assert_array_equal([[False, True, False],
+                                       [True, False, False]],
+                                      membership)
+
+    def test_compute_sizes_by_atr(self):
+        """test the sizes by atr"""
+        sizes = sizing.compute_sizes_by_atr(0.01,
+                                            100000,
+                                            np.array([3.0, 0, np.nan]),
+                                            np.array([10, 10, 10]))
+        np.testing.assert_array_equal([33, 0, 0], sizes)
+
+    def test_get_group_ranks(self):
+        """test the rank within the group"""
+        ranks = sizing.get_group_ranks(np.array([1, 0, 1, 1, 0]))
+        np.testing.assert_array_equal([0, 0, 1, 2, 1], ranks)
+
+    def test_adjust_sizes_by_group(self):
+        """test the adjusted sizes are the same as the loop"""
+        rng = np.random.default_rng(0)
+        refined = 0
+        for _ in range(300):
+            n, n_groups = int(rng.integers(1, 12)), int(rng.integers(1, 4))
+            names = [f"v{i}" for i in range(n)]
+            groups = [f"g{i}" for i in range(n_groups)]
+            group_names = {k: groups[int(rng.integers(n_groups))]
+                           for k in names}
+            atrs = rng.uniform(0.1, 50, n)
+            mults = rng.choice([1, 5, 10, 300], n).astype(float)
+            value = float(rng.uniform(1e4, 1e6))
+            limits = rng.uniform(0.0005, 0.02, n_groups)
+
+            desired = {k: int(rng.integers(-30, 30)) for k in names
+                       if rng.random() < 0.8}
+            current = {k: int(rng.integers(-5, 5)) or 1 for k in names
+                       if rng.random() < 0.5}
+            current = dict(reversed(list(current.items())))
+
+            expected = adjust_by_loop(
+                desired, current,
+                dict(zip(names, atrs)), dict(zip(names, mults)), value,
+                group_names, dict(zip(groups, limits)))
+
+            index = {k: i for i, k in enumerate(names)}
+            desired_array = np.zeros(n)
+            current_array = np.zeros(n)
+            for k, v in desired.items():
+                desired_array[index[k]] = v
+            for k, v in current.items():
+                current_array[index[k]] = v
+
+            adjusted = sizing.adjust_sizes_by_group(
+                desired_array, current_array, atrs, mults, value,
+                sizing.get_membership(names, groups, group_names), limits,
+                current_order=[index[k] for k in current])
+
+            self.assertEqual(expected,
+                             {k: int(adjusted[index[k]]) for k in desired})
+            refined += sum(1 for k in desired
+                           if abs(expected[k]) == 1 and abs(desired[k]) > 1)
+
+        # the one lot refinement is covered
+        self.assertGreater(refined, 0)
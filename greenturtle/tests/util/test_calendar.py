@@ -18,10 +18,22 @@
 import datetime
 import unittest
 
+import chinese_calendar
+import numpy as np
+
 from greenturtle.util import calendar
 from greenturtle import exception
 
 
+def reference_is_cn_trading_day(date):
+    """check trading day day by day as before"""
+    if chinese_calendar.is_holiday(date):
+        return False
+    if date.isoweekday() >= 6:
+        return False
+    return date not in calendar.SPECIAL_DATES
+
+
 class TestCalendar(unittest.TestCase):
     """unit tests for calendar.py"""
 
@@ -98,3 +110,80 @@ class TestCalendar(unittest.TestCase):
         actual = calendar.get_cn_next_trading_day(date)
         expect = datetime.date(2025, 3, 10)
         self.assertEqual(expect, actual)
+
+    def test_same_as_reference(self):
+        """test the trading days are the same as checking day by day"""
+        expected = []
+        date = calendar.START_DATE
+        while date <= calendar.END_DATE:
+            if reference_is_cn_trading_day(date):
+                expected.append(date)
+            date += datetime.timedelta(days=1)
+
+        actual = calendar.get_cn_trading_days(calendar.START_DATE,
+                                              calendar.END_DATE)
+        self.assertEqual(expected, actual)
+
+    def test_boundary(self):
+        """test the last and next trading day near the boundary"""
+        self.assertRaises(exception.ValidateTradingDayError,
+                          calendar.get_cn_last_trading_day,
+                          calendar.START_DATE)
+        self.assertRaises(exception.ValidateTradingDayError,
+                          calendar.get_cn_next_trading_day,
+                          calendar.END_DATE)
+        # no trading day in 2004 before 2004-01-02
+        self.assertRaises(exception.ValidateTradingDayError,
+                          calendar.get_cn_last_trading_day,
+                          datetime.date(2004, 1, 2))
+        self.assertEqual(datetime.date(2025, 12, 30),
+                         calendar.get_cn_last_trading_day(
+                             datetime.date(2025, 12, 31)))
+
+    def test_offset(self):
+        """test offset by n trading days"""
+        cal = calendar.get_cn_calendar()
+        friday = datetime.date(2025, 3, 7)
+        saturday = datetime.date(2025, 3, 8)
+
+        self.assertEqual(friday, cal.offset(friday, 0))
+        self.assertEqual(datetime.date(2025, 3, 10), cal.offset(friday, 1))
+        self.assertEqual(datetime.date(2025, 3, 10), cal.offset(saturday, 1))
+        self.assertEqual(friday, cal.offset(saturday, -1))
+        # before the spring festival
+        self.assertEqual(datetime.date(2025, 2, 5),
+                         cal.offset(datetime.date(2025, 1, 27), 1))
+        self.assertRaises(exception.TradingDayNotFoundError,
+                          cal.offset, saturday, 0)
+        self.assertRaises(exception.ValidateTradingDayError,
+                          cal.offset, friday, 10000)
+        self.assertEqual(3, cal.count(friday, datetime.date(2025, 3, 11)))
+
+    def test_batch_queries(self):
+        """test the batch queries over the array of dates"""
+        cal = calendar.get_cn_calendar()
+        dates = [datetime.date(2025, 3, 7), datetime.date(2025, 3, 8)]
+
+        self.assertEqual([True, False], list(cal.is_trading_days(dates)))
+        np.testing.assert_array_equal(
+            np.array(["2025-03-06", "2025-03-07"], dtype="datetime64[D]"),
+            cal.get_last_trading_days(dates))
+        np.testing.assert_array_equal(
+            np.array(["2025-03-10", "2025-03-10"], dtype="datetime64[D]"),
+            cal.get_next_trading_days(np.array(dates,
+                                               dtype="datetime64[D]")))
+        self.assertRaises(exception.ValidateTradingDayError,
+                          cal.is_trading_days,
+                          [datetime.date(2026, 1, 1)])
+
+    def test_get_cn_start_date_by_bars(self):
+        """test the start date covers the bars trading days"""
+        date = datetime.date(2025, 6, 30)
+        start_date = calendar.get_cn_start_date_by_bars(date, 300)
+        cal = calendar.get_cn_calendar()
+        self.assertEqual(301, cal.count(start_date, date))
+
+        # estimated by the weekdays out of the calendar range
+        date = datetime.date(2026, 10, 19)
+        start_date = calendar.get_cn_start_date_by_bars(date, 100)
+        self.assertEqual(datetime.date(2026, 5, 18), start_date)
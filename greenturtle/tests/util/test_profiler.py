@@ -0,0 +1,178 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""unittest for profiler module"""
+
+import json
+import os
+import pstats
+import tempfile
+import tracemalloc
+import unittest
+
+import munch
+
+from greenturtle.backtesting import backtesting
+from greenturtle.backtesting import sweep
+from greenturtle.constants import varieties
+from greenturtle.data.datafeed import mock
+from greenturtle.stragety import ema
+from greenturtle.tests.backtesting import test_sweep
+from greenturtle.util.logging import logging
+from greenturtle.util import profiler
+
+
+logger = logging.get_logger()
+logger.disabled = True
+
+
+def allocate(size):
+    """allocate the bytes and release them."""
+    return len(bytearray(size))
+
+
+class TestProfiler(unittest.TestCase):
+    """unittest for profiler module"""
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_phase_without_profiling(self):
+        """test the phase does nothing if not profiling"""
+        self.assertIsNone(profiler.get_profiler())
+        with profiler.phase("noop"):
+            pass
+        with profiler.profiling(None, "noop") as p:
+            self.assertIsNone(p)
+
+        self.assertEqual([], os.listdir(self.tmp.name))
+
+    def test_profiling(self):
+        """test the phases are recorded and dumped"""
+        with profiler.profiling(self.tmp.name, "run") as p:
+            self.assertIs(p, profiler.get_profiler())
+            for _ in range(2):
+                with profiler.phase("outer"):
+                    with profiler.phase("inner"):
+                        allocate(1024)
+
+            # the nested run is recorded into the outer one
+            with profiler.profiling(self.tmp.name, "nested") as nested:
+                self.assertIs(p, nested)
+
+        self.assertIsNone(profiler.get_profiler())
+        self.assertEqual(2, p.phases["outer"]["count"])
+        self.assertEqual(2, p.phases["inner"]["count"])
+        self.assertEqual(1, p.phases["run"]["count"])
+        self.assertGreaterEqual(p.phases["outer"]["wall"],
+                                p.phases["inner"]["wall"])
+        self.assertNotIn("peak_mb", p.phases["outer"])
+
+        files = sorted(os.listdir(self.tmp.name))
+        self.assertEqual(2, len(files))
+        prof_path, report_path = [os.path.join(self.tmp.name, f)
+                                  for f in sorted(files, reverse=True)]
+        self.assertTrue(prof_path.endswith(".prof"))
+
+        with open(report_path, encoding="utf-8") as f:
+            report = json.load(f)
+        self.assertEqual("run", report["name"])
+        self.assertEqual(prof_path, report["prof"])
+        self.assertEqual(p.phases["outer"]["count"],
+                         report["phases"]["outer"]["count"])
+
+        stats = pstats.Stats(prof_path)
+        self.assertTrue(any(func[2] == "allocate" for func in stats.stats))
+
+    def test_trace_memory(self):
+        """test the peak memory of the nested phases"""
+        size = 16 * 1024 * 1024
+        with profiler.profiling(self.tmp.name, "run", trace_memory=True) as p:
+            with profiler.phase("outer"):
+                with profiler.phase("inner"):
+                    allocate(size)
+                with profiler.phase("small"):
+                    allocate(1024)
+
+        self.assertFalse(tracemalloc.is_tracing())
+        for name in ("outer", "inner"):
+            self.assertGreaterEqual(p.phases[name]["peak_mb"], 16)
+        self.assertLess(p.phases["small"]["peak_mb"], 1)
+        self.assertLess(p.phases["outer"]["allocated_mb"], 1)
+        self.assertTrue(p.phases["inner"]["top_allocations"])
+
+    def test_get_options(self):
+        """test get the options by the config"""
+        self.assertEqual({"output_dir": None},
+                         profiler.get_options(munch.Munch()))
+
+        conf = munch.Munch(profiler=munch.Munch(output_dir=self.tmp.name))
+        self.assertEqual({"output_dir": self.tmp.name,
+                          "trace_memory": False},
+                         profiler.get_options(conf))
+
+    def test_backtesting_phases(self):
+        """test the phases of do_backtesting"""
+        name = "mock"
+        b = backtesting.BackTesting(varieties=varieties.US_VARIETIES)
+        b.add_data(mock.get_mock_datafeed(name), name)
+        b.add_strategy(ema.EMA, risk_factor=0.1)
+
+        with profiler.profiling(self.tmp.name, "backtesting") as p:
+            b.do_backtesting()
+
+        self.assertIn("backtesting.run", p.phases)
+        for _, step in backtesting.ANALYSIS_STEPS:
+            self.assertEqual(1, p.phases[f"backtesting.{step}"]["count"])
+
+    def test_backtesting_profiler_dir(self):
+        """test the backtesting is profiled by the profiler directory"""
+        name = "mock"
+        b = backtesting.BackTesting(varieties=varieties.US_VARIETIES,
+                                    profiler_dir=self.tmp.name)
+        b.add_data(mock.get_mock_datafeed(name), name)
+        b.add_strategy(ema.EMA, risk_factor=0.1)
+        b.do_backtesting()
+
+        self.assertIsNone(profiler.get_profiler())
+        files = sorted(os.listdir(self.tmp.name))
+        self.assertEqual([".json", ".prof"],
+                         [os.path.splitext(f)[1] for f in files])
+
+        with open(os.path.join(self.tmp.name, files[0]),
+                  encoding="utf-8") as f:
+            report = json.load(f)
+        self.assertEqual("backtesting", report["name"])
+        self.assertIn("backtesting.run", report["phases"])
+        self.assertIn("backtesting.analysis_return", report["phases"])
+
+    def test_sweep_profiler_dir(self):
+        """test every sample of the sweep is profiled"""
+        samples = [{"fast_period": 5}, {"fast_period": 10}]
+        s = sweep.Sweep(ema.EMA,
+                        samples,
+                        test_sweep.load_synthetic_arrays,
+                        strategy_kwargs={"atr_period": 20},
+                        varieties=test_sweep.get_market().get_varieties(),
+                        processes=1,
+                        profiler_dir=self.tmp.name)
+        s.run()
+
+        files = os.listdir(self.tmp.name)
+        self.assertEqual(2, len([f for f in files if f.endswith(".prof")]))
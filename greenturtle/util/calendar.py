@@ -22,15 +22,21 @@ reinvent the calendar wheel and maintain it in the project.
 """
 
 import datetime
+import functools
+import math
 
 import chinese_calendar
+import numpy as np
 
 from greenturtle import exception
 
 
 START_DATE = datetime.date(year=2004, month=1, day=1)
 END_DATE = datetime.date(year=2025, month=12, day=31)
-RETRY = 30
+
+# the ratio of the holidays to the trading days, to estimate the trading
+# days by the weekdays out of the range
+HOLIDAY_RATIO = 0.1
 
 # special days
 SPECIAL_DATES = [
@@ -54,81 +60,198 @@ def validate_cn_date(date):
         raise exception.ValidateTradingDayError
 
 
-def is_cn_trading_day(date):
+class TradingCalendar:
+    """
+    trading calendar backed by the sorted trading day array.
+
+    The trading days are computed once, then all the queries are answered
+    by binary search or vectorized operations, the batch queries accept
+    the array of dates and return numpy datetime64[D] array.
+    """
+
+    def __init__(self, trading_days, start_date, end_date):
+        self.trading_days = np.sort(
+            np.asarray(trading_days, dtype="datetime64[D]"))
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def validate(self, date):
+        """validate the date is in the range of the calendar."""
+        if isinstance(date, datetime.datetime):
+            date = date.date()
+
+        if date < self.start_date or date > self.end_date:
+            raise exception.ValidateTradingDayError
+
+    def validate_array(self, dates):
+        """validate all the dates are in the range of the calendar."""
+        dates = to_datetime64_array(dates)
+        if len(dates) > 0 and (
+                dates.min() < np.datetime64(self.start_date, "D") or
+                dates.max() > np.datetime64(self.end_date, "D")):
+            raise exception.ValidateTradingDayError
+
+        return dates
+
+    def _get_index(self, date, side="left"):
+        """get the insert position of the date in the trading days."""
+        return int(np.searchsorted(self.trading_days,
+                                   np.datetime64(date, "D"),
+                                   side=side))
+
+    def _get_date(self, index):
+        """get the trading day by index as datetime.date."""
+        if index < 0 or index >= len(self.trading_days):
+            raise exception.ValidateTradingDayError
+
+        return self.trading_days[index].astype(datetime.date)
+
+    def is_trading_day(self, date):
+        """check if the date is a trading day."""
+        self.validate(date)
+        index = self._get_index(date)
+        return bool(index < len(self.trading_days) and
+                    self.trading_days[index] == np.datetime64(date, "D"))
+
+    def is_trading_days(self, dates):
+        """check if every date in the array is a trading day."""
+        dates = self.validate_array(dates)
+        indexes = np.searchsorted(self.trading_days, dates)
+        indexes = np.minimum(indexes, len(self.trading_days) - 1)
+        return self.trading_days[indexes] == dates
+
+    def get_trading_days(self, start_date, end_date):
+        """get the trading days between start_date and end_date."""
+        if start_date > end_date:
+            raise exception.ValidateTradingDayError
+
+        self.validate(start_date)
+        self.validate(end_date)
+
+        begin = self._get_index(start_date, side="left")
+        end = self._get_index(end_date, side="right")
+        return self.trading_days[begin:end].astype(datetime.date).tolist()
+
+    def get_last_trading_day(self, date):
+        """get the last trading day before the date."""
+        self.validate(date - datetime.timedelta(days=1))
+        return self._get_date(self._get_index(date, side="left") - 1)
+
+    def get_next_trading_day(self, date):
+        """get the next trading day after the date."""
+        self.validate(date + datetime.timedelta(days=1))
+        return self._get_date(self._get_index(date, side="right"))
+
+    def get_last_trading_days(self, dates):
+        """get the last trading day before every date in the array."""
+        dates = self.validate_array(dates)
+        indexes = np.searchsorted(self.trading_days, dates, side="left") - 1
+        if (indexes < 0).any():
+            raise exception.ValidateTradingDayError
+
+        return self.trading_days[indexes]
+
+    def get_next_trading_days(self, dates):
+        """get the next trading day after every date in the array."""
+        dates = self.validate_array(dates)
+        indexes = np.searchsorted(self.trading_days, dates, side="right")
+        if (indexes >= len(self.trading_days)).any():
+            raise exception.ValidateTradingDayError
+
+        return self.trading_days[indexes]
+
+    def offset(self, date, n):
+        """
+        get the trading day n trading days after the date, or before the
+        date if n is negative. If the date is not a trading day, it counts
+        from the last trading day for positive n and the next trading day
+        for negative n, and raise error for zero.
+        """
+        self.validate(date)
+        index = self._get_index(date, side="right") - 1
+        is_trading_day = index >= 0 and \
+            self.trading_days[index] == np.datetime64(date, "D")
+
+        if not is_trading_day:
+            if n == 0:
+                raise exception.TradingDayNotFoundError
+            if n < 0:
+                index += 1
+
+        return self._get_date(index + n)
+
+    def count(self, start_date, end_date):
+        """count the trading days between start_date and end_date."""
+        return max(self._get_index(end_date, side="right") -
+                   self._get_index(start_date, side="left"), 0)
+
+
+def to_datetime64_array(dates):
+    """convert the dates to numpy datetime64[D] array."""
+    dates = np.asarray(dates)
+    if dates.dtype.kind == "O":
+        dates = np.array([np.datetime64(d, "D") for d in dates.ravel()],
+                         dtype="datetime64[D]").reshape(dates.shape)
+
+    return dates.astype("datetime64[D]")
+
+
+@functools.lru_cache(maxsize=1)
+def get_cn_calendar():
     """
-    check if it is a china trading day, a day is a trading day only if
+    get the china trading calendar, it's built once per process. A day is
+    a trading day only if
     - it is a working day
     - it is weekday
     - exclude some special days
     """
-    validate_cn_date(date)
+    holidays = chinese_calendar.get_holidays(START_DATE,
+                                             END_DATE,
+                                             include_weekends=False)
+    busdaycal = np.busdaycalendar(weekmask="1111100",
+                                  holidays=list(holidays) + SPECIAL_DATES)
 
-    if chinese_calendar.is_holiday(date):
-        return False
+    days = np.arange(np.datetime64(START_DATE, "D"),
+                     np.datetime64(END_DATE, "D") + 1)
+    trading_days = days[np.is_busday(days, busdaycal=busdaycal)]
 
-    if date.isoweekday() >= 6:
-        return False
+    return TradingCalendar(trading_days, START_DATE, END_DATE)
 
-    if date in SPECIAL_DATES:
-        return False
 
-    return True
+def is_cn_trading_day(date):
+    """check if it is a china trading day."""
+    return get_cn_calendar().is_trading_day(date)
 
 
 def get_cn_trading_days(start_date, end_date):
     """get the china trading days between start_date and end_date."""
-
-    if start_date > end_date:
-        raise exception.ValidateTradingDayError
-
-    validate_cn_date(start_date)
-    validate_cn_date(end_date)
-
-    trading_days = []
-    date = start_date
-
-    while date <= end_date:
-        if is_cn_trading_day(date):
-            trading_days.append(date)
-        date += datetime.timedelta(days=1)
-
-    return trading_days
+    return get_cn_calendar().get_trading_days(start_date, end_date)
 
 
 def get_cn_last_trading_day(date):
     """get cn last trading day before date"""
-    # we must find the trading date within 30 days
-    retry = RETRY
-    date += datetime.timedelta(days=-1)
-
-    while retry > 0:
-        validate_cn_date(date)
-
-        if is_cn_trading_day(date):
-            return date
-
-        date += datetime.timedelta(days=-1)
-        retry = retry - 1
-
-    raise exception.TradingDayNotFoundError
+    return get_cn_calendar().get_last_trading_day(date)
 
 
 def get_cn_next_trading_day(date):
     """get cn next trading day after the date"""
-    # we must find the trading date within 30 days
-    retry = RETRY
-    date += datetime.timedelta(days=1)
-
-    while retry > 0:
-        validate_cn_date(date)
-
-        if is_cn_trading_day(date):
-            return date
+    return get_cn_calendar().get_next_trading_day(date)
 
-        date += datetime.timedelta(days=1)
-        retry = retry - 1
 
-    raise exception.TradingDayNotFoundError
+def get_cn_start_date_by_bars(date, bars):
+    """
+    get the start date of the window which covers the bars trading days
+    until the date. If it is out of the calendar range, it is estimated by
+    the weekdays with a margin for the holidays.
+    """
+    try:
+        return get_cn_calendar().offset(date, -bars)
+    except exception.ValidateTradingDayError:
+        weekdays = bars + math.ceil(bars * HOLIDAY_RATIO)
+        start_date = np.busday_offset(np.datetime64(date, "D"),
+                                      -weekdays,
+                                      roll="backward")
+        return start_date.astype(datetime.date)
 
 
 def decision_regard_date():
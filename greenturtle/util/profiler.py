@@ -0,0 +1,220 @@
+# Copyright (c) 2025 GreenTurtle
+# All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+opt-in profiler of the named phases.
+
+The phases are wrapped by `with profiler.phase(name)`, which does nothing
+unless a run is profiled by `with profiler.profiling(output_dir, name)`.
+While profiling, the whole run is profiled by cProfile and every phase
+records the count, the wall and cpu seconds, and with trace_memory, the
+allocated and peak memory by tracemalloc along with the top allocations
+when the phase finishes. When the run finishes, the .prof file of cProfile
+and the json report of the phases are written into the output directory,
+the .prof file could be viewed by pstats or snakeviz.
+
+The profiler is configured by
+
+    profiler:
+      output_dir: /var/lib/greenturtle/profile
+      trace_memory: false
+"""
+
+import contextlib
+import cProfile
+import datetime
+import json
+import os
+import time
+import tracemalloc
+
+from greenturtle.util.logging import logging
+
+
+logger = logging.get_logger()
+
+MB = 1024 * 1024
+
+# the number of the top allocations recorded per phase
+TOP = 10
+
+# the profiler of the current run, None if not profiling
+_profiler = None  # pylint: disable=invalid-name
+
+
+# pylint: disable=too-many-instance-attributes
+class Profiler:
+    """profiler of the phases within one run."""
+
+    def __init__(self, name, trace_memory=False, top=TOP):
+        self.name = name
+        self.trace_memory = trace_memory
+        self.top = top
+        self.phases = {}
+        self.started_at = None
+        self.finished_at = None
+
+        self._profile = cProfile.Profile()
+        self._stack = []
+        self._started_tracemalloc = False
+
+    def start(self):
+        """start profiling the run."""
+        self.started_at = datetime.datetime.now()
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._profile.enable()
+
+    def stop(self):
+        """stop profiling the run."""
+        self._profile.disable()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.finished_at = datetime.datetime.now()
+
+    def _update_peaks(self):
+        """
+        fold the peak since the last reset into the open phases, so that
+        the nested phase could reset the peak of tracemalloc.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in self._stack:
+            frame["peak"] = max(frame["peak"], peak)
+
+        return current
+
+    def _get_top_allocations(self):
+        """get the top allocations by line."""
+        snapshot = tracemalloc.take_snapshot()
+        return [str(stat) for stat in snapshot.statistics("lineno")[:self.top]]
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """record the wall, cpu time and the memory of the phase."""
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        frame = {"size": 0, "peak": 0}
+        if tracing:
+            frame["size"] = frame["peak"] = self._update_peaks()
+            tracemalloc.reset_peak()
+        self._stack.append(frame)
+
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            self._stack.pop()
+
+            record = self.phases.setdefault(
+                name, {"count": 0, "wall": 0.0, "cpu": 0.0})
+            record["count"] += 1
+            record["wall"] += wall
+            record["cpu"] += cpu
+
+            if tracing:
+                self._stack.append(frame)
+                current = self._update_peaks()
+                self._stack.pop()
+                record["allocated_mb"] = (current - frame["size"]) / MB
+                record["peak_mb"] = max(record.get("peak_mb", 0.0),
+                                        (frame["peak"] - frame["size"]) / MB)
+                record["top_allocations"] = self._get_top_allocations()
+
+    def get_report(self):
+        """get the report of the run."""
+        return {
+            "name": self.name,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat(),
+            "phases": self.phases,
+        }
+
+    def dump(self, output_dir):
+        """
+        dump the .prof file and the json report into the output directory,
+        return the path of the .prof file and the report.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        timestamp = self.started_at.strftime("%Y%m%d-%H%M%S-%f")
+        # the pid avoids the conflicts of the runs in the pool workers
+        prefix = os.path.join(output_dir,
+                              f"{self.name}-{timestamp}-{os.getpid()}")
+
+        prof_path = f"{prefix}.prof"
+        self._profile.dump_stats(prof_path)
+
+        report_path = f"{prefix}.json"
+        report = self.get_report()
+        report["prof"] = prof_path
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        for name, record in self.phases.items():
+            logger.info("phase %s: count %d, wall %.3fs, cpu %.3fs",
+                        name, record["count"], record["wall"], record["cpu"])
+        logger.info("save the profile of %s to %s", self.name, prof_path)
+
+        return prof_path, report_path
+
+
+def get_profiler():
+    """get the profiler of the current run, None if not profiling."""
+    return _profiler
+
+
+def phase(name):
+    """the phase of the current run, it does nothing if not profiling."""
+    if _profiler is None:
+        return contextlib.nullcontext()
+    return _profiler.phase(name)
+
+
+@contextlib.contextmanager
+def profiling(output_dir, name, trace_memory=False):
+    """
+    profile the run and dump the results into the output directory when
+    finished. It does nothing if the output directory is None, and the
+    phases are recorded into the outer run if already profiling.
+    """
+    # pylint: disable=global-statement
+    global _profiler
+    if output_dir is None or _profiler is not None:
+        yield _profiler
+        return
+
+    _profiler = Profiler(name, trace_memory=trace_memory)
+    _profiler.start()
+    try:
+        with _profiler.phase(name):
+            yield _profiler
+    finally:
+        profiler, _profiler = _profiler, None
+        profiler.stop()
+        profiler.dump(output_dir)
+
+
+def get_options(conf):
+    """get the options of profiling by the config."""
+    profiler_conf = getattr(conf, "profiler", None)
+    if profiler_conf is None:
+        return {"output_dir": None}
+
+    return {
+        "output_dir": getattr(profiler_conf, "output_dir", None),
+        "trace_memory": bool(getattr(profiler_conf, "trace_memory", False)),
+    }
@@ -15,6 +15,9 @@
 
 """some utility functions"""
 
+import resource
+import sys
+
 from greenturtle.util.logging import logging
 
 
@@ -34,3 +37,15 @@ def logger_and_notifier(notifier, msg):
     """logger and notifier"""
     logger.debug(msg)
     notifier.send_message(msg)
+
+
+def get_peak_memory():
+    """
+    get the peak resident memory of the process in MB, which is the peak
+    over the lifetime of the process instead of the current one.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # the max rss is in bytes on macos and in KB on linux
+    if sys.platform == "darwin":
+        return peak / 1024 / 1024
+    return peak / 1024